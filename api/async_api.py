@@ -0,0 +1,322 @@
+# api/async_api.py
+"""
+Asyncio versions of the weather and currency clients.
+
+Meant for fan-out work (popular cities, favorites) where many requests
+can be in flight at once, so N cities cost about one round trip instead
+of N. Results have the same shape as WeatherAPI / CurrencyAPI and go
+through the same shared caches.
+
+Weather requests run on worker threads through WeatherAPI, so they get
+the hedged source (failover to the secondary provider, latency
+tracking), conditional requests and One Call like any other request.
+Exchange rates are fetched with httpx when it is installed (with HTTP/2
+multiplexing if the h2 package is present too), otherwise through
+CurrencyAPI on a worker thread.
+"""
+import asyncio
+from api import transport
+from api.scheduler import get_scheduler
+from api import currency_api
+from api.weather_api import WeatherAPI
+from api.currency_api import CurrencyAPI, BASE_CURRENCY
+from api.errors import APIError, NetworkError, ServerError, RateLimitError, BadResponseError
+from api.json_codec import decode_response
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - only needed so httpx can speak HTTP/2
+    HTTP2_AVAILABLE = httpx is not None
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Defaults - at most this many requests in flight per client
+MAX_CONCURRENCY = 8
+CONNECT_TIMEOUT = transport.CONNECT_TIMEOUT
+READ_TIMEOUT = transport.READ_TIMEOUT
+
+
+async def _claim(acquire, undo):
+    """
+    Run acquire() on a worker thread and return its result.
+
+    If the waiting task is cancelled, the thread still finishes; whatever
+    it was granted is handed back with undo(result) as soon as that happens.
+
+    Args:
+        acquire (callable): Blocking call that takes something (a slot, a probe)
+        undo (callable): Called with acquire()'s result to give it back
+    """
+    acquiring = asyncio.ensure_future(asyncio.to_thread(acquire))
+    try:
+        return await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        acquiring.add_done_callback(lambda future: _undo_abandoned(undo, future))
+        raise
+
+
+def _undo_abandoned(undo, future):
+    if not future.cancelled() and future.exception() is None:
+        undo(future.result())
+
+
+async def _in_thread(api, method, *args):
+    """
+    Call a sync client method on a worker thread.
+
+    The client's last_error is per thread, so it is copied back to the
+    event loop's thread along with the result.
+    """
+    def call():
+        return method(*args), api.last_error
+
+    result, api.last_error = await asyncio.to_thread(call)
+    return result
+
+
+class _AsyncClientBase:
+    """Shared httpx client handling and concurrency limit"""
+
+    def __init__(self, max_concurrency=MAX_CONCURRENCY, connect_timeout=CONNECT_TIMEOUT,
+                 read_timeout=READ_TIMEOUT):
+        """
+        Args:
+            max_concurrency (int): Maximum requests in flight at once
+            connect_timeout (float): Seconds to wait for a connection
+            read_timeout (float): Seconds to wait for a response
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _send(self, provider, url, params=None):
+        """
+        GET through the provider's circuit breaker and rate limiter.
+
+        Like api.transport.request(), 2xx and 4xx responses are returned
+        as-is and everything else raises.
+
+        Raises:
+            APIError: If the request was refused or the provider failed
+        """
+        # A probe granted to a task cancelled meanwhile is handed back
+        await _claim(lambda: transport.before_request(provider),
+                     lambda _: transport.cancel_request(provider))
+        scheduler = get_scheduler()
+        recorded = False
+        try:
+            priority = await _claim(scheduler.acquire, scheduler.release)
+            try:
+                response = await self._get_client().get(url, params=params)
+            finally:
+                scheduler.release(priority)
+            transport.record_outcome(provider, ok=response.status_code < 500)
+            recorded = True
+        except httpx.TransportError as e:
+            transport.record_outcome(provider, ok=False, network_error=True)
+            recorded = True
+            raise NetworkError(str(e), provider) from e
+        except httpx.HTTPError as e:
+            raise NetworkError(str(e), provider) from e
+        finally:
+            if not recorded:
+                # Decoding errors, redirect loops, cancellation... - free a half-open probe
+                transport.cancel_request(provider)
+
+        if response.status_code == 429:
+            raise RateLimitError("Server rate limit (429)", provider, retryable=True)
+        if response.status_code >= 500:
+            raise ServerError(f"HTTP {response.status_code}", provider)
+        return response
+
+    def _get_client(self):
+        """Create the httpx client on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(self._read_timeout, connect=self._connect_timeout),
+                limits=httpx.Limits(max_connections=self._max_concurrency,
+                                    max_keepalive_connections=self._max_concurrency),
+            )
+        return self._client
+
+
+class AsyncWeatherAPI(_AsyncClientBase):
+    """Async weather client returning the same data as WeatherAPI"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.api = WeatherAPI()
+
+    async def get_current_weather(self, city):
+        """
+        Get current weather for a city.
+
+        Args:
+            city (str): City name
+
+        Returns:
+            Observation: Current weather or None if error
+        """
+        return await self._get("weather", city)
+
+    async def get_forecast(self, city):
+        """
+        Get weather forecast for a city.
+
+        Args:
+            city (str): City name
+
+        Returns:
+            Forecast: Forecast or None if error
+        """
+        return await self._get("forecast", city)
+
+    async def get_many_current_weather(self, cities):
+        """
+        Get current weather for many cities concurrently.
+
+        Args:
+            cities (list): City names
+
+        Returns:
+            dict: City name -> Observation (None for failures)
+        """
+        results = await asyncio.gather(*(self.get_current_weather(city) for city in cities))
+        return dict(zip(cities, results))
+
+    async def _get(self, endpoint, city):
+        """Serve fresh data from cache, otherwise fetch within the concurrency limit"""
+        if not self.api.one_call:
+            found, data = self.api._lookup_fresh(endpoint, city)
+            if found:
+                return data
+
+        # Fetched through WeatherAPI on a worker thread, so the hedged source (failover,
+        # latency tracking), conditional requests, One Call and stale data all apply
+        method = self.api.get_current_weather if endpoint == "weather" else self.api.get_forecast
+        async with self._semaphore:
+            return await _in_thread(self.api, method, city)
+
+
+class AsyncCurrencyAPI(_AsyncClientBase):
+    """Async currency client returning the same data as CurrencyAPI"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.api = CurrencyAPI()
+
+    async def get_exchange_rate(self, from_currency, to_currency):
+        """
+        Get exchange rate between two currencies.
+
+        Args:
+            from_currency (str): Source currency code
+            to_currency (str): Target currency code
+
+        Returns:
+            float: Exchange rate or None if error
+        """
+        table = await self.get_rate_table()
+        if table and from_currency in table and to_currency in table:
+            return table.rate(from_currency, to_currency)
+
+        if table is None and httpx is not None and self.api.remote_enabled:
+            return None  # The table fetch failed and was reported - don't retry synchronously
+
+        return await _in_thread(self.api, self.api.get_exchange_rate, from_currency, to_currency)
+
+    async def convert_currency(self, amount, from_currency, to_currency):
+        """
+        Convert amount from one currency to another.
+
+        Returns:
+            dict: Same shape as CurrencyAPI.convert_currency, or None
+        """
+        rate = await self.get_exchange_rate(from_currency, to_currency)
+        if not rate:
+            return None
+
+        return {
+            'from_currency': from_currency,
+            'to_currency': to_currency,
+            'amount': amount,
+            'rate': rate,
+            'converted': round(amount * rate, 2)
+        }
+
+    async def get_rate_table(self):
+        """
+        Get the cross-rate table, fetching it if missing or expired.
+
+        Returns:
+            RateTable: Current table or None if unavailable
+        """
+        if self.api.rate_provider is not None:
+            # Local rates - nothing to fan out
+            return await _in_thread(self.api, self.api.get_rate_table)
+
+        table = self.api._lookup_fresh_table()
+        if table:
+            return table
+
+        async with self._semaphore:
+            if httpx is None:
+                return await _in_thread(self.api, self.api.get_rate_table)
+
+            self.api.last_error = None
+            try:
+                return await self._fetch_rate_table()
+            except APIError as e:
+                # Serve the expired table if we have one, like CurrencyAPI does
+                self.api._report(e, "exchange rates")
+                return currency_api._table
+
+    async def _fetch_rate_table(self):
+        """Fetch the /latest table with httpx and install it as the shared table"""
+        response = await self._send(currency_api.PROVIDER, f"{self.api.base_url}/latest/{BASE_CURRENCY}")
+        if response.is_error:
+            raise BadResponseError(f"HTTP {response.status_code}", currency_api.PROVIDER)
+
+        data = decode_response(response, currency_api.PROVIDER)
+        if data.get('result') != 'success':
+            raise BadResponseError(f"API Error: {data.get('error-type', 'Unknown error')}",
+                                   currency_api.PROVIDER)
+        return self.api._install_rate_table(data, response.headers.get("ETag"),
+                                            response.headers.get("Last-Modified"),
+                                            len(response.content))
+
+
+def fetch_many_current_weather(cities):
+    """
+    Fetch current weather for many cities from synchronous code.
+
+    Args:
+        cities (list): City names
+
+    Returns:
+        dict: City name -> Observation (None for failures)
+    """
+    async def _run():
+        async with AsyncWeatherAPI() as api:
+            return await api.get_many_current_weather(cities)
+
+    return asyncio.run(_run())
@@ -0,0 +1,182 @@
+# api/cache.py
+"""
+In-memory response cache shared by the API clients.
+
+Entries expire by TTL and are evicted least-recently-used once the
+cache grows past its memory budget. Expired entries are kept for a
+while longer so they can be served stale while a refresh runs.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_city(city):
+    """
+    Normalize a city name for use in cache keys.
+
+    "  new  york" and "New York" map to the same key, as do
+    "London, GB" and "london,gb".
+
+    Args:
+        city (str): City name as typed by the user
+
+    Returns:
+        str: Case-folded name with collapsed whitespace
+    """
+    return ",".join(" ".join(part.split()) for part in city.split(",")).casefold()
+
+
+class CacheEntry:
+    """A single cached response"""
+
+    __slots__ = ('value', 'size', 'fetched_at', 'expires_at', 'negative', 'etag', 'last_modified')
+
+    def __init__(self, value, size, ttl, negative=False, fetched_at=None, etag=None, last_modified=None):
+        self.value = value
+        self.size = size
+        self.fetched_at = fetched_at or time.time()
+        self.expires_at = self.fetched_at + ttl
+        self.negative = negative
+
+        # HTTP validators for conditional revalidation
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, now=None):
+        """Check if the entry is still within its TTL"""
+        return (now or time.time()) < self.expires_at
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache with a memory budget"""
+
+    def __init__(self, ttl=600, stale_ttl=3600, negative_ttl=60, max_bytes=2 * 1024 * 1024):
+        """
+        Args:
+            ttl (int): Seconds an entry is fresh
+            stale_ttl (int): Extra seconds an expired entry may be served stale
+            negative_ttl (int): Seconds a "not found" result is remembered
+            max_bytes (int): Memory budget (sum of response body sizes)
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Look up an entry.
+
+        Fresh and stale entries are returned (check entry.is_fresh()).
+        Entries past the stale window, and expired negative entries,
+        are dropped and count as a miss.
+
+        Args:
+            key (tuple): Cache key
+
+        Returns:
+            CacheEntry: The entry or None on a miss
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                limit = entry.expires_at if entry.negative else entry.expires_at + self.stale_ttl
+                if now >= limit:
+                    self._remove(key)
+                    entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def peek(self, key):
+        """
+        Look up an entry without touching LRU order or statistics.
+
+        Args:
+            key (tuple): Cache key
+
+        Returns:
+            CacheEntry: The entry (possibly expired) or None
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key, value, size, ttl=None, fetched_at=None, etag=None, last_modified=None):
+        """
+        Store a response.
+
+        Args:
+            key (tuple): Cache key
+            value: Decoded response
+            size (int): Approximate size in bytes (used for the budget)
+            ttl (int): Override the default TTL
+            fetched_at (float): When the data was fetched (defaults to now)
+            etag (str): ETag header of the response, if any
+            last_modified (str): Last-Modified header of the response, if any
+        """
+        self._store(key, CacheEntry(value, size, ttl or self.ttl, fetched_at=fetched_at,
+                                    etag=etag, last_modified=last_modified))
+
+    def put_negative(self, key):
+        """Remember that a resource does not exist (e.g. 404 city not found)"""
+        self._store(key, CacheEntry(None, 0, self.negative_ttl, negative=True))
+
+    def invalidate(self, key):
+        """Remove a single entry"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Entry count, bytes used, hits and misses
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    def _store(self, key, entry):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = entry
+            self._bytes += entry.size
+
+            # Evict least recently used entries until we fit the budget
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
@@ -0,0 +1,396 @@
+# api/city_index.py
+"""
+Offline city database for instant search suggestions.
+
+A list of cities (e.g. OpenWeatherMap's city.list.json) is compiled by
+scripts/build_city_index.py into one compact binary file that is
+memory-mapped at runtime: opening it reads nothing but the header, and
+lookups only touch the pages they need.
+
+Layout (little-endian):
+
+    header    magic, version, city count, table size, section offsets
+    records   one fixed-size RECORD per city, sorted by folded name
+    strings   folded name + display name + state of every city (UTF-8)
+    table     TABLE_ENTRY rows sorted by hash: a trigram or short prefix
+              -> a run of postings
+    postings  record numbers (uint32)
+
+Prefixes longer than SHORT_PREFIX are found by binary search over the
+sorted names. Shorter ones would match thousands of cities, so their
+best few (by population) are precomputed in the table. Misspellings are
+matched by shared trigrams.
+
+Without an index file (it is not in git; see the README) suggestions are
+simply unavailable and searching works as before.
+"""
+import heapq
+import math
+import mmap
+import os
+import struct
+import unicodedata
+import zlib
+from collections import Counter, defaultdict, namedtuple
+import config
+from api.geocoding import Location
+
+CITY_INDEX_FILE = getattr(config, 'CITY_INDEX_FILE', os.path.join("assets", "cities.idx"))
+
+MAGIC = b"CIDX"
+VERSION = 1
+
+# magic, version, city count, table entries, strings offset, table offset, postings offset
+HEADER = struct.Struct('<4sHxxIIIII')
+
+# id, strings offset, key/name/state length, lat, lon, country, weight
+RECORD = struct.Struct('<IIBBBxff2sH')
+
+# hash, first posting, posting count
+TABLE_ENTRY = struct.Struct('<III')
+
+POSTING = struct.Struct('<I')
+
+# Prefixes up to this many characters are precomputed...
+SHORT_PREFIX = 4
+
+# ...keeping this many cities each
+TOP_PER_PREFIX = 10
+
+# Cities matching a longer prefix that are looked at before ranking
+PREFIX_SCAN = 2000
+
+# Postings read per fuzzy lookup, rarest trigrams first (common ones like
+# "an$" say little and would take longest)
+MAX_POSTINGS = 5000
+
+# Lowest trigram similarity (Dice coefficient) worth suggesting
+MIN_SIMILARITY = 0.4
+
+# Cities whose similarity is computed exactly, per suggestion wanted
+FUZZY_CANDIDATES = 5
+
+# Similarity added per WEIGHT_SCALE of weight (a city of a million gets +0.3)
+WEIGHT_BONUS = 0.05
+
+# weight = log10(population + 1) * WEIGHT_SCALE, so it fits in 16 bits
+WEIGHT_SCALE = 1000
+
+# A suggestion: where it is and how to show it (e.g. "Springfield, IL, US")
+Suggestion = namedtuple('Suggestion', ['location', 'label'])
+
+
+def fold(text):
+    """
+    Fold a city name for matching: no accents, case-folded, single spaces.
+
+    "  São  Paulo" and "sao paulo" fold to the same key.
+
+    Args:
+        text (str): City name
+
+    Returns:
+        str: Folded name
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def trigrams(key):
+    """
+    Trigrams of a folded name, with word boundaries marked.
+
+    Args:
+        key (str): Folded name
+
+    Returns:
+        set: Three-character strings ("$lo", "lon", ..., "on$" for "lon")
+    """
+    padded = f"${key}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _gram_hash(gram):
+    return zlib.crc32(b"G" + gram.encode('utf-8'))
+
+
+def _prefix_hash(prefix):
+    return zlib.crc32(b"P" + prefix.encode('utf-8'))
+
+
+class CityIndex:
+    """Read-only, memory-mapped city index"""
+
+    def __init__(self, path=CITY_INDEX_FILE):
+        """
+        Args:
+            path (str): Index file built by scripts/build_city_index.py
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If it is not a city index of this version
+        """
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{path} is not a city index")
+        magic, version, self._count, self._table_size, self._strings, self._table, self._postings = \
+            HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} city index")
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """Unmap the file"""
+        self._map.close()
+
+    def suggest(self, text, limit=8):
+        """
+        Suggest cities for what the user typed so far.
+
+        Names starting with the text come first (exact names first, then
+        the largest cities). If there are none, it is probably a typo and
+        similar-looking names are suggested instead. "paris, us" only
+        suggests cities in countries starting with "US".
+
+        Args:
+            text (str): Search text, optionally followed by ", country"
+            limit (int): Most suggestions to return
+
+        Returns:
+            list: Suggestion tuples, best first
+        """
+        name, _, country = text.partition(",")
+        key, country = fold(name), country.strip().upper()
+        if not key:
+            return []
+
+        found = self._prefix(key, country, limit)
+        if not found and len(key) >= 3:
+            found = self._fuzzy(key, country, limit)
+        return [self._suggestion(i) for i in found]
+
+    def find(self, text):
+        """
+        Look up a city by its exact name.
+
+        Several cities of the same name only resolve to one of them when
+        population data makes it the largest; otherwise which one is
+        meant is left to the upstream lookup.
+
+        Args:
+            text (str): City name, optionally followed by ", country"
+
+        Returns:
+            Location: The city, or None if it is unknown or ambiguous
+        """
+        name, _, country = text.partition(",")
+        key, country = fold(name), country.strip().upper()
+        exact = [i for i in self._prefix(key, country, 2) if self._key(i) == key]
+        if not exact:
+            return None
+        if len(exact) > 1 and self._weight(exact[0]) <= self._weight(exact[1]):
+            return None  # Same name, no population to tell them apart
+        return self._suggestion(exact[0]).location
+
+    def _prefix(self, key, country, limit):
+        """Record numbers of the best cities whose name starts with key"""
+        if len(key) <= SHORT_PREFIX and not country:
+            return [i for i in self._lookup(_prefix_hash(key)) if self._key(i).startswith(key)][:limit]
+
+        encoded = key.encode('utf-8')
+        ranked = []
+        i = self._lower_bound(encoded)
+        end = min(self._count, i + PREFIX_SCAN)
+        while i < end:
+            record = RECORD.unpack_from(self._map, HEADER.size + i * RECORD.size)
+            start = self._strings + record[1]
+            candidate = self._map[start:start + record[2]]
+            if not candidate.startswith(encoded):
+                break
+            if not country or record[7].decode('ascii').startswith(country):
+                # Exact name first, then by population
+                ranked.append((candidate == encoded, record[8], -i))
+            i += 1
+        return [-entry[2] for entry in heapq.nlargest(limit, ranked)]
+
+    def _fuzzy(self, key, country, limit):
+        """Record numbers of the cities sharing the most trigrams with key"""
+        grams = trigrams(key)
+        runs = sorted((self._find(_gram_hash(gram)) for gram in grams), key=lambda run: run[1])
+
+        shared = Counter()
+        budget = MAX_POSTINGS
+        for first, count in runs:
+            if count > budget:
+                break
+            shared.update(self._read_postings(first, count))
+            budget -= count
+
+        ranked = []
+        for i, common in shared.most_common(limit * FUZZY_CANDIDATES):
+            record = RECORD.unpack_from(self._map, HEADER.size + i * RECORD.size)
+            if country and not record[7].decode('ascii').startswith(country):
+                continue
+            # Dice coefficient; a name of n characters has n padded trigrams
+            similarity = 2 * common / (len(grams) + len(self._key(i)))
+            if similarity >= MIN_SIMILARITY:
+                ranked.append((similarity + record[8] / WEIGHT_SCALE * WEIGHT_BONUS, -i))
+        return [-entry[1] for entry in heapq.nlargest(limit, ranked)]
+
+    def _lookup(self, hashed):
+        """Postings stored under a hash (empty if none)"""
+        return self._read_postings(*self._find(hashed))
+
+    def _find(self, hashed):
+        """
+        Find a hash in the table.
+
+        Returns:
+            tuple: (first posting, posting count); count is 0 if not found
+        """
+        lo, hi = 0, self._table_size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if struct.unpack_from('<I', self._map, self._table + mid * TABLE_ENTRY.size)[0] < hashed:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self._table_size:
+            return 0, 0
+
+        found, first, count = TABLE_ENTRY.unpack_from(self._map, self._table + lo * TABLE_ENTRY.size)
+        return (first, count) if found == hashed else (0, 0)
+
+    def _read_postings(self, first, count):
+        return struct.unpack_from(f'<{count}I', self._map, self._postings + first * POSTING.size)
+
+    def _lower_bound(self, encoded):
+        """First record whose folded name is not less than encoded"""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_bytes(mid) < encoded:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _key_bytes(self, i):
+        record = RECORD.unpack_from(self._map, HEADER.size + i * RECORD.size)
+        start = self._strings + record[1]
+        return self._map[start:start + record[2]]
+
+    def _key(self, i):
+        return self._key_bytes(i).decode('utf-8')
+
+    def _weight(self, i):
+        return RECORD.unpack_from(self._map, HEADER.size + i * RECORD.size)[8]
+
+    def _suggestion(self, i):
+        city_id, offset, key_len, name_len, state_len, lat, lon, country, weight = \
+            RECORD.unpack_from(self._map, HEADER.size + i * RECORD.size)
+        start = self._strings + offset + key_len
+        name = self._map[start:start + name_len].decode('utf-8')
+        state = self._map[start + name_len:start + name_len + state_len].decode('utf-8')
+        country = country.decode('ascii').strip()
+
+        label = ", ".join(part for part in (name, state, country) if part)
+        return Suggestion(Location(city_id, name, round(lat, 4), round(lon, 4), country), label)
+
+
+def _truncate_utf8(text, limit):
+    """Encode text, cut to at most limit bytes without splitting a character"""
+    return text.encode('utf-8')[:limit].decode('utf-8', 'ignore').encode('utf-8')
+
+
+def build_index(cities, path):
+    """
+    Compile cities into an index file.
+
+    Args:
+        cities (iterable): Dicts with 'id', 'name', 'lat', 'lon' and optionally
+                           'country', 'state' and 'population'
+        path (str): File to write
+
+    Returns:
+        int: Number of cities written (duplicates of the same name, state
+             and country are merged, keeping the most populous)
+    """
+    unique = {}
+    for city in cities:
+        key = fold(city['name'])
+        if not key:
+            continue
+        country = (city.get('country') or '')[:2].upper()
+        state = city.get('state') or ''
+        weight = int(math.log10((city.get('population') or 0) + 1) * WEIGHT_SCALE)
+        entry = (key, city['name'], state, country, weight, city['id'], city['lat'], city['lon'])
+        seen = unique.get((key, state, country))
+        if seen is None or weight > seen[4]:
+            unique[(key, state, country)] = entry
+
+    entries = sorted(unique.values(), key=lambda entry: (entry[0].encode('utf-8'), -entry[4]))
+
+    records, strings = [], bytearray()
+    postings = defaultdict(list)
+    prefixes = defaultdict(list)
+    for i, (key, name, state, country, weight, city_id, lat, lon) in enumerate(entries):
+        parts = [_truncate_utf8(part, 255) for part in (key, name, state)]
+        records.append(RECORD.pack(city_id, len(strings), *map(len, parts), lat, lon,
+                                   country.encode('ascii', 'replace').ljust(2), min(weight, 0xFFFF)))
+        strings += b"".join(parts)
+
+        for gram in trigrams(key):
+            postings[_gram_hash(gram)].append(i)
+        for length in range(1, min(len(key), SHORT_PREFIX) + 1):
+            prefixes[key[:length]].append(i)
+
+    # Short prefixes keep only their best cities: exact names, then by population
+    for prefix, matches in prefixes.items():
+        best = sorted(matches, key=lambda i: (entries[i][0] != prefix, -entries[i][4]))
+        postings[_prefix_hash(prefix)].extend(best[:TOP_PER_PREFIX])
+
+    table, flat = [], []
+    for hashed in sorted(postings):
+        table.append(TABLE_ENTRY.pack(hashed, len(flat), len(postings[hashed])))
+        flat.extend(postings[hashed])
+
+    strings_offset = HEADER.size + len(records) * RECORD.size
+    table_offset = strings_offset + len(strings)
+    postings_offset = table_offset + len(table) * TABLE_ENTRY.size
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(records), len(table),
+                            strings_offset, table_offset, postings_offset))
+        f.write(b"".join(records))
+        f.write(strings)
+        f.write(b"".join(table))
+        f.write(struct.pack(f'<{len(flat)}I', *flat))
+    return len(records)
+
+
+_index = None
+_loaded = False
+
+
+def get_city_index():
+    """
+    Get the bundled city index (opened on first use).
+
+    Returns:
+        CityIndex: The index, or None if CITY_INDEX_FILE is missing or unreadable
+    """
+    global _index, _loaded
+
+    if not _loaded:
+        _loaded = True
+        try:
+            _index = CityIndex()
+        except (OSError, ValueError) as e:
+            print(f"City suggestions unavailable: {e}")
+    return _index
@@ -1,21 +1,98 @@
 # api/currency_api.py
 """
 Currency conversion API integration using ExchangeRate-API.
+
+Rates can also come from a local rate file (see api/rate_providers.py);
+ExchangeRate-API then only refreshes them in the background, or is not
+used at all when RATES_REMOTE_REFRESH is False.
 """
-import requests
+import threading
+import time
+import config
 from config import CURRENCY_API_KEY
+from api import transport
+from api.http_session import conditional_headers, record_revalidation
+from api.singleflight import SingleFlight
+from api.rate_table import RateTable
+from api.persistent_cache import get_persistent_cache
+from api.errors import APIError, BadResponseError
+from api.json_codec import decode_response
+from api.rate_providers import get_default_rate_provider
+from api.priority import VISIBLE_REFRESH, request_priority
+
+PROVIDER = 'exchangerate'
+
+# Base currency of the full rate table (cross rates are computed locally)
+BASE_CURRENCY = "USD"
+
+# Seconds before the rate table is fetched again, when the response does not
+# say when the next update is due (or that time has already passed)
+RATE_TABLE_TTL = 3600
+
+# Seconds after the provider's announced update time before we fetch
+NEXT_UPDATE_GRACE = 120
+
+# Identical in-flight rate lookups are collapsed into one upstream call
+_inflight = SingleFlight()
+
+# Rate table from ExchangeRate-API shared by every CurrencyAPI instance
+_table = None
+
+# Held while a background refresh of the remote table runs
+_refreshing = threading.Lock()
+
+# The one pending timer that refreshes the table when it expires
+_refresh_timer = None
+_timer_lock = threading.Lock()
+
+# With a local rate source, whether ExchangeRate-API may still refresh it
+RATES_REMOTE_REFRESH = getattr(config, 'RATES_REMOTE_REFRESH', True)
+
+
+def _newest(*tables):
+    """The most recently fetched of some tables (None if there are none)"""
+    return max((table for table in tables if table is not None),
+               key=lambda table: table.fetched_at, default=None)
+
 
 class CurrencyAPI:
     """Handles currency conversion and exchange rate fetching"""
     
-    def __init__(self):
+    def __init__(self, rate_provider=None):
+        """
+        Args:
+            rate_provider (RateProvider): Local rate source (defaults to RATES_FILE from config)
+        """
         self.api_key = CURRENCY_API_KEY
         self.base_url = f"https://v6.exchangerate-api.com/v6/{self.api_key}"
+        self.store = get_persistent_cache()
+        
+        self.rate_provider = rate_provider or get_default_rate_provider()
+        
+        # ExchangeRate-API is always used without a local source
+        self.remote_enabled = self.rate_provider is None or RATES_REMOTE_REFRESH
+        
+        # Why the last call on each thread returned None (an api.errors.APIError), if it did.
+        # Per thread, so a background refresh can't overwrite a search's error.
+        self._local = threading.local()
+    
+    @property
+    def last_error(self):
+        """The error behind the last None result on this thread (None if it succeeded)"""
+        return getattr(self._local, 'error', None)
+    
+    @last_error.setter
+    def last_error(self, error):
+        self._local.error = error
     
     def get_exchange_rate(self, from_currency, to_currency):
         """
         Get exchange rate between two currencies.
         
+        The rate comes from the local cross-rate table; the network is
+        only used when the table is missing or expired (and never when
+        remote rates are disabled).
+        
         Args:
             from_currency (str): Source currency code (e.g., "USD")
             to_currency (str): Target currency code (e.g., "EUR")
@@ -23,21 +100,252 @@ class CurrencyAPI:
         Returns:
             float: Exchange rate or None if error
         """
+        table = self.get_rate_table()
+        
+        if table and from_currency in table and to_currency in table:
+            return table.rate(from_currency, to_currency)
+        
+        if not self.remote_enabled:
+            return None
+        
+        # Currency missing from the table (or no table) - ask for the pair
+        key = ("pair", from_currency, to_currency)
         try:
-            url = f"{self.base_url}/pair/{from_currency}/{to_currency}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            if data['result'] == 'success':
-                return data['conversion_rate']
-            else:
-                print(f"API Error: {data.get('error-type', 'Unknown error')}")
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching exchange rate: {e}")
+            return _inflight.do(key, self._fetch_exchange_rate, from_currency, to_currency)
+        except APIError as e:
+            self._report(e, "exchange rate")
+            return None
+    
+    def get_rate_table(self):
+        """
+        Get the cross-rate table, fetching it if missing or expired.
+        
+        With a local rate source its table is used right away, and the
+        remote one is refreshed in the background; whichever is newer wins.
+        
+        Returns:
+            RateTable: Current table, or the expired one if refetching failed
+        """
+        self.last_error = None
+        local = self.rate_provider.get_table() if self.rate_provider else None
+        if not self.remote_enabled:
+            return local
+        
+        table = self._lookup_fresh_table()
+        if table is None and local is not None:
+            self._refresh_in_background()
+            table = _table
+        elif table is None:
+            try:
+                table = _inflight.do(("latest", BASE_CURRENCY), self._fetch_rate_table)
+            except APIError as e:
+                self._report(e, "exchange rates")
+                table = _table
+        
+        return _newest(local, table)
+    
+    def get_rates_as_of(self):
+        """
+        Get when the provider last updated the rates in use.
+        
+        Returns:
+            float: Unix timestamp, or None if no table
+        """
+        local = self.rate_provider.peek() if self.rate_provider else None
+        table = _newest(local, _table if self.remote_enabled else None)
+        return table.as_of if table else None
+    
+    def get_seconds_until_update(self):
+        """
+        Get how long until the rates in use are due to be replaced.
+        
+        Returns:
+            float: Seconds (negative if overdue), or None if no table or it never expires
+        """
+        local = self.rate_provider.peek() if self.rate_provider else None
+        table = _newest(local, _table if self.remote_enabled else None)
+        if table is None or table.expires_at == float('inf'):
+            return None
+        return table.expires_at - time.time()
+    
+    def get_rates_age(self):
+        """
+        Get how old the current rate table is.
+        
+        Returns:
+            float: Seconds since the rates were fetched, or None if no table
+        """
+        local = self.rate_provider.peek() if self.rate_provider else None
+        table = _newest(local, _table if self.remote_enabled else None)
+        if table is None:
+            return None
+        return time.time() - table.fetched_at
+    
+    def is_offline(self):
+        """Check if ExchangeRate-API is currently unreachable (and needed)"""
+        return self.remote_enabled and transport.is_offline(PROVIDER)
+    
+    def clear_cache(self):
+        """Drop the in-memory rate table"""
+        global _table
+        _table = None
+    
+    def _lookup_fresh_table(self):
+        """
+        Get the rate table without touching the network.
+        
+        Returns:
+            RateTable: The table if it is still fresh, otherwise None
+        """
+        global _table
+        
+        if _table is None:
+            # Cold start: last known rates from disk
+            _table = self._load_stored_table()
+            if _table is not None and _table.is_fresh():
+                self._schedule_refresh(_table)
+        
+        if _table and _table.is_fresh():
+            return _table
+        return None
+    
+    def _refresh_in_background(self):
+        """Fetch the remote table without blocking the caller"""
+        if not _refreshing.acquire(blocking=False):
+            return  # Already running
+        
+        def _refresh():
+            try:
+                with request_priority(VISIBLE_REFRESH):
+                    _inflight.do(("latest", BASE_CURRENCY), self._fetch_rate_table)
+            except APIError as e:
+                print(f"Background refresh of exchange rates failed: {e}")
+            finally:
+                _refreshing.release()
+        
+        threading.Thread(target=_refresh, daemon=True).start()
+    
+    def _schedule_refresh(self, table):
+        """
+        Refresh once, just after the table expires.
+        
+        Until then every conversion is served from memory. Replaces any
+        refresh scheduled for an older table.
+        """
+        global _refresh_timer
+        
+        if not self.remote_enabled:
+            return
+        
+        with _timer_lock:
+            if _refresh_timer is not None:
+                _refresh_timer.cancel()
+            _refresh_timer = threading.Timer(max(0, table.expires_at - time.time()),
+                                             self._refresh_in_background)
+            _refresh_timer.daemon = True
+            _refresh_timer.start()
+    
+    def _build_table(self, data, fetched_at=None):
+        """Build a RateTable that expires when the provider publishes new rates"""
+        next_update = data.get('time_next_update_unix')
+        return RateTable(data['base_code'], data['conversion_rates'],
+                         ttl=RATE_TABLE_TTL, fetched_at=fetched_at,
+                         as_of=data.get('time_last_update_unix'),
+                         next_update=next_update + NEXT_UPDATE_GRACE if next_update else None)
+    
+    def _load_stored_table(self):
+        """Build a rate table from the persistent cache"""
+        stored = self.store.get(f"rates:{BASE_CURRENCY}")
+        if stored is None:
             return None
+        
+        table = self._build_table(stored.payload, fetched_at=stored.fetched_at)
+        table.etag = stored.etag
+        table.last_modified = stored.last_modified
+        table.body_size = stored.size
+        return table
+    
+    def _install_rate_table(self, data, etag=None, last_modified=None, body_size=0):
+        """Build the cross-rate matrix from a /latest response and store it"""
+        global _table
+        
+        table = self._build_table(data)
+        table.etag = etag
+        table.last_modified = last_modified
+        table.body_size = body_size
+        _table = table
+        
+        self.store.put(f"rates:{BASE_CURRENCY}", {
+            'base_code': data['base_code'],
+            'conversion_rates': data['conversion_rates'],
+            'time_last_update_unix': data.get('time_last_update_unix'),
+            'time_next_update_unix': data.get('time_next_update_unix'),
+        }, table.fetched_at, etag=etag, last_modified=last_modified)
+        
+        self._schedule_refresh(table)
+        return table
+    
+    def _fetch_rate_table(self):
+        """
+        Fetch the full /latest table and build the cross-rate matrix.
+        
+        Raises:
+            APIError: If the table could not be fetched
+        """
+        # Revalidate the table we already have instead of downloading it again
+        previous = _table
+        headers = {}
+        if previous is not None:
+            headers = conditional_headers(previous.etag, previous.last_modified)
+        
+        url = f"{self.base_url}/latest/{BASE_CURRENCY}"
+        response = transport.request(PROVIDER, url, headers=headers)
+        
+        if headers:
+            record_revalidation(response.status_code == 304, previous.body_size)
+        
+        if response.status_code == 304:
+            # Unchanged - keep the matrix we already built
+            previous.renew()
+            self.store.touch(f"rates:{BASE_CURRENCY}", previous.fetched_at)
+            self._schedule_refresh(previous)
+            return previous
+        
+        data = self._check_result(response)
+        return self._install_rate_table(data, response.headers.get("ETag"),
+                                        response.headers.get("Last-Modified"),
+                                        len(response.content))
+    
+    def _fetch_exchange_rate(self, from_currency, to_currency):
+        """
+        Fetch a single pair rate from the API.
+        
+        Raises:
+            APIError: If the rate could not be fetched
+        """
+        url = f"{self.base_url}/pair/{from_currency}/{to_currency}"
+        response = transport.request(PROVIDER, url)
+        return self._check_result(response)['conversion_rate']
+    
+    def _check_result(self, response):
+        """
+        Decode a response and make sure the API reported success.
+        
+        Raises:
+            BadResponseError: On an HTTP error status or an API error result
+        """
+        if not response.ok:
+            raise BadResponseError(f"HTTP {response.status_code}", PROVIDER)
+        
+        data = decode_response(response, PROVIDER)
+        if data.get('result') != 'success':
+            raise BadResponseError(f"API Error: {data.get('error-type', 'Unknown error')}", PROVIDER)
+        return data
+    
+    def _report(self, error, what):
+        """Keep the error for the caller and log it"""
+        self.last_error = error
+        print(f"Error fetching {what}: {error}")
     
     def convert_currency(self, amount, from_currency, to_currency):
         """
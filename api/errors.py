@@ -0,0 +1,58 @@
+# api/errors.py
+"""
+Structured error types for the API layer.
+
+The public API methods still return None on failure (the GUI relies on
+that), but the reason is kept in the client's `last_error` so the GUI
+can tell "city not found" apart from "no internet".
+"""
+
+
+class APIError(Exception):
+    """Base class for every API failure"""
+
+    # Short text suitable for showing in the GUI
+    user_message = "Something went wrong"
+
+    # Whether trying again shortly may succeed
+    retryable = False
+
+    def __init__(self, message, provider=None):
+        super().__init__(message)
+        self.provider = provider
+
+
+class NetworkError(APIError):
+    """The server could not be reached (DNS, connection, timeout)"""
+    user_message = "Check your internet connection"
+    retryable = True
+
+
+class ServerError(APIError):
+    """The server answered with a 5xx error"""
+    user_message = "Service temporarily unavailable"
+    retryable = True
+
+
+class RateLimitError(APIError):
+    """Our own limiter or the server (429) refused the request"""
+    user_message = "Too many requests - try again shortly"
+
+    def __init__(self, message, provider=None, retryable=False):
+        super().__init__(message, provider)
+        self.retryable = retryable  # A server 429 is worth retrying, our own limiter is not
+
+
+class CircuitOpenError(APIError):
+    """Recent requests kept failing, so we are not trying for a while"""
+    user_message = "Service unavailable - retrying soon"
+
+
+class NotFoundError(APIError):
+    """The requested resource does not exist (e.g. unknown city)"""
+    user_message = "City not found"
+
+
+class BadResponseError(APIError):
+    """The server answered, but not with what we expected"""
+    user_message = "Unexpected response from service"
@@ -0,0 +1,139 @@
+# api/geocoding.py
+"""
+Persistent index of where cities are.
+
+The first time a city name is looked up, the OpenWeatherMap response
+tells us its ID, coordinates and country. We keep that in GEOCODE_FILE
+so every later weather and forecast request can ask by ID (or by
+coordinates) instead of making the server resolve the name again.
+It also lets "London" and "london, gb" share one cache entry.
+"""
+import json
+import os
+import threading
+from collections import namedtuple
+from api.cache import normalize_city
+
+GEOCODE_FILE = "geocode_index.json"
+
+# id is None for places only known from the geocoding endpoint
+Location = namedtuple('Location', ['id', 'name', 'lat', 'lon', 'country'])
+
+
+def location_from_payload(data):
+    """
+    Extract where a place is from a weather, forecast or group response.
+
+    Args:
+        data (dict): Current weather item or forecast response
+
+    Returns:
+        Location: The location, or None if the payload does not say
+    """
+    place = data.get('city', data)  # Forecasts nest it under 'city'
+    coord = place.get('coord')
+    if not place.get('id') or not coord:
+        return None
+
+    country = place.get('country') or place.get('sys', {}).get('country', '')
+    return Location(place['id'], place.get('name', ''), coord['lat'], coord['lon'], country)
+
+
+class GeocodeIndex:
+    """Normalized city name -> Location, saved to GEOCODE_FILE"""
+
+    def __init__(self, path=GEOCODE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._locations = self._load()
+
+    def get(self, city):
+        """
+        Look up a city without touching the network.
+
+        Args:
+            city (str): City name as typed by the user
+
+        Returns:
+            Location: Known location or None
+        """
+        with self._lock:
+            return self._locations.get(normalize_city(city))
+
+    def put(self, city, location):
+        """
+        Remember where a city is (saved only when something changed).
+
+        Args:
+            city (str): City name as typed by the user
+            location (Location): Where it is
+        """
+        key = normalize_city(city)
+        with self._lock:
+            if self._locations.get(key) == location:
+                return
+            self._locations[key] = location
+            self._save()
+
+    def learn(self, city, data):
+        """
+        Remember a city's location from an API response.
+
+        Args:
+            city (str): Name the response was requested for
+            data (dict): Weather, forecast or group item payload
+
+        Returns:
+            Location: What was learned, or None
+        """
+        location = location_from_payload(data)
+        if location is not None:
+            self.put(city, location)
+        return location
+
+    def clear(self):
+        """Forget every location"""
+        with self._lock:
+            self._locations = {}
+            self._save()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._locations)
+
+    def _load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    return {city: Location(*fields) for city, fields in json.load(f).items()}
+            except (json.JSONDecodeError, OSError, TypeError):
+                pass
+        return {}
+
+    def _save(self):
+        try:
+            with open(self.path, 'w') as f:
+                json.dump({city: list(location) for city, location in self._locations.items()},
+                          f, indent=2)
+        except OSError as e:
+            print(f"Error saving geocode index: {e}")
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_geocode_index():
+    """
+    Get the process-wide geocode index (loaded on first use).
+
+    Returns:
+        GeocodeIndex: Shared index
+    """
+    global _index
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = GeocodeIndex()
+    return _index
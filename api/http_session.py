@@ -0,0 +1,139 @@
+# api/http_session.py
+"""
+Shared HTTP transport for all API clients.
+
+WeatherAPI and CurrencyAPI both use one pooled requests.Session so that
+keep-alive connections are reused instead of paying a new TCP/TLS
+handshake on every call. How long an idle connection stays open is up
+to the server; urllib3 notices one the server closed and reconnects.
+"""
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+import config
+
+# Pool tuning - override any of these in config.py
+POOL_CONNECTIONS = getattr(config, 'HTTP_POOL_CONNECTIONS', 4)  # Hosts kept in the pool
+POOL_MAXSIZE = getattr(config, 'HTTP_POOL_MAXSIZE', 8)          # Connections kept per host
+
+# Hosts we talk to - warmed up in the background at startup
+WARM_HOSTS = [
+    "https://api.openweathermap.org",
+    "https://v6.exchangerate-api.com",
+]
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Get the process-wide pooled session (created on first use).
+
+    Returns:
+        requests.Session: Shared session with keep-alive connection pools
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def _create_session():
+    """Build a session with tuned per-host connection pools"""
+    session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=False  # Never make a caller wait for a free connection
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers.update({
+        "Connection": "keep-alive",
+        "Accept": "application/json",
+    })
+    return session
+
+
+def warm_connections(hosts=None):
+    """
+    Open connections to the API hosts in a background thread.
+
+    DNS lookup and the TLS handshake happen here, so the first real
+    request finds a ready connection in the pool.
+
+    Args:
+        hosts (list): Base URLs to warm (defaults to WARM_HOSTS)
+
+    Returns:
+        threading.Thread: The (daemon) warm-up thread
+    """
+    hosts = hosts or WARM_HOSTS
+
+    def _warm():
+        session = get_session()
+        for host in hosts:
+            try:
+                session.head(host, timeout=5)
+            except requests.exceptions.RequestException as e:
+                print(f"Connection warm-up failed for {host}: {e}")
+
+    thread = threading.Thread(target=_warm, name="http-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+# Conditional request bookkeeping - how often a revalidation saved a download
+_revalidation_stats = {'revalidations': 0, 'not_modified': 0, 'bytes_saved': 0}
+_stats_lock = threading.Lock()
+
+
+def conditional_headers(etag=None, last_modified=None):
+    """
+    Build revalidation headers from stored validators.
+
+    Args:
+        etag (str): ETag of the cached response
+        last_modified (str): Last-Modified of the cached response
+
+    Returns:
+        dict: If-None-Match / If-Modified-Since headers (empty if no validators)
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def record_revalidation(not_modified, cached_size=0):
+    """
+    Count the outcome of a conditional request.
+
+    Args:
+        not_modified (bool): True if the server answered 304
+        cached_size (int): Body size we did not have to download again
+    """
+    with _stats_lock:
+        _revalidation_stats['revalidations'] += 1
+        if not_modified:
+            _revalidation_stats['not_modified'] += 1
+            _revalidation_stats['bytes_saved'] += cached_size
+
+
+def get_revalidation_stats():
+    """
+    Get conditional request statistics.
+
+    Returns:
+        dict: Revalidations sent, 304 answers and bytes saved
+    """
+    with _stats_lock:
+        return dict(_revalidation_stats)
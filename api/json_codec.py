@@ -0,0 +1,72 @@
+# api/json_codec.py
+"""
+JSON decoding and encoding for API payloads.
+
+orjson is used when installed (several times faster, and it parses the
+response bytes directly). Without it the standard library json module
+is used; json.loads also accepts bytes, so either way we skip the
+charset detection requests does for response.json().
+"""
+import json
+from api.errors import BadResponseError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Name of the backend in use (shown by the benchmark)
+BACKEND = "orjson" if orjson is not None else "json"
+
+# Raised by loads() for malformed input, whichever backend is in use
+JSONDecodeError = json.JSONDecodeError  # orjson's error is a subclass
+
+
+def loads(data):
+    """
+    Decode JSON.
+
+    Args:
+        data (bytes or str): JSON document (e.g., response.content)
+
+    Returns:
+        object: Decoded value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value):
+    """
+    Encode compact JSON.
+
+    Args:
+        value: Value to encode (dict keys may be ints)
+
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, separators=(',', ':'))
+
+
+def decode_response(response, provider=None):
+    """
+    Decode the body of a requests or httpx response.
+
+    Args:
+        response: Response with a `content` attribute
+        provider (str): Provider key, for the error
+
+    Returns:
+        object: Decoded JSON body
+
+    Raises:
+        BadResponseError: If the body is not valid JSON
+    """
+    try:
+        return loads(response.content)
+    except (JSONDecodeError, UnicodeDecodeError) as e:
+        raise BadResponseError(f"Invalid JSON: {e}", provider) from e
@@ -0,0 +1,378 @@
+# api/models.py
+"""
+Compact weather models decoded from OpenWeatherMap responses.
+
+The raw JSON is dozens of small nested dicts per city. These models keep
+only the fields the app shows, in __slots__ objects; a forecast keeps its
+~40 time slots as parallel arrays instead of 40 dicts. Condition names
+and descriptions are interned, so every slot of every cached city shares
+the same few strings.
+
+A WeatherReport bundles all three views of one place (current weather,
+forecast and official alerts) as decoded from a single One Call response.
+"""
+import sys
+import time
+from array import array
+from collections import namedtuple
+
+# OpenWeatherMap condition ID -> (main, description), shared by all models
+_conditions = {}
+
+
+def _condition_code(weather):
+    """Register a response's condition and return its ID"""
+    code = weather.get('id', 0)
+    if code not in _conditions:
+        _conditions[code] = (sys.intern(weather.get('main', '')),
+                             sys.intern(weather.get('description', '')))
+    return code
+
+
+def condition_name(code):
+    """Main condition for an ID (e.g., "Rain")"""
+    return _conditions.get(code, ('', ''))[0]
+
+
+def condition_description(code):
+    """Description for an ID (e.g., "light rain")"""
+    return _conditions.get(code, ('', ''))[1]
+
+
+def _register(conditions):
+    """Restore condition names saved with a model"""
+    for code, (main, description) in conditions.items():
+        _conditions.setdefault(int(code), (sys.intern(main), sys.intern(description)))
+
+
+class Observation:
+    """Current weather for one place"""
+
+    __slots__ = ('city_id', 'name', 'country', 'lat', 'lon', 'dt', 'temp', 'feels_like',
+                 'temp_min', 'temp_max', 'humidity', 'pressure', 'wind_speed', 'clouds',
+                 'visibility', 'rain_1h', 'condition_code')
+
+    def __init__(self, city_id, name, country, lat, lon, dt, temp, feels_like, temp_min,
+                 temp_max, humidity, pressure, wind_speed, clouds, visibility, rain_1h,
+                 condition_code):
+        self.city_id = city_id
+        self.name = name
+        self.country = country
+        self.lat = lat
+        self.lon = lon
+        self.dt = dt
+        self.temp = temp
+        self.feels_like = feels_like
+        self.temp_min = temp_min
+        self.temp_max = temp_max
+        self.humidity = humidity
+        self.pressure = pressure
+        self.wind_speed = wind_speed
+        self.clouds = clouds
+        self.visibility = visibility
+        self.rain_1h = rain_1h
+        self.condition_code = condition_code
+
+    @classmethod
+    def from_owm(cls, data):
+        """
+        Decode a /weather response (or one item of a /group response).
+
+        Args:
+            data (dict): Decoded JSON
+
+        Returns:
+            Observation: The current weather
+        """
+        main = data['main']
+        coord = data.get('coord', {})
+        return cls(
+            data.get('id'),
+            data.get('name', ''),
+            data.get('sys', {}).get('country', ''),
+            coord.get('lat'),
+            coord.get('lon'),
+            data.get('dt', 0),
+            main['temp'],
+            main.get('feels_like', main['temp']),
+            main.get('temp_min', main['temp']),
+            main.get('temp_max', main['temp']),
+            main.get('humidity', 0),
+            main.get('pressure', 0),
+            data.get('wind', {}).get('speed', 0),
+            data.get('clouds', {}).get('all', 0),
+            data.get('visibility', 10000),
+            data.get('rain', {}).get('1h', 0),
+            _condition_code((data.get('weather') or [{}])[0]),
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild from to_dict() output (or a raw response stored by older versions)"""
+        if 'main' in data:
+            return cls.from_owm(data)
+        data = dict(data)
+        _register(data.pop('conditions', {}))
+        return cls(**data)
+
+    def to_dict(self):
+        """Plain dict for the persistent cache"""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data['conditions'] = {self.condition_code: _conditions.get(self.condition_code, ('', ''))}
+        return data
+
+    @classmethod
+    def from_onecall(cls, data, location=None):
+        """
+        Decode the current weather of a One Call response.
+
+        Args:
+            data (dict): Decoded One Call JSON
+            location (Location): Where the place is (One Call responses carry no name)
+
+        Returns:
+            Observation: The current weather
+        """
+        current = data['current']
+        today = (data.get('daily') or [{}])[0].get('temp', {})
+        return cls(
+            location.id if location else None,
+            location.name if location else '',
+            location.country if location else '',
+            data.get('lat'),
+            data.get('lon'),
+            current.get('dt', 0),
+            current['temp'],
+            current.get('feels_like', current['temp']),
+            today.get('min', current['temp']),
+            today.get('max', current['temp']),
+            current.get('humidity', 0),
+            current.get('pressure', 0),
+            current.get('wind_speed', 0),
+            current.get('clouds', 0),
+            current.get('visibility', 10000),
+            current.get('rain', {}).get('1h', 0),
+            _condition_code((current.get('weather') or [{}])[0]),
+        )
+
+    @property
+    def condition(self):
+        """Main condition (e.g., "Clouds")"""
+        return condition_name(self.condition_code)
+
+    @property
+    def description(self):
+        """Condition description (e.g., "broken clouds")"""
+        return condition_description(self.condition_code)
+
+
+_FLOAT_TYPECODES = ('f', 'd')
+
+
+class Forecast:
+    """
+    Forecast for one place, stored column-wise.
+
+    The slot columns hold 3-hourly (/forecast) or hourly (One Call)
+    entries. The day_* columns hold One Call's daily summaries and are
+    empty for /forecast responses.
+    """
+
+    __slots__ = ('city_id', 'name', 'country', 'lat', 'lon', 'timezone', 'dt', 'temp',
+                 'feels_like', 'humidity', 'pressure', 'wind_speed', 'clouds', 'condition_codes',
+                 'day_dt', 'day_temp_min', 'day_temp_max', 'day_condition_codes')
+
+    # Column name -> array typecode
+    COLUMNS = {
+        'dt': 'q',
+        'temp': 'f',
+        'feels_like': 'f',
+        'humidity': 'B',
+        'pressure': 'H',
+        'wind_speed': 'f',
+        'clouds': 'B',
+        'condition_codes': 'H',
+        'day_dt': 'q',
+        'day_temp_min': 'f',
+        'day_temp_max': 'f',
+        'day_condition_codes': 'H',
+    }
+
+    def __init__(self, city_id, name, country, lat, lon, timezone, **columns):
+        """
+        Args:
+            city_id (int): OpenWeatherMap city ID
+            name (str): City name
+            country (str): Country code
+            lat (float): Latitude
+            lon (float): Longitude
+            timezone (int): Offset from UTC in seconds
+            **columns: One iterable per entry of COLUMNS, all the same length
+        """
+        self.city_id = city_id
+        self.name = name
+        self.country = country
+        self.lat = lat
+        self.lon = lon
+        self.timezone = timezone
+        for column, typecode in self.COLUMNS.items():
+            values = columns.get(column, ())
+            if typecode not in _FLOAT_TYPECODES:
+                # JSON may give whole numbers as floats (humidity 55.0), which integer arrays reject
+                values = (round(value) for value in values)
+            setattr(self, column, array(typecode, values))
+
+    @classmethod
+    def from_owm(cls, data):
+        """
+        Decode a /forecast response.
+
+        Args:
+            data (dict): Decoded JSON
+
+        Returns:
+            Forecast: The forecast
+        """
+        city = data.get('city', {})
+        coord = city.get('coord', {})
+        slots = data.get('list', [])
+        return cls(
+            city.get('id'), city.get('name', ''), city.get('country', ''),
+            coord.get('lat'), coord.get('lon'), city.get('timezone', 0),
+            dt=[slot['dt'] for slot in slots],
+            temp=[slot['main']['temp'] for slot in slots],
+            feels_like=[slot['main'].get('feels_like', slot['main']['temp']) for slot in slots],
+            humidity=[slot['main'].get('humidity', 0) for slot in slots],
+            pressure=[slot['main'].get('pressure', 0) for slot in slots],
+            wind_speed=[slot.get('wind', {}).get('speed', 0) for slot in slots],
+            clouds=[slot.get('clouds', {}).get('all', 0) for slot in slots],
+            condition_codes=[_condition_code((slot.get('weather') or [{}])[0]) for slot in slots],
+        )
+
+    @classmethod
+    def from_onecall(cls, data, location=None):
+        """
+        Decode the hourly and daily forecasts of a One Call response.
+
+        Args:
+            data (dict): Decoded One Call JSON
+            location (Location): Where the place is
+
+        Returns:
+            Forecast: The forecast
+        """
+        hours = data.get('hourly', [])
+        days = data.get('daily', [])
+        return cls(
+            location.id if location else None,
+            location.name if location else '',
+            location.country if location else '',
+            data.get('lat'), data.get('lon'), data.get('timezone_offset', 0),
+            dt=[hour['dt'] for hour in hours],
+            temp=[hour['temp'] for hour in hours],
+            feels_like=[hour.get('feels_like', hour['temp']) for hour in hours],
+            humidity=[hour.get('humidity', 0) for hour in hours],
+            pressure=[hour.get('pressure', 0) for hour in hours],
+            wind_speed=[hour.get('wind_speed', 0) for hour in hours],
+            clouds=[hour.get('clouds', 0) for hour in hours],
+            condition_codes=[_condition_code((hour.get('weather') or [{}])[0]) for hour in hours],
+            day_dt=[day['dt'] for day in days],
+            day_temp_min=[day['temp']['min'] for day in days],
+            day_temp_max=[day['temp']['max'] for day in days],
+            day_condition_codes=[_condition_code((day.get('weather') or [{}])[0]) for day in days],
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild from to_dict() output (or a raw response stored by older versions)"""
+        if 'list' in data:
+            return cls.from_owm(data)
+        data = dict(data)
+        _register(data.pop('conditions', {}))
+        return cls(**data)
+
+    def to_dict(self):
+        """Plain dict for the persistent cache"""
+        data = {name: getattr(self, name) for name in ('city_id', 'name', 'country', 'lat', 'lon', 'timezone')}
+        for column in self.COLUMNS:
+            data[column] = getattr(self, column).tolist()
+        codes = set(self.condition_codes) | set(self.day_condition_codes)
+        data['conditions'] = {code: _conditions.get(code, ('', '')) for code in codes}
+        return data
+
+    def condition(self, i):
+        """Main condition of slot i (e.g., "Rain")"""
+        return condition_name(self.condition_codes[i])
+
+    def has_daily(self):
+        """Check if the forecast carries daily summaries (One Call)"""
+        return len(self.day_dt) > 0
+
+    def __len__(self):
+        return len(self.dt)
+
+
+# An official weather alert (sender, event name, start/end Unix time, text)
+Alert = namedtuple('Alert', ['sender', 'event', 'start', 'end', 'description'])
+
+
+class WeatherReport:
+    """Current weather, forecast and official alerts for one place"""
+
+    __slots__ = ('current', 'forecast', 'alerts')
+
+    def __init__(self, current, forecast, alerts=()):
+        """
+        Args:
+            current (Observation): Current weather (None if unavailable)
+            forecast (Forecast): Forecast (None if unavailable)
+            alerts (tuple): Alert tuples, empty when none are in effect
+        """
+        self.current = current
+        self.forecast = forecast
+        self.alerts = tuple(alerts)
+
+    @classmethod
+    def from_owm(cls, data, location=None):
+        """
+        Decode a One Call response.
+
+        Args:
+            data (dict): Decoded JSON
+            location (Location): Where the place is (One Call responses carry no name)
+
+        Returns:
+            WeatherReport: The report
+        """
+        alerts = [Alert(alert.get('sender_name', ''), sys.intern(alert.get('event', '')),
+                        alert.get('start', 0), alert.get('end', 0), alert.get('description', ''))
+                  for alert in data.get('alerts', [])]
+        return cls(Observation.from_onecall(data, location), Forecast.from_onecall(data, location), alerts)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild from to_dict() output"""
+        return cls(Observation.from_dict(data['current']), Forecast.from_dict(data['forecast']),
+                   [Alert(*alert) for alert in data.get('alerts', [])])
+
+    def to_dict(self):
+        """Plain dict for the persistent cache"""
+        return {
+            'current': self.current.to_dict(),
+            'forecast': self.forecast.to_dict(),
+            'alerts': [list(alert) for alert in self.alerts],
+        }
+
+    def active_alerts(self, now=None):
+        """
+        Get the alerts that have not ended yet.
+
+        Args:
+            now (float): Unix time (defaults to the current time)
+
+        Returns:
+            list: Alert tuples
+        """
+        if now is None:
+            now = time.time()
+        return [alert for alert in self.alerts if not alert.end or alert.end > now]
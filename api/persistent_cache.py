@@ -0,0 +1,232 @@
+# api/persistent_cache.py
+"""
+Persistent cache for API payloads stored in a single SQLite file.
+
+Weather and rate responses are written here with their fetch time, so a
+cold start can render the last known data instantly and the app keeps
+working offline. The database runs in WAL mode and is compacted when it
+grows past its size limit.
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from api.json_codec import loads, dumps
+
+CACHE_FILE = "api_cache.db"
+
+# Limits - oldest entries are dropped first when a limit is exceeded
+MAX_CACHE_BYTES = 5 * 1024 * 1024       # Total payload size
+MAX_CACHE_AGE = 7 * 24 * 60 * 60        # Entries older than a week are useless
+
+# A stored payload with its fetch time, size and HTTP validators
+StoredEntry = namedtuple('StoredEntry', ['payload', 'fetched_at', 'size', 'etag', 'last_modified'])
+
+
+class PersistentCache:
+    """Thread-safe key/value store for decoded API payloads"""
+
+    def __init__(self, path=CACHE_FILE, max_bytes=MAX_CACHE_BYTES, max_age=MAX_CACHE_AGE):
+        """
+        Args:
+            path (str): SQLite database file
+            max_bytes (int): Size limit for all stored payloads
+            max_age (int): Seconds after which entries are purged
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._conn = None
+        self._writes = 0
+
+    def get(self, key):
+        """
+        Load a payload.
+
+        Args:
+            key (str): Cache key (e.g. "weather:london:metric")
+
+        Returns:
+            StoredEntry: The stored entry or None if not stored
+        """
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT payload, fetched_at, size, etag, last_modified FROM entries WHERE key = ?",
+                    (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Cache read error: {e}")
+            return None
+
+        if row is None:
+            return None
+        return StoredEntry(loads(row[0]), *row[1:])
+
+    def put(self, key, payload, fetched_at=None, etag=None, last_modified=None):
+        """
+        Store a payload.
+
+        Args:
+            key (str): Cache key
+            payload: JSON-serializable data
+            fetched_at (float): When the data was fetched (defaults to now)
+            etag (str): ETag header of the response, if any
+            last_modified (str): Last-Modified header of the response, if any
+        """
+        data = dumps(payload)
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, payload, fetched_at, size, etag, last_modified)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, data, fetched_at or time.time(), len(data), etag, last_modified)
+                )
+                conn.commit()
+
+                # Enforce limits every so often rather than on every write
+                self._writes += 1
+                if self._writes % 20 == 0:
+                    self._enforce_limits(conn)
+        except sqlite3.Error as e:
+            print(f"Cache write error: {e}")
+
+    def touch(self, key, fetched_at=None):
+        """
+        Mark a stored payload as confirmed current (e.g. after a 304).
+
+        Args:
+            key (str): Cache key
+            fetched_at (float): New fetch time (defaults to now)
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("UPDATE entries SET fetched_at = ? WHERE key = ?",
+                             (fetched_at or time.time(), key))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Cache write error: {e}")
+
+    def clear(self):
+        """Delete every entry and shrink the file"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM entries")
+                conn.commit()
+                self._vacuum(conn)
+        except sqlite3.Error as e:
+            print(f"Cache clear error: {e}")
+
+    def compact(self):
+        """Apply the size/age limits and shrink the file"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                self._enforce_limits(conn)
+                self._vacuum(conn)
+        except sqlite3.Error as e:
+            print(f"Cache compaction error: {e}")
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Entry count, payload bytes, file size and oldest entry time
+        """
+        try:
+            with self._lock:
+                count, payload_bytes, oldest = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(fetched_at) FROM entries"
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Cache stats error: {e}")
+            count, payload_bytes, oldest = 0, 0, None
+
+        file_bytes = 0
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                file_bytes += os.path.getsize(self.path + suffix)
+
+        return {
+            'entries': count,
+            'bytes': payload_bytes,
+            'file_bytes': file_bytes,
+            'oldest': oldest,
+        }
+
+    def _connect(self):
+        """Open the database on first use (caller holds the lock)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " payload TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT)"
+            )
+
+            # Databases created before validators were stored lack the columns
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE entries ADD COLUMN {column} TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_fetched_at ON entries (fetched_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _enforce_limits(self, conn):
+        """Drop expired entries, then the oldest ones until under max_bytes"""
+        conn.execute("DELETE FROM entries WHERE fetched_at < ?", (time.time() - self.max_age,))
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total > self.max_bytes:
+            rows = conn.execute("SELECT key, size FROM entries ORDER BY fetched_at").fetchall()
+            doomed = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+        conn.commit()
+
+    def _vacuum(self, conn):
+        """Fold the WAL back into the main file and reclaim free pages"""
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+
+
+# Shared store used by WeatherAPI and CurrencyAPI
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_persistent_cache():
+    """
+    Get the process-wide persistent cache (opened on first use).
+
+    Returns:
+        PersistentCache: Shared cache instance
+    """
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PersistentCache()
+    return _store
@@ -0,0 +1,231 @@
+# api/prefetch.py
+"""
+Warm the weather cache for the cities the user is likely to open next.
+
+Cities are ranked by how often they were opened (recent opens count
+more, see utils.city_history), whether they are favorites, and how
+often they are opened around the current time of day. While no request
+is on the wire and the rate budget has room to spare, the top few are
+refreshed at PREFETCH priority, so opening one paints fresh data
+without waiting for the network.
+
+Every open is checked against what was prefetched: the hit rate against
+the requests spent shows whether prefetching pays for itself.
+"""
+import threading
+import time
+import config
+from api.priority import PREFETCH, request_priority
+from api.rate_limiter import get_limiter
+from api.scheduler import get_scheduler
+from api.weather_api import CACHE_TTL, PROVIDER, WeatherAPI
+from utils.city_history import decayed_weight, history_key, load_history, record_city_open
+from utils.favorites import load_favorites
+
+# Cities warmed per run
+TOP_N = getattr(config, 'PREFETCH_CITIES', 3)
+
+# Seconds between prefetch runs; cities still fresh until the next run are skipped
+INTERVAL = getattr(config, 'PREFETCH_INTERVAL', 300)
+
+# Cities scoring lower than this are not worth a request
+MIN_SCORE = 0.5
+
+# Score a favorite gets on top of its history
+FAVORITE_WEIGHT = 1.0
+
+# Bounds of the time-of-day factor (1 = opened equally at any hour)
+MIN_HOUR_FACTOR = 0.25
+MAX_HOUR_FACTOR = 4.0
+
+
+def _hour_factor(hours, hour):
+    """
+    How much more than average a city is opened around this hour.
+
+    Args:
+        hours (list): Opens per hour of the day (24 counts)
+        hour (int): Current hour
+
+    Returns:
+        float: Between MIN_HOUR_FACTOR and MAX_HOUR_FACTOR
+    """
+    near = hours[(hour - 1) % 24] + hours[hour] + hours[(hour + 1) % 24]
+    expected = sum(hours) * 3 / 24
+
+    # +1 on both sides keeps cities with few opens close to neutral
+    factor = (near + 1) / (expected + 1)
+    return min(max(factor, MIN_HOUR_FACTOR), MAX_HOUR_FACTOR)
+
+
+class Prefetcher:
+    """Learns which cities get opened and keeps the likeliest ones warm"""
+
+    def __init__(self, api=None, top_n=TOP_N):
+        """
+        Args:
+            api (WeatherAPI): Client to fetch with (created on first use if None)
+            top_n (int): Cities warmed per run
+        """
+        self._api = api
+        self.top_n = top_n
+        self._lock = threading.Lock()
+
+        # City key -> (name, when its prefetched data was fetched), not yet opened
+        self._warmed = {}
+
+        self._stats = {'runs': 0, 'warmed': 0, 'requests': 0, 'failed': 0,
+                       'opens': 0, 'hits': 0, 'misses': 0, 'unused': 0}
+
+    @property
+    def api(self):
+        if self._api is None:
+            self._api = WeatherAPI()
+        return self._api
+
+    def record_open(self, city):
+        """
+        Learn from an open of a city (a search or a favorite click) and
+        count it as a prefetch hit or miss.
+
+        A hit is an open served by data the prefetcher fetched. A miss is
+        an open that found no fresh data at all. Opens of data that was
+        fresh anyway (e.g. the city on screen) count as neither.
+
+        Args:
+            city (str): City the user opened
+        """
+        record_city_open(city)
+
+        now = time.time()
+        age = self.api.get_data_age(city)
+        with self._lock:
+            self._stats['opens'] += 1
+            warmed = self._warmed.pop(history_key(city), None)
+            if warmed is not None and now - warmed[1] < CACHE_TTL:
+                self._stats['hits'] += 1
+                return
+
+            if warmed is not None:
+                self._stats['unused'] += 1
+            if age is None or age >= CACHE_TTL:
+                self._stats['misses'] += 1
+
+    def likely_cities(self, now=None):
+        """
+        Rank the cities worth prefetching.
+
+        Args:
+            now (float): Timestamp to rank for (defaults to now)
+
+        Returns:
+            list: (city, score) tuples, likeliest first, all above MIN_SCORE
+        """
+        now = now or time.time()
+        hour = time.localtime(now).tm_hour
+        scores = {}
+
+        for key, entry in load_history().items():
+            score = decayed_weight(entry, now) * _hour_factor(entry['hours'], hour)
+            scores[key] = (entry['name'], score)
+
+        for city in load_favorites():
+            key = history_key(city)
+            name, score = scores.get(key, (city, 0.0))
+            scores[key] = (name, score + FAVORITE_WEIGHT)
+
+        ranked = sorted(scores.values(), key=lambda item: item[1], reverse=True)
+        return [(name, score) for name, score in ranked if score >= MIN_SCORE]
+
+    def should_run(self):
+        """Check if the upstream is idle and the rate budget has room for a run"""
+        if self.top_n <= 0 or not get_scheduler().is_idle() or self.api.is_offline():
+            return False
+        return get_limiter(PROVIDER).has_spare(self.top_n * self._requests_per_city())
+
+    def run(self):
+        """
+        Warm the cache for the likeliest cities (blocking - call it on a
+        worker thread). Stops early when the rate budget runs low.
+
+        Returns:
+            list: Cities that were fetched
+        """
+        limiter = get_limiter(PROVIDER)
+        cost = self._requests_per_city()
+        fetched = []
+
+        self._expire_unused()
+        with self._lock:
+            self._stats['runs'] += 1
+
+        for city, score in self.likely_cities()[:self.top_n]:
+            # Still fresh until the next run - nothing to do
+            age = self.api.get_data_age(city)
+            if age is not None and age + INTERVAL < CACHE_TTL:
+                continue
+
+            if not limiter.has_spare(cost):
+                break
+
+            with request_priority(PREFETCH):
+                report = self.api.refresh_weather_report(city)
+
+            with self._lock:
+                self._stats['requests'] += cost
+                if report is None:
+                    self._stats['failed'] += 1
+                    continue
+                self._stats['warmed'] += 1
+                self._warmed[history_key(city)] = (city, time.time())
+            fetched.append(city)
+
+        if fetched:
+            print(f"Prefetched weather for: {', '.join(fetched)}")
+        return fetched
+
+    def stats(self):
+        """
+        Get prefetch statistics.
+
+        Returns:
+            dict: runs, warmed (cities fetched), requests spent, failed,
+                  opens, hits, misses, unused (warmed but expired unopened)
+                  and hit_rate (hits per city warmed)
+        """
+        self._expire_unused()
+        with self._lock:
+            stats = dict(self._stats)
+        stats['hit_rate'] = stats['hits'] / max(stats['warmed'], 1)
+        return stats
+
+    def _expire_unused(self):
+        """Count prefetched data that went stale before anyone opened it"""
+        now = time.time()
+        with self._lock:
+            for key, (city, fetched_at) in list(self._warmed.items()):
+                if now - fetched_at >= CACHE_TTL:
+                    del self._warmed[key]
+                    self._stats['unused'] += 1
+
+    def _requests_per_city(self):
+        """Upstream calls needed to warm one city"""
+        return 1 if self.api.one_call else 2
+
+
+_prefetcher = Prefetcher()
+
+
+def get_prefetcher():
+    """
+    Get the process-wide prefetcher.
+
+    Returns:
+        Prefetcher: Shared prefetcher
+    """
+    return _prefetcher
+
+
+def get_prefetch_stats():
+    """Get prefetch statistics. See Prefetcher.stats()."""
+    return _prefetcher.stats()
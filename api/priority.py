@@ -0,0 +1,58 @@
+# api/priority.py
+"""
+Request priority for the API layer.
+
+Requests made directly for the user (a search, a conversion) are
+INTERACTIVE. Refreshing data that is on screen or was just asked for
+(stale cache entries, rotating popular cities) is VISIBLE_REFRESH.
+Fetching data nobody has asked for yet is PREFETCH. Anything below
+INTERACTIVE counts as background work: it can be slowed down, deferred,
+and never holds up an interactive request (see api.scheduler).
+"""
+import contextvars
+from contextlib import contextmanager
+
+INTERACTIVE = "interactive"
+VISIBLE_REFRESH = "visible_refresh"
+PREFETCH = "prefetch"
+
+# Highest priority first
+PRIORITIES = (INTERACTIVE, VISIBLE_REFRESH, PREFETCH)
+
+_priority = contextvars.ContextVar("request_priority", default=INTERACTIVE)
+
+
+def current_priority():
+    """
+    Get the priority of requests made from the current context.
+
+    Returns:
+        str: INTERACTIVE (the default), VISIBLE_REFRESH or PREFETCH
+    """
+    return _priority.get()
+
+
+def is_background(priority=None):
+    """
+    Check if a priority is background work (anything below INTERACTIVE).
+
+    Args:
+        priority (str): Priority to check (defaults to the current context)
+    """
+    return (priority or current_priority()) != INTERACTIVE
+
+
+@contextmanager
+def request_priority(priority):
+    """
+    Run the enclosed requests at the given priority.
+
+    Example:
+        with request_priority(VISIBLE_REFRESH):
+            api.get_current_weather("London")
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
@@ -0,0 +1,307 @@
+# api/rate_limiter.py
+"""
+Client-side rate limiting and quota accounting for the upstream APIs.
+
+Each provider gets a token bucket for its per-minute limit and a monthly
+call counter that is saved to disk. Part of every bucket is reserved for
+interactive requests. Background requests slow down as the bucket runs
+low or the monthly quota nears its end, instead of failing outright.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+import config
+from api.priority import INTERACTIVE, current_priority
+
+USAGE_FILE = "api_usage.json"
+
+# Seconds to collect calls before the usage file is written
+USAGE_SAVE_DELAY = 5
+
+# Fraction of the per-minute budget only interactive requests may use
+INTERACTIVE_RESERVE = 0.25
+
+# Background requests start slowing down at this share of the monthly quota
+SLOWDOWN_AT = 0.8
+
+# Longest a request waits for a token before giving up (seconds)
+MAX_INTERACTIVE_WAIT = 5
+MAX_BACKGROUND_WAIT = 60
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously"""
+
+    def __init__(self, per_minute, capacity=None):
+        """
+        Args:
+            per_minute (int): Tokens added per minute
+            capacity (int): Maximum tokens (defaults to per_minute)
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def try_take(self, keep=0):
+        """
+        Take one token if more than `keep` tokens remain.
+
+        Args:
+            keep (float): Tokens that must stay in the bucket
+
+        Returns:
+            float: 0 if a token was taken, else seconds until one is available
+        """
+        self._refill()
+        if self.tokens - 1 >= keep:
+            self.tokens -= 1
+            return 0
+        return (keep + 1 - self.tokens) / self.rate
+
+    def available(self):
+        """Tokens currently in the bucket"""
+        self._refill()
+        return self.tokens
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class UsageLedger:
+    """
+    Monthly call counters per provider, persisted to USAGE_FILE.
+
+    Counts live in memory; the file is written USAGE_SAVE_DELAY seconds
+    after a call (one write for a whole burst of calls) and on flush().
+    """
+
+    def __init__(self, path=USAGE_FILE, save_delay=USAGE_SAVE_DELAY):
+        self.path = path
+        self.save_delay = save_delay
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # One writer at a time
+        self._usage = self._load()
+        self._dirty = False
+        self._timer = None
+
+    def record(self, provider):
+        """Count one call for this month (saved shortly after)"""
+        with self._lock:
+            month = self._usage.setdefault(_current_month(), {})
+            month[provider] = month.get(provider, 0) + 1
+            self._dirty = True
+
+            if self._timer is None:
+                self._timer = threading.Timer(self.save_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Write unsaved counts to disk now"""
+        with self._save_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+
+                # Only the current and previous months are worth keeping
+                for month in sorted(self._usage)[:-2]:
+                    del self._usage[month]
+                text = json.dumps(self._usage, indent=2)
+
+            try:
+                with open(self.path, 'w') as f:
+                    f.write(text)
+            except OSError as e:
+                print(f"Error saving API usage: {e}")
+
+    def calls_this_month(self, provider):
+        """Number of calls made to a provider this month"""
+        with self._lock:
+            return self._usage.get(_current_month(), {}).get(provider, 0)
+
+    def _load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                pass
+        return {}
+
+
+class ProviderLimiter:
+    """Per-minute limit plus monthly quota for one upstream API"""
+
+    def __init__(self, key, name, per_minute, monthly_quota, ledger):
+        """
+        Args:
+            key (str): Provider key used in the usage file
+            name (str): Display name
+            per_minute (int): Allowed calls per minute
+            monthly_quota (int): Allowed calls per calendar month
+            ledger (UsageLedger): Where monthly usage is counted
+        """
+        self.key = key
+        self.name = name
+        self.per_minute = per_minute
+        self.monthly_quota = monthly_quota
+        self.ledger = ledger
+
+        self._bucket = TokenBucket(per_minute)
+        self._lock = threading.Lock()
+
+    def acquire(self, priority=None):
+        """
+        Wait for permission to make one call and count it.
+
+        Interactive requests may use the whole bucket and only fail when
+        the monthly quota is used up. Background requests leave the
+        reserve alone and are spaced out as the quota runs low.
+
+        Args:
+            priority (str): Request priority (defaults to the current context)
+
+        Returns:
+            bool: True if the call may be made
+        """
+        priority = priority or current_priority()
+        interactive = priority == INTERACTIVE
+
+        used = self.ledger.calls_this_month(self.key) / self.monthly_quota
+        if used >= 1:
+            print(f"{self.name} monthly quota used up")
+            return False
+
+        if interactive:
+            keep, max_wait = 0, MAX_INTERACTIVE_WAIT
+        else:
+            keep, max_wait = self.per_minute * INTERACTIVE_RESERVE, MAX_BACKGROUND_WAIT
+
+            if used >= SLOWDOWN_AT:
+                # Spread background calls out over the rest of the quota
+                time.sleep(min(max_wait, (used - SLOWDOWN_AT) / (1 - SLOWDOWN_AT) * max_wait))
+
+        deadline = time.monotonic() + max_wait
+        while True:
+            with self._lock:
+                wait = self._bucket.try_take(keep)
+            if wait == 0:
+                break
+            if time.monotonic() + wait > deadline:
+                print(f"{self.name} rate limit reached - skipping {priority} request")
+                return False
+            time.sleep(wait)
+
+        self.ledger.record(self.key)
+        return True
+
+    def has_spare(self, calls=1):
+        """
+        Check if background work could make some calls right now without
+        waiting and without eating into the interactive reserve or the
+        end of the monthly quota.
+
+        Args:
+            calls (int): Calls the work would make
+
+        Returns:
+            bool: True if the budget has room for them
+        """
+        if self.ledger.calls_this_month(self.key) + calls > self.monthly_quota * SLOWDOWN_AT:
+            return False
+        with self._lock:
+            available = self._bucket.available()
+        return available - calls >= self.per_minute * INTERACTIVE_RESERVE
+
+    def usage(self):
+        """
+        Get current usage for display.
+
+        Returns:
+            dict: Name, calls this month, monthly quota and per-minute budget
+        """
+        with self._lock:
+            available = int(self._bucket.available())
+        return {
+            'name': self.name,
+            'calls_this_month': self.ledger.calls_this_month(self.key),
+            'monthly_quota': self.monthly_quota,
+            'per_minute': self.per_minute,
+            'available_now': available,
+        }
+
+
+def _current_month():
+    return time.strftime("%Y-%m")
+
+
+_ledger = UsageLedger()
+
+# Counts recorded since the last save would be lost otherwise
+atexit.register(_ledger.flush)
+
+# Free tier limits - override in config.py for paid plans
+LIMITERS = {
+    'openweathermap': ProviderLimiter(
+        'openweathermap', "OpenWeatherMap",
+        per_minute=getattr(config, 'OPENWEATHER_CALLS_PER_MINUTE', 60),
+        monthly_quota=getattr(config, 'OPENWEATHER_MONTHLY_QUOTA', 1000000),
+        ledger=_ledger,
+    ),
+    'exchangerate': ProviderLimiter(
+        'exchangerate', "ExchangeRate-API",
+        per_minute=getattr(config, 'CURRENCY_CALLS_PER_MINUTE', 30),
+        monthly_quota=getattr(config, 'CURRENCY_MONTHLY_QUOTA', 1500),
+        ledger=_ledger,
+    ),
+}
+
+
+def register_limiter(provider, name, per_minute, monthly_quota):
+    """
+    Add a limiter for another provider (e.g. a secondary weather source).
+
+    Args:
+        provider (str): Provider key
+        name (str): Display name
+        per_minute (int): Allowed calls per minute
+        monthly_quota (int): Allowed calls per calendar month
+
+    Returns:
+        ProviderLimiter: The provider's limiter (the existing one if already registered)
+    """
+    if provider not in LIMITERS:
+        LIMITERS[provider] = ProviderLimiter(provider, name, per_minute, monthly_quota, _ledger)
+    return LIMITERS[provider]
+
+
+def get_limiter(provider):
+    """
+    Get the limiter for a provider.
+
+    Args:
+        provider (str): "openweathermap" or "exchangerate"
+
+    Returns:
+        ProviderLimiter: Shared limiter for that provider
+    """
+    return LIMITERS[provider]
+
+
+def get_usage():
+    """
+    Get usage of every provider.
+
+    Returns:
+        list: One usage dict per provider
+    """
+    return [limiter.usage() for limiter in LIMITERS.values()]
@@ -0,0 +1,187 @@
+# api/rate_providers.py
+"""
+Local sources of exchange rates.
+
+A rate provider produces a RateTable without going through
+ExchangeRate-API. FileRateProvider reads a daily reference-rate file
+such as the ECB's eurofxref-daily.xml or eurofxref.csv from disk (or a
+mirrored copy on a share), parses it once and re-reads it whenever the
+file changes. Set it up in config.py:
+
+    RATES_FILE = "eurofxref-daily.xml"
+    RATES_REMOTE_REFRESH = False  # Never call ExchangeRate-API
+"""
+import csv
+import os
+from abc import ABC, abstractmethod
+import threading
+import time
+import xml.etree.ElementTree as ET
+import config
+from api.rate_table import RateTable
+
+# Seconds between checks for a changed rate file
+RELOAD_CHECK_INTERVAL = 2
+
+
+class RateProvider(ABC):
+    """Interface for local rate sources"""
+
+    # Display name
+    name = "Rates"
+
+    @abstractmethod
+    def get_table(self):
+        """
+        Get the current rate table (may reload, must not block on the network).
+
+        Returns:
+            RateTable: The table, or None if no rates are available
+        """
+
+    @abstractmethod
+    def peek(self):
+        """
+        Get the last loaded table without reloading anything.
+
+        Returns:
+            RateTable: The table or None
+        """
+
+
+class FileRateProvider(RateProvider):
+    """Reference rates from an ECB-style XML or CSV file, hot-reloaded"""
+
+    def __init__(self, path, base="EUR"):
+        """
+        Args:
+            path (str): Rate file (.xml for ECB XML, anything else is read as CSV)
+            base (str): Currency the file's rates are quoted against
+        """
+        self.path = path
+        self.base = base
+        self.name = f"Rate file ({os.path.basename(path)})"
+
+        self._table = None
+        self._mtime = None
+        self._checked_at = 0
+        self._lock = threading.Lock()
+
+    def get_table(self):
+        """Get the table, re-reading the file if it changed since the last load"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked_at >= RELOAD_CHECK_INTERVAL:
+                self._checked_at = now
+                self._reload_if_changed()
+            return self._table
+
+    def peek(self):
+        with self._lock:
+            return self._table
+
+    def _reload_if_changed(self):
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return  # Missing file - keep what we have
+
+        if mtime == self._mtime:
+            return
+
+        try:
+            rates = self._parse()
+        except (ET.ParseError, csv.Error, ValueError, OSError) as e:
+            print(f"Error reading rate file {self.path}: {e}")
+            return
+
+        if not rates:
+            print(f"No rates found in {self.path}")
+            return
+
+        rates[self.base] = 1.0
+        # Never expires on its own - it is replaced when the file changes
+        self._table = RateTable(self.base, rates, ttl=float('inf'), fetched_at=mtime)
+        self._mtime = mtime
+        print(f"💱 Loaded {len(rates)} rates from {self.path}")
+
+    def _parse(self):
+        """Read the file into a currency code -> rate dict"""
+        if self.path.lower().endswith(".xml"):
+            return self._parse_xml()
+        return self._parse_csv()
+
+    def _parse_xml(self):
+        """
+        ECB XML: <Cube currency="USD" rate="1.0412"/> elements, any namespace.
+
+        Files with several days (eurofxref-hist.xml) list the latest day
+        first, in its own <Cube time="..."> group; only that one is read.
+        """
+        root = ET.parse(self.path).getroot()
+        days = (element for element in root.iter() if element.tag.endswith("Cube") and "time" in element.attrib)
+        latest = next(days, root)
+
+        rates = {}
+        for element in latest.iter():
+            if not element.tag.endswith("Cube") or "currency" not in element.attrib:
+                continue
+            try:
+                rate = float(element.attrib.get("rate", ""))
+            except ValueError:
+                continue  # Missing or malformed rate - skip that currency
+            if rate > 0:
+                rates[element.attrib["currency"].strip().upper()] = rate
+        return rates
+
+    def _parse_csv(self):
+        """
+        ECB CSV (a header row of codes, then a row of rates for the day)
+        or one "CODE,rate" pair per line.
+        """
+        with open(self.path, newline='') as f:
+            rows = [[cell.strip() for cell in row] for row in csv.reader(f) if any(cell.strip() for cell in row)]
+
+        if not rows:
+            return {}
+
+        if len(rows[0]) > 2 and rows[0][0].lower() == "date":
+            # Wide ECB format - the first data row is the latest day
+            header, values = rows[0], rows[1] if len(rows) > 1 else []
+            pairs = zip(header[1:], values[1:])
+        else:
+            pairs = (row[:2] for row in rows if len(row) >= 2)
+
+        rates = {}
+        for code, value in pairs:
+            try:
+                rate = float(value)
+            except ValueError:
+                continue  # Header line or "N/A"
+            if code and rate > 0:
+                rates[code.upper()] = rate
+        return rates
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_default_rate_provider():
+    """
+    Get the provider configured in config.py (shared by every CurrencyAPI).
+
+    Returns:
+        RateProvider: FileRateProvider for RATES_FILE, or None if not configured
+    """
+    global _default
+
+    path = getattr(config, 'RATES_FILE', None)
+    if not path:
+        return None
+
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = FileRateProvider(path, base=getattr(config, 'RATES_FILE_BASE', "EUR"))
+    return _default
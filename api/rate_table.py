@@ -0,0 +1,84 @@
+# api/rate_table.py
+"""
+Local cross-rate matrix built from one full exchange-rate table.
+
+ExchangeRate-API's /latest/{base} endpoint returns the rate of every
+currency against one base. From that single response we compute the
+rate between every pair of currencies, so a conversion is an O(1)
+lookup with no network round trip.
+"""
+import time
+from array import array
+
+
+class RateTable:
+    """N x N cross-rate matrix stored in a flat array of doubles"""
+
+    def __init__(self, base, rates, ttl=3600, fetched_at=None, as_of=None, next_update=None):
+        """
+        Args:
+            base (str): Base currency of the response (e.g., "USD")
+            rates (dict): Currency code -> rate against base
+            ttl (int): Seconds until the table should be refetched
+            fetched_at (float): When the rates were fetched (defaults to now)
+            as_of (float): When the provider last updated the rates (defaults to fetched_at)
+            next_update (float): When the provider publishes new rates; the
+                table expires then instead of after ttl
+        """
+        self.base = base
+        self.codes = sorted(code for code, value in rates.items() if value)
+        self.index = {code: i for i, code in enumerate(self.codes)}
+        self.size = len(self.codes)
+
+        # matrix[i * size + j] = how much of codes[j] one unit of codes[i] buys
+        values = [rates[code] for code in self.codes]
+        self.matrix = array('d')
+        for from_value in values:
+            self.matrix.extend(to_value / from_value for to_value in values)
+
+        self.ttl = ttl
+        self.fetched_at = fetched_at or time.time()
+        self.as_of = as_of or self.fetched_at
+        self.next_update = next_update
+        self.expires_at = self._expiry()
+
+        # HTTP validators and body size of the response the table came from
+        self.etag = None
+        self.last_modified = None
+        self.body_size = 0
+
+    def rate(self, from_currency, to_currency):
+        """
+        Look up the exchange rate between two currencies.
+
+        Args:
+            from_currency (str): Source currency code
+            to_currency (str): Target currency code
+
+        Returns:
+            float: Exchange rate or None if a currency is not in the table
+        """
+        i = self.index.get(from_currency)
+        j = self.index.get(to_currency)
+
+        if i is None or j is None:
+            return None
+        return self.matrix[i * self.size + j]
+
+    def renew(self):
+        """Mark the table as confirmed current (e.g. after a 304)"""
+        self.fetched_at = time.time()
+        self.expires_at = self._expiry()
+
+    def is_fresh(self, now=None):
+        """Check if the table is still within its TTL"""
+        return (now or time.time()) < self.expires_at
+
+    def _expiry(self):
+        """The provider's next update if it is still ahead, else fetched_at + ttl"""
+        if self.next_update and self.next_update > self.fetched_at:
+            return self.next_update
+        return self.fetched_at + self.ttl
+
+    def __contains__(self, currency):
+        return currency in self.index
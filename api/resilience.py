@@ -0,0 +1,128 @@
+# api/resilience.py
+"""
+Retry and circuit breaker helpers for upstream calls.
+
+Transient failures are retried a couple of times with jittered
+exponential backoff. When a provider keeps failing, its circuit opens
+and calls fail immediately instead of each blocking on a timeout; after
+a cool-down a single probe request checks whether it has recovered.
+"""
+import random
+import threading
+import time
+from api.errors import APIError, CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """Fails fast after repeated errors, probes for recovery"""
+
+    def __init__(self, name, failure_threshold=3, reset_timeout=30):
+        """
+        Args:
+            name (str): Provider name (for messages)
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds to wait before a probe request
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0
+        self._probe_running = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Check if a call may go ahead.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a probe is already running)
+        """
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+
+            if self.state == CLOSED:
+                return
+
+            if self.state == HALF_OPEN and not self._probe_running:
+                # Let exactly one request through to test the water
+                self._probe_running = True
+                return
+
+        raise CircuitOpenError(f"{self.name} circuit is open", self.name)
+
+    def record_success(self):
+        """A call succeeded - close the circuit"""
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_running = False
+
+    def cancel_call(self):
+        """A call allowed by before_call() was not made after all"""
+        with self._lock:
+            self._probe_running = False
+
+    def record_failure(self):
+        """A call failed - open the circuit once the threshold is reached"""
+        with self._lock:
+            self.failures += 1
+            self._probe_running = False
+
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    print(f"⚡ {self.name} circuit opened after {self.failures} failures")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def is_open(self):
+        """Check if calls are currently being refused"""
+        with self._lock:
+            return self.state == OPEN and time.monotonic() - self.opened_at < self.reset_timeout
+
+
+def backoff_delay(attempt, base=0.5, cap=4.0):
+    """
+    Jittered exponential backoff ("full jitter").
+
+    Args:
+        attempt (int): Retry number, starting at 1
+        base (float): Delay of the first retry before jitter
+        cap (float): Maximum delay
+
+    Returns:
+        float: Seconds to sleep before the retry
+    """
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+def call_with_retry(fn, attempts=3, base_delay=0.5, max_delay=4.0):
+    """
+    Call fn, retrying transient errors with jittered backoff.
+
+    Args:
+        fn (callable): Function taking no arguments
+        attempts (int): Total attempts including the first
+        base_delay (float): Backoff base in seconds
+        max_delay (float): Backoff cap in seconds
+
+    Returns:
+        Whatever fn returns
+
+    Raises:
+        APIError: The last error once attempts run out (or a non-retryable one)
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return fn()
+        except APIError as e:
+            if not e.retryable or attempt == attempts:
+                raise
+            time.sleep(backoff_delay(attempt, base_delay, max_delay))
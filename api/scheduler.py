@@ -0,0 +1,158 @@
+# api/scheduler.py
+"""
+Admission control for upstream requests, by priority.
+
+Every request needs one of SLOTS slots (one per pooled connection) for
+as long as it is on the wire. Each priority class may hold at most its
+limit of slots at once. Background classes together can never fill all
+of them, so an interactive request always finds a free slot and starts
+straight away, however much background work is queued. When a slot
+frees up it goes to the highest-priority waiting request, oldest first.
+"""
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+import config
+from api.http_session import POOL_MAXSIZE
+from api.priority import INTERACTIVE, VISIBLE_REFRESH, PREFETCH, PRIORITIES, current_priority
+
+# Requests on the wire at once, all classes together
+SLOTS = getattr(config, 'SCHEDULER_SLOTS', POOL_MAXSIZE)
+
+# Slots each class may hold at once
+CLASS_LIMITS = {
+    INTERACTIVE: SLOTS,
+    VISIBLE_REFRESH: getattr(config, 'SCHEDULER_VISIBLE_REFRESH_SLOTS', 3),
+    PREFETCH: getattr(config, 'SCHEDULER_PREFETCH_SLOTS', 2),
+}
+
+
+class RequestScheduler:
+    """Hands out request slots by priority, with per-class limits"""
+
+    def __init__(self, slots=SLOTS, limits=None):
+        """
+        Args:
+            slots (int): Requests in flight at once, all classes together
+            limits (dict): Priority -> slots that class may hold
+        """
+        self.slots = slots
+        self.limits = dict(limits or CLASS_LIMITS)
+
+        self._running = {priority: 0 for priority in PRIORITIES}
+        self._waiting = []  # Heap of (rank, sequence, priority)
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+
+        # Priority -> {'granted', 'total_wait', 'max_wait'}
+        self._stats = {priority: {'granted': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+                       for priority in PRIORITIES}
+
+    def acquire(self, priority=None):
+        """
+        Wait for a slot.
+
+        Args:
+            priority (str): Request priority (defaults to the current context)
+
+        Returns:
+            str: The priority the slot was granted for (pass it to release())
+        """
+        priority = priority or current_priority()
+        ticket = (PRIORITIES.index(priority), next(self._sequence), priority)
+        started = time.monotonic()
+
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            while self._next_ticket() != ticket:
+                self._cond.wait()
+
+            self._waiting.remove(ticket)
+            heapq.heapify(self._waiting)
+            self._running[priority] += 1
+
+            waited = time.monotonic() - started
+            stats = self._stats[priority]
+            stats['granted'] += 1
+            stats['total_wait'] += waited
+            stats['max_wait'] = max(stats['max_wait'], waited)
+
+            # Another waiter may be able to start too
+            self._cond.notify_all()
+        return priority
+
+    def release(self, priority):
+        """Give back a slot taken with acquire()"""
+        with self._cond:
+            self._running[priority] -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority=None):
+        """
+        Hold a slot for the enclosed request.
+
+        Example:
+            with get_scheduler().slot():
+                response = session.get(url)
+        """
+        priority = self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def is_idle(self):
+        """Check if no request is on the wire or waiting for a slot"""
+        with self._cond:
+            return not self._waiting and not any(self._running.values())
+
+    def stats(self):
+        """
+        Get queueing statistics per class.
+
+        Returns:
+            dict: Priority -> running, waiting, granted, average and longest wait (seconds)
+        """
+        with self._cond:
+            waiting = [ticket[2] for ticket in self._waiting]
+            return {
+                priority: {
+                    'running': self._running[priority],
+                    'waiting': waiting.count(priority),
+                    'granted': stats['granted'],
+                    'avg_wait': stats['total_wait'] / max(stats['granted'], 1),
+                    'max_wait': stats['max_wait'],
+                }
+                for priority, stats in self._stats.items()
+            }
+
+    def _next_ticket(self):
+        """The waiting ticket that gets the next free slot, if one is free (lock held)"""
+        if sum(self._running.values()) >= self.slots:
+            return None
+        for ticket in sorted(self._waiting):
+            priority = ticket[2]
+            if self._running[priority] < self.limits.get(priority, self.slots):
+                return ticket
+        return None
+
+
+_scheduler = RequestScheduler()
+
+
+def get_scheduler():
+    """
+    Get the process-wide scheduler.
+
+    Returns:
+        RequestScheduler: Shared scheduler
+    """
+    return _scheduler
+
+
+def get_scheduler_stats():
+    """Get queueing statistics per class. See RequestScheduler.stats()."""
+    return _scheduler.stats()
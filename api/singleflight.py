@@ -0,0 +1,81 @@
+# api/singleflight.py
+"""
+Request coalescing for the API clients.
+
+When several callers ask for the same resource at the same time, only
+the first one performs the upstream request. The others wait for it and
+receive the same result.
+"""
+import threading
+
+
+class _Call:
+    """An in-flight call and its outcome"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Collapses identical concurrent calls into one"""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+        self.executed = 0   # Calls that actually ran
+        self.coalesced = 0  # Calls that reused another caller's result
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Run fn unless an identical call (same key) is already running.
+
+        Args:
+            key: Identifies the resource (e.g. endpoint + city)
+            fn (callable): Function performing the request
+
+        Returns:
+            The result of fn, shared with every concurrent caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result
+
+    def stats(self):
+        """
+        Get coalescing statistics.
+
+        Returns:
+            dict: Number of executed and coalesced calls
+        """
+        with self._lock:
+            return {'executed': self.executed, 'coalesced': self.coalesced}
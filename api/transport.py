@@ -0,0 +1,184 @@
+# api/transport.py
+"""
+The single path every upstream HTTP request goes through.
+
+For each provider this applies, in order: the circuit breaker, the
+rate limiter, a slot from the priority scheduler, the shared pooled
+session with separate connect/read timeouts, and retries with jittered
+backoff for transient errors.
+Failures come back as the structured errors in api/errors.py.
+"""
+import time
+import requests
+import config
+from api.http_session import get_session
+from api.rate_limiter import get_limiter
+from api.resilience import CircuitBreaker, call_with_retry
+from api.scheduler import get_scheduler
+from api.errors import NetworkError, ServerError, RateLimitError
+
+# Seconds to wait for a connection / for the response once connected
+CONNECT_TIMEOUT = getattr(config, 'HTTP_CONNECT_TIMEOUT', 3.05)
+READ_TIMEOUT = getattr(config, 'HTTP_READ_TIMEOUT', 10)
+
+# Total attempts per request (first try + retries)
+MAX_ATTEMPTS = getattr(config, 'HTTP_MAX_ATTEMPTS', 3)
+
+_breakers = {
+    'openweathermap': CircuitBreaker("OpenWeatherMap"),
+    'exchangerate': CircuitBreaker("ExchangeRate-API"),
+}
+
+# Set when the last request to a provider could not reach it
+_offline = {provider: False for provider in _breakers}
+
+
+def register_provider(provider, name):
+    """
+    Give another provider its own circuit breaker and offline state.
+
+    Its rate limiter is registered separately (api.rate_limiter.register_limiter).
+
+    Args:
+        provider (str): Provider key
+        name (str): Display name
+    """
+    if provider not in _breakers:
+        _breakers[provider] = CircuitBreaker(name)
+        _offline[provider] = False
+
+
+def request(provider, url, params=None, headers=None, on_attempt=None):
+    """
+    GET a URL from a provider with limits, retries and circuit breaking.
+
+    2xx, 304 and 4xx responses are returned as-is (a 404 is an answer,
+    not an outage). Everything else raises.
+
+    Args:
+        provider (str): Provider key (e.g., "openweathermap")
+        url (str): URL to fetch
+        params (dict): Query parameters
+        headers (dict): Extra request headers
+        on_attempt (callable): Called with the seconds each attempt spent on
+            the wire (failed ones too), not counting time spent waiting for
+            the limiter, a scheduler slot or a retry
+
+    Returns:
+        requests.Response: The response
+
+    Raises:
+        APIError: NetworkError, ServerError, RateLimitError or CircuitOpenError
+    """
+    # The breaker sees one outcome per request, however many attempts it took
+    _breakers[provider].before_call()
+    recorded = False
+    try:
+        response = call_with_retry(
+            lambda: _attempt(provider, url, params, headers, on_attempt),
+            attempts=MAX_ATTEMPTS
+        )
+        record_outcome(provider, ok=True)
+        recorded = True
+        return response
+    except (NetworkError, ServerError) as e:
+        unreachable = isinstance(e.__cause__, (requests.exceptions.ConnectionError,
+                                               requests.exceptions.Timeout))
+        record_outcome(provider, ok=False, network_error=unreachable)
+        recorded = True
+        raise
+    except RateLimitError as e:
+        if e.retryable:
+            record_outcome(provider, ok=True)  # Reachable, just busy
+            recorded = True
+        raise
+    finally:
+        if not recorded:
+            cancel_request(provider)
+
+
+def before_request(provider):
+    """
+    Check the circuit and take a rate-limit token for one request.
+
+    Used directly by clients that do their own HTTP (the async clients).
+
+    Raises:
+        CircuitOpenError: If the provider's circuit is open
+        RateLimitError: If the limiter refused the request
+    """
+    _breakers[provider].before_call()
+
+    try:
+        _acquire_token(provider)
+    except RateLimitError:
+        cancel_request(provider)
+        raise
+
+
+def cancel_request(provider):
+    """
+    Report that a request allowed by before_request() ended without an
+    outcome (refused locally, cancelled, or failed on our side), so a
+    half-open circuit can send another probe.
+
+    Args:
+        provider (str): Provider key
+    """
+    _breakers[provider].cancel_call()
+
+
+def record_outcome(provider, ok, network_error=False):
+    """
+    Report how a request went, for the circuit breaker and offline state.
+
+    Args:
+        provider (str): Provider key
+        ok (bool): True if the provider answered properly
+        network_error (bool): True if the provider could not be reached
+    """
+    _offline[provider] = network_error
+    if ok:
+        _breakers[provider].record_success()
+    else:
+        _breakers[provider].record_failure()
+
+
+def is_offline(provider):
+    """
+    Check if a provider is currently unreachable.
+
+    True after a network error, and while the provider's circuit is open.
+    """
+    return _offline[provider] or _breakers[provider].is_open()
+
+
+def _acquire_token(provider):
+    """Take a rate-limit token, raising RateLimitError if refused"""
+    if not get_limiter(provider).acquire():
+        raise RateLimitError("Client-side rate limit reached", provider)
+
+
+def _attempt(provider, url, params, headers, on_attempt=None):
+    """One attempt at a request (the caller handles the circuit breaker)"""
+    _acquire_token(provider)
+
+    try:
+        with get_scheduler().slot():
+            started = time.monotonic()
+            try:
+                response = get_session().get(url, params=params, headers=headers,
+                                             timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+            finally:
+                if on_attempt is not None:
+                    on_attempt(time.monotonic() - started)
+    except requests.exceptions.RequestException as e:
+        raise NetworkError(str(e), provider) from e
+
+    if response.status_code == 429:
+        raise RateLimitError("Server rate limit (429)", provider, retryable=True)
+
+    if response.status_code >= 500:
+        raise ServerError(f"HTTP {response.status_code}", provider)
+
+    return response
@@ -1,64 +1,519 @@
 # api/weather_api.py
 """
 Weather API integration using OpenWeatherMap.
+
+By default current weather and the forecast come from the /weather and
+/forecast endpoints. With One Call enabled in config.py (it needs a One
+Call subscription) a single request per city returns current weather,
+hourly and daily forecasts and official alerts:
+
+    WEATHER_ONE_CALL = True
 """
-import requests
+import threading
+import time
+import config
 from config import OPENWEATHER_API_KEY
+from api.http_session import conditional_headers, record_revalidation
+from api.cache import ResponseCache, normalize_city
+from api.singleflight import SingleFlight
+from api.persistent_cache import get_persistent_cache
+from api.priority import VISIBLE_REFRESH, request_priority
+from api.geocoding import Location, get_geocode_index
+from api.models import Observation, Forecast, WeatherReport
+from api.errors import APIError, NotFoundError, BadResponseError
+from api.json_codec import decode_response
+from api.weather_providers import OWM_HOST, get_weather_source
+
+PROVIDER = 'openweathermap'
+
+# API paths below the provider's host
+DATA_PATH = "data/2.5"
+GEO_PATH = "geo/1.0"
+ONE_CALL_PATH = "data/3.0/onecall"
+
+# Model each endpoint's responses are decoded into
+MODELS = {"weather": Observation, "forecast": Forecast, "onecall": WeatherReport}
+
+# Fetch current weather and forecast with one One Call request per city
+ONE_CALL = getattr(config, 'WEATHER_ONE_CALL', False)
+
+# OpenWeatherMap refreshes its data about every 10 minutes, so a response
+# stays fresh that long (seconds). Every WeatherAPI instance shares this cache.
+CACHE_TTL = 600
+_cache = ResponseCache(ttl=CACHE_TTL, stale_ttl=3600, negative_ttl=120)
+
+# Seconds before retrying the network after falling back to stored data
+OFFLINE_RETRY = 120
+
+# Identical in-flight requests are collapsed into one upstream call
+_inflight = SingleFlight()
+
+# Keys with a background refresh already running
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+# The group endpoint accepts at most this many city IDs per request
+GROUP_BATCH_SIZE = 20
+
 
 class WeatherAPI:
     """Handles all weather data fetching from OpenWeatherMap API"""
-    
+
     def __init__(self):
         self.api_key = OPENWEATHER_API_KEY
-        self.base_url = "http://api.openweathermap.org/data/2.5"
-    
+        self.base_url = f"{OWM_HOST}/{DATA_PATH}"
+        self.units = "metric"  # Celsius
+        self.source = get_weather_source()  # Primary + optional hedge/failover source
+        self.store = get_persistent_cache()
+        self.locations = get_geocode_index()
+        self.one_call = ONE_CALL
+        
+        # Why the last call on each thread returned None (an api.errors.APIError), if it did.
+        # Per thread, so a background refresh can't overwrite a search's error.
+        self._local = threading.local()
+
+    @property
+    def last_error(self):
+        """The error behind the last None result on this thread (None if it succeeded)"""
+        return getattr(self._local, 'error', None)
+
+    @last_error.setter
+    def last_error(self, error):
+        self._local.error = error
+
     def get_current_weather(self, city):
         """
         Get current weather for a city.
-        
+
         Args:
             city (str): City name (e.g., "London", "New York")
-            
+
         Returns:
-            dict: Weather data or None if error
+            Observation: Current weather or None if error
         """
-        url = f"{self.base_url}/weather"
-        params = {
-            "q": city,
-            "appid": self.api_key,
-            "units": "metric"  # Celsius
-        }
-        
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching weather for {city}: {e}")
-            return None
-    
+        if self.one_call:
+            report = self.get_weather_report(city)
+            return report.current if report else None
+        return self._cached_get("weather", city)
+
     def get_forecast(self, city, days=5):
         """
         Get weather forecast for a city.
-        
+
         Args:
             city (str): City name
             days (int): Number of days (max 5 for free tier)
-            
+
         Returns:
-            dict: Forecast data or None if error
+            Forecast: Forecast or None if error
         """
-        url = f"{self.base_url}/forecast"
-        params = {
-            "q": city,
-            "appid": self.api_key,
-            "units": "metric"
-        }
+        if self.one_call:
+            report = self.get_weather_report(city)
+            return report.forecast if report else None
+        return self._cached_get("forecast", city)
+
+    def get_weather_report(self, city):
+        """
+        Get current weather, forecast and alerts for a city together.
+
+        With One Call this is one request (plus a geocoding call the first
+        time a city is seen); otherwise it combines get_current_weather()
+        and get_forecast(), and there are no official alerts.
+
+        Args:
+            city (str): City name
+
+        Returns:
+            WeatherReport: The report, or None if nothing could be fetched
+        """
+        if not self.one_call:
+            current = self.get_current_weather(city)
+            error = self.last_error
+            forecast = self.get_forecast(city)
+            self.last_error = self.last_error or error
+            if current is None and forecast is None:
+                return None
+            return WeatherReport(current, forecast)
+
+        # One Call is queried by coordinates
+        if self.get_location(city) is None:
+            return None
+        return self._cached_get("onecall", city)
+
+    def refresh_weather_report(self, city):
+        """
+        Get a city's report, revalidating whatever is no longer fresh.
         
+        Unlike get_weather_report(), stale data is not returned while it
+        is refreshed in the background: the caller (the auto-refresh of
+        on-screen data) waits for the upstream check, which is a cheap
+        conditional request when nothing changed. Unchanged data comes
+        back as the very same objects.
+        
+        Args:
+            city (str): City name
+        
+        Returns:
+            WeatherReport: The report (parts that could not be refreshed are None),
+                           or None if nothing could be refreshed
+        """
+        if self.one_call:
+            if self.locations.get(city) is None:
+                return None
+            return self._revalidate("onecall", city)
+        
+        current = self._revalidate("weather", city)
+        forecast = self._revalidate("forecast", city)
+        if current is None and forecast is None:
+            return None
+        return WeatherReport(current, forecast)
+
+    def get_current_weather_batch(self, cities):
+        """
+        Get current weather for many cities with as few requests as possible.
+
+        Fresh cached cities cost nothing. Cities with a known OpenWeatherMap
+        ID are fetched up to 20 at a time through the group endpoint. Only
+        cities never seen before are looked up individually (concurrently),
+        which also teaches us their ID for next time.
+
+        Args:
+            cities (list): City names
+
+        Returns:
+            dict: City name -> Observation (None for failures)
+        """
+        results = {}
+        by_id = {}
+        unknown = []
+
+        for city in cities:
+            found, data = self._lookup_fresh("weather", city)
+            location = self.locations.get(city)
+            if found:
+                results[city] = data
+            elif location is not None and location.id:
+                by_id.setdefault(location.id, []).append(city)
+            else:
+                unknown.append(city)
+
+        ids = list(by_id)
+        for start in range(0, len(ids), GROUP_BATCH_SIZE):
+            chunk = ids[start:start + GROUP_BATCH_SIZE]
+            try:
+                fetched, size = _inflight.do(("group", tuple(chunk)), self._fetch_group, chunk)
+            except APIError as e:
+                self._report(e, "weather group")
+                continue  # These cities stay unavailable
+
+            for city_id in chunk:
+                for city in by_id[city_id]:
+                    data = fetched.get(city_id)
+                    if data is None:
+                        # Not in the group response - fall back to a normal lookup
+                        data = self.get_current_weather(city)
+                    else:
+                        data = self._store_response("weather", city, data, size)
+                    results[city] = data
+
+        if unknown:
+            # Imported here: async_api builds on this module
+            from api.async_api import fetch_many_current_weather
+            results.update(fetch_many_current_weather(unknown))
+
+        return {city: results.get(city) for city in cities}
+
+    def get_location(self, city):
+        """
+        Get where a city is.
+
+        Answered from the geocode index when the city was seen before
+        (any weather or forecast lookup teaches it), otherwise with one
+        call to the geocoding endpoint.
+
+        Args:
+            city (str): City name
+
+        Returns:
+            Location: ID (may be None), name, lat, lon and country, or None if unknown
+        """
+        location = self.locations.get(city)
+        if location is not None:
+            return location
+
+        self.last_error = None
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching forecast for {city}: {e}")
-            return None
\ No newline at end of file
+            return _inflight.do(("geocode", normalize_city(city)), self._geocode, city)
+        except APIError as e:
+            self._report(e, f"location of {city}")
+            return None
+
+    def get_data_age(self, city, endpoint="weather"):
+        """
+        Get how old the data we have for a city is.
+
+        Args:
+            city (str): City name
+            endpoint (str): "weather" or "forecast"
+
+        Returns:
+            float: Seconds since the data was fetched, or None if not cached
+        """
+        if self.one_call:
+            endpoint = "onecall"
+        entry = _cache.peek(self._key(endpoint, city))
+        if entry is None or entry.negative:
+            return None
+        return time.time() - entry.fetched_at
+
+    def is_offline(self):
+        """Check if no weather source is currently reachable"""
+        return self.source.is_offline()
+
+    def clear_cache(self):
+        """Drop all cached weather responses"""
+        _cache.clear()
+
+    def _cached_get(self, endpoint, city):
+        """
+        Serve from cache when possible, otherwise fetch.
+
+        Stale entries are returned immediately and refreshed in the background.
+        """
+        key = self._key(endpoint, city)
+        self.last_error = None
+
+        entry = _cache.get(key)
+        if entry is not None:
+            if entry.negative:
+                self.last_error = NotFoundError(f"City not found: {city}", PROVIDER)
+            elif not entry.is_fresh():
+                self._refresh_in_background(endpoint, city, key)
+            return entry.value
+
+        # Cold start: recent data from disk renders instantly
+        stored = self.store.get(self._store_key(key))
+        stored_value = MODELS[endpoint].from_dict(stored.payload) if stored is not None else None
+        if stored is not None and time.time() - stored.fetched_at < _cache.ttl + _cache.stale_ttl:
+            _cache.put(key, stored_value, stored.size, fetched_at=stored.fetched_at,
+                       etag=stored.etag, last_modified=stored.last_modified)
+            self._refresh_in_background(endpoint, city, key)
+            return stored_value
+
+        try:
+            return self._fetch(endpoint, city, key)
+        except APIError as e:
+            self._report(e, f"{endpoint} for {city}")
+
+            if stored is not None and self.is_offline():
+                # No network - fall back to the last known data
+                _cache.put(key, stored_value, stored.size,
+                           ttl=time.time() - stored.fetched_at + OFFLINE_RETRY,
+                           fetched_at=stored.fetched_at, etag=stored.etag,
+                           last_modified=stored.last_modified)
+                return stored_value
+            return None
+
+    def _revalidate(self, endpoint, city):
+        """Fresh cached data, else fetch it now (None if that failed)"""
+        found, value = self._lookup_fresh(endpoint, city)
+        if found:
+            return value
+        
+        self.last_error = None
+        try:
+            return self._fetch(endpoint, city, self._key(endpoint, city))
+        except APIError as e:
+            self._report(e, f"{endpoint} for {city}")
+            return None
+
+    def _lookup_fresh(self, endpoint, city):
+        """
+        Check the memory cache without touching the network.
+
+        Returns:
+            tuple: (True, value) for a fresh entry, otherwise (False, None)
+        """
+        entry = _cache.get(self._key(endpoint, city))
+        if entry is not None and entry.is_fresh():
+            return True, entry.value
+        return False, None
+
+    def _key(self, endpoint, city):
+        """
+        Cache key for a city.
+
+        Located cities are keyed by where they are, so every spelling
+        of a known city shares one entry. Unknown ones use their name.
+        """
+        location = self.locations.get(city)
+        if location is None:
+            place = normalize_city(city)
+        elif location.id:
+            place = f"id:{location.id}"
+        else:
+            place = f"{location.lat:.4f},{location.lon:.4f}"
+        return (endpoint, place, self.units)
+
+    def _query_params(self, city):
+        """Request parameters asking by city ID or coordinates when known, else by name"""
+        location = self.locations.get(city)
+        if location is None:
+            params = {"q": city}
+        elif location.id:
+            params = {"id": location.id}
+        else:
+            params = {"lat": location.lat, "lon": location.lon}
+
+        params["units"] = self.units
+        return params
+
+    def _store_response(self, endpoint, city, data, size, etag=None, last_modified=None):
+        """
+        Learn the city's location from a response, decode it and cache it.
+
+        Returns:
+            Observation, Forecast or WeatherReport: The decoded response
+        """
+        if endpoint == "onecall":
+            # Nothing to learn - we asked by location
+            value = WeatherReport.from_owm(data, self.locations.get(city))
+        else:
+            self.locations.learn(city, data)
+            value = MODELS[endpoint].from_owm(data)
+        self._remember(self._key(endpoint, city), value, size, etag, last_modified)
+        return value
+
+    def _remember(self, key, value, size, etag=None, last_modified=None):
+        """Store a decoded model in the memory and persistent caches"""
+        _cache.put(key, value, size, etag=etag, last_modified=last_modified)
+        self.store.put(self._store_key(key), value.to_dict(), etag=etag, last_modified=last_modified)
+
+    def _revalidated(self, key, entry):
+        """The server confirmed a cached payload is unchanged (304)"""
+        _cache.put(key, entry.value, entry.size, etag=entry.etag, last_modified=entry.last_modified)
+        self.store.touch(self._store_key(key))
+
+    def _geocode(self, city):
+        """
+        Look a city up with the geocoding endpoint and remember it.
+
+        Raises:
+            APIError: If the lookup failed or found nothing
+        """
+        params = {"q": city, "limit": 1}
+        response = self.source.get(f"{GEO_PATH}/direct", params=params)
+        if not response.ok:
+            raise BadResponseError(f"HTTP {response.status_code}", PROVIDER)
+
+        places = decode_response(response, PROVIDER)
+        if not places:
+            raise NotFoundError(f"City not found: {city}", PROVIDER)
+
+        place = places[0]
+        location = Location(None, place.get('name', city), place['lat'], place['lon'],
+                            place.get('country', ''))
+        self.locations.put(city, location)
+        return location
+
+    def _fetch_group(self, city_ids):
+        """
+        Fetch current weather for up to 20 city IDs in one request.
+
+        Returns:
+            tuple: (city ID -> weather data, approximate bytes per city)
+
+        Raises:
+            APIError: If the request failed
+        """
+        params = {
+            "id": ",".join(str(city_id) for city_id in city_ids),
+            "units": self.units
+        }
+
+        response = self.source.get(f"{DATA_PATH}/group", params=params)
+        if not response.ok:
+            raise BadResponseError(f"HTTP {response.status_code}", PROVIDER)
+
+        items = decode_response(response, PROVIDER).get('list', [])
+        size = len(response.content) // max(len(items), 1)
+        return {item['id']: item for item in items}, size
+
+    def _remember_not_found(self, key):
+        """Remember an unknown city for a short while"""
+        _cache.put_negative(key)
+
+    def _fetch(self, endpoint, city, key):
+        """Fetch from the API, sharing the request with concurrent callers"""
+        return _inflight.do(key, self._fetch_uncoalesced, endpoint, city, key)
+
+    def _fetch_uncoalesced(self, endpoint, city, key):
+        """
+        Fetch from the API and store the result in both caches.
+
+        Raises:
+            APIError: If the data could not be fetched
+        """
+        if endpoint == "onecall":
+            path = ONE_CALL_PATH
+            location = self.locations.get(city)
+            params = {"lat": location.lat, "lon": location.lon, "units": self.units,
+                      "exclude": "minutely"}
+        else:
+            path = f"{DATA_PATH}/{endpoint}"
+            params = self._query_params(city)
+
+        # Revalidate what we already have instead of downloading it again
+        previous = _cache.peek(key)
+        headers = {}
+        if previous is not None and not previous.negative:
+            headers = conditional_headers(previous.etag, previous.last_modified)
+
+        response = self.source.get(path, params=params, headers=headers)
+
+        if headers:
+            record_revalidation(response.status_code == 304, previous.size)
+
+        if response.status_code == 304:
+            # Unchanged - reuse the already decoded object
+            self._revalidated(key, previous)
+            return previous.value
+
+        if response.status_code == 404:
+            self._remember_not_found(key)
+            raise NotFoundError(f"City not found: {city}", PROVIDER)
+
+        if not response.ok:
+            raise BadResponseError(f"HTTP {response.status_code}", PROVIDER)
+
+        data = decode_response(response, PROVIDER)
+        return self._store_response(endpoint, city, data, len(response.content),
+                                    response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+    def _refresh_in_background(self, endpoint, city, key):
+        """Refresh a stale entry without blocking the caller"""
+        with _refreshing_lock:
+            if key in _refreshing:
+                return
+            _refreshing.add(key)
+
+        def _refresh():
+            try:
+                with request_priority(VISIBLE_REFRESH):
+                    self._fetch(endpoint, city, key)
+            except APIError as e:
+                print(f"Background refresh of {endpoint} for {city} failed: {e}")
+            finally:
+                with _refreshing_lock:
+                    _refreshing.discard(key)
+
+        threading.Thread(target=_refresh, daemon=True).start()
+
+    def _report(self, error, what):
+        """Keep the error for the caller and log it"""
+        self.last_error = error
+        print(f"Error fetching {what}: {error}")
+
+    def _store_key(self, key):
+        """Persistent cache key for a memory cache key"""
+        return "weather:" + ":".join(key)
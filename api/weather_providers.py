@@ -0,0 +1,241 @@
+# api/weather_providers.py
+"""
+Weather data sources behind WeatherAPI, with hedged requests.
+
+The primary source is OpenWeatherMap with OPENWEATHER_API_KEY. An
+optional secondary source speaks the same API - a second key, another
+region, or a local mirror - and is set up in config.py:
+
+    SECONDARY_WEATHER_URL = "http://weather-mirror.local"  # Defaults to OWM
+    SECONDARY_WEATHER_KEY = "another_key"                  # Defaults to the primary key
+
+When the primary has not answered an interactive request within its
+usual response time (a latency percentile), the same request is sent to
+the secondary and whichever answers first wins. If the primary fails
+outright, the secondary is tried straight away.
+"""
+import contextvars
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import config
+from config import OPENWEATHER_API_KEY
+from api import transport
+from api.rate_limiter import register_limiter
+from api.priority import INTERACTIVE, current_priority
+
+OWM_HOST = "https://api.openweathermap.org"
+
+# Hedge once the primary is slower than this percentile of its recent responses
+HEDGE_PERCENTILE = getattr(config, 'WEATHER_HEDGE_PERCENTILE', 95)
+
+# Hedge delay bounds, and the delay used until enough responses were timed (seconds)
+HEDGE_MIN_DELAY = getattr(config, 'WEATHER_HEDGE_MIN_DELAY', 0.3)
+HEDGE_DEFAULT_DELAY = getattr(config, 'WEATHER_HEDGE_DEFAULT_DELAY', 1.5)
+HEDGE_MIN_SAMPLES = 20
+
+# Recent response times kept per provider
+LATENCY_SAMPLES = 200
+
+
+class WeatherProvider:
+    """One OpenWeatherMap-compatible source"""
+
+    def __init__(self, key, name, host, api_key):
+        """
+        Args:
+            key (str): Provider key for the transport (limiter, circuit breaker)
+            name (str): Display name
+            host (str): Base URL (e.g., "https://api.openweathermap.org")
+            api_key (str): API key sent as appid
+        """
+        self.key = key
+        self.name = name
+        self.host = host.rstrip("/")
+        self.api_key = api_key
+
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def get(self, path, params=None, headers=None):
+        """
+        GET a path such as "data/2.5/weather" from this source.
+
+        Returns:
+            requests.Response: The response
+
+        Raises:
+            APIError: If the source failed (see api.transport.request)
+        """
+        params = dict(params or {}, appid=self.api_key)
+        return transport.request(self.key, f"{self.host}/{path}", params=params, headers=headers,
+                                 on_attempt=self._record_latency)
+
+    def latency_percentile(self, percentile):
+        """
+        Response time below which `percentile` % of recent attempts came
+        (only time on the wire; failed and timed-out attempts count too).
+
+        Returns:
+            float: Seconds, or None if too few responses were timed
+        """
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * percentile / 100))]
+
+    def _record_latency(self, seconds):
+        with self._lock:
+            self._latencies.append(seconds)
+
+
+class HedgedSource:
+    """Sends requests to the primary, hedging or failing over to the secondary"""
+
+    def __init__(self, primary, secondary=None, percentile=HEDGE_PERCENTILE):
+        """
+        Args:
+            primary (WeatherProvider): Source asked first
+            secondary (WeatherProvider): Backup source (None disables hedging)
+            percentile (float): Primary latency percentile used as hedge delay
+        """
+        self.primary = primary
+        self.secondary = secondary
+        self.percentile = percentile
+
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="weather-hedge")
+        self._stats = {'requests': 0, 'hedged': 0, 'failovers': 0, 'secondary_wins': 0,
+                       'cancelled': 0, 'wasted': 0}
+        self._lock = threading.Lock()
+
+    def get(self, path, params=None, headers=None):
+        """
+        GET a path, from whichever source answers first.
+
+        Background requests only use the primary - hedging them would
+        spend quota to save time nobody is waiting for.
+
+        Returns:
+            requests.Response: The winning response
+
+        Raises:
+            APIError: The primary's error if both sources failed
+        """
+        if self.secondary is None or current_priority() != INTERACTIVE:
+            return self.primary.get(path, params, headers)
+
+        self._count('requests')
+        first = self._submit(self.primary, path, params, headers)
+        done, _ = wait([first], timeout=self.hedge_delay())
+
+        if done:
+            if first.exception() is None:
+                return first.result()
+            self._count('failovers')
+        else:
+            self._count('hedged')
+
+        second = self._submit(self.secondary, path, params, headers)
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    self._cancel_losers(pending)
+                    if future is second:
+                        self._count('secondary_wins')
+                    return future.result()
+
+        # Both failed - report the primary's error
+        raise first.exception()
+
+    def is_offline(self):
+        """Check if no source can currently be reached"""
+        sources = [self.primary] if self.secondary is None else [self.primary, self.secondary]
+        return all(transport.is_offline(source.key) for source in sources)
+
+    def hedge_delay(self):
+        """Seconds to give the primary before hedging"""
+        delay = self.primary.latency_percentile(self.percentile)
+        if delay is None:
+            return HEDGE_DEFAULT_DELAY
+        return min(max(delay, HEDGE_MIN_DELAY), transport.READ_TIMEOUT)
+
+    def stats(self):
+        """
+        Get hedging statistics.
+
+        Returns:
+            dict: Requests, hedged, failovers, secondary wins, and losing
+                  requests cancelled before sending / finished for nothing
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _submit(self, provider, path, params, headers):
+        # Run in a copy of the caller's context so its priority applies
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, provider.get, path, params, headers)
+
+    def _cancel_losers(self, futures):
+        """Cancel requests that lost; count the ones already on the wire"""
+        for future in futures:
+            self._count('cancelled' if future.cancel() else 'wasted')
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+
+def _create_source():
+    """Build the primary and (if configured) secondary sources"""
+    primary = WeatherProvider('openweathermap', "OpenWeatherMap", OWM_HOST, OPENWEATHER_API_KEY)
+
+    secondary_url = getattr(config, 'SECONDARY_WEATHER_URL', None)
+    secondary_key = getattr(config, 'SECONDARY_WEATHER_KEY', None)
+    if not secondary_url and not secondary_key:
+        return HedgedSource(primary)
+
+    transport.register_provider('weather_secondary', "Secondary weather source")
+    register_limiter(
+        'weather_secondary', "Secondary weather source",
+        per_minute=getattr(config, 'SECONDARY_WEATHER_CALLS_PER_MINUTE', 60),
+        monthly_quota=getattr(config, 'SECONDARY_WEATHER_MONTHLY_QUOTA', 1000000),
+    )
+    secondary = WeatherProvider('weather_secondary', "Secondary weather source",
+                                secondary_url or OWM_HOST, secondary_key or OPENWEATHER_API_KEY)
+    return HedgedSource(primary, secondary)
+
+
+_source = None
+_source_lock = threading.Lock()
+
+
+def get_weather_source():
+    """
+    Get the process-wide weather source (created on first use).
+
+    Returns:
+        HedgedSource: Shared source
+    """
+    global _source
+
+    if _source is None:
+        with _source_lock:
+            if _source is None:
+                _source = _create_source()
+    return _source
+
+
+def get_hedge_stats():
+    """
+    Get hedging statistics, or None if no secondary source is configured.
+
+    Returns:
+        dict: See HedgedSource.stats()
+    """
+    source = get_weather_source()
+    if source.secondary is None:
+        return None
+    return source.stats()
@@ -0,0 +1,77 @@
+# benchmarks/bench_decode.py
+"""
+Benchmark decoding of recorded API payloads.
+
+Compares the json backends (stdlib vs orjson, when installed) and the
+memory kept by the raw decoded tree vs the model we actually cache.
+
+Run from the project root:
+    python benchmarks/bench_decode.py
+"""
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gc
+import json
+import timeit
+import tracemalloc
+from api import json_codec
+from api.models import Forecast
+from api.rate_table import RateTable
+
+PAYLOAD_DIR = os.path.join(os.path.dirname(__file__), 'payloads')
+
+REPEAT = 2000
+
+
+def build_rate_table(data):
+    """What CurrencyAPI keeps from a /latest response"""
+    return RateTable(data['base_code'], data['conversion_rates'])
+
+
+# Recorded payload file -> model built from it
+PAYLOADS = {
+    'forecast.json': Forecast.from_owm,
+    'rates.json': build_rate_table,
+}
+
+
+def time_per_call(fn, repeat=REPEAT):
+    """Best-of-three microseconds per call"""
+    return min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def retained_bytes(build):
+    """Bytes still allocated after build() returns (its result kept alive)"""
+    build()  # Warm up decoder key caches and interned strings first
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    print(f"JSON backend in use: {json_codec.BACKEND}\n")
+
+    for name, to_model in PAYLOADS.items():
+        with open(os.path.join(PAYLOAD_DIR, name), 'rb') as f:
+            body = f.read()
+
+        print(f"{name} ({len(body):,} bytes)")
+        print(f"  json.loads              {time_per_call(lambda: json.loads(body)):8.1f} µs")
+        if json_codec.orjson is not None:
+            print(f"  orjson.loads            {time_per_call(lambda: json_codec.orjson.loads(body)):8.1f} µs")
+        print(f"  decode + model          {time_per_call(lambda: to_model(json_codec.loads(body))):8.1f} µs")
+
+        raw = retained_bytes(lambda: json_codec.loads(body))
+        model = retained_bytes(lambda: to_model(json_codec.loads(body)))
+        print(f"  kept as raw dicts       {raw:8,} bytes")
+        print(f"  kept as model           {model:8,} bytes ({model / max(raw, 1):.2f}x the raw size)\n")
+
+
+if __name__ == "__main__":
+    main()
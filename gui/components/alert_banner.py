@@ -79,45 +79,48 @@ class AlertBanner(tk.Frame):
         """Hide alert"""
         self.pack_forget()
     
-    def check_weather_alerts(self, weather_data):
+    def check_weather_alerts(self, weather_data, official_alerts=()):
         """
         Check weather data for alert conditions.
         
         Args:
-            weather_data (dict): Weather data from API
+            weather_data (Observation): Current weather from API
+            official_alerts (list): Alerts issued by weather services (One Call)
         """
         if not weather_data:
             return
         
-        alerts = []
+        # Official alerts first, then our own thresholds
+        alerts = [f"🚨 {alert.event} ({alert.sender})" if alert.sender else f"🚨 {alert.event}"
+                  for alert in official_alerts]
         
         # Check for extreme weather conditions
         try:
             # Heavy rain
-            if 'rain' in weather_data and weather_data['rain'].get('1h', 0) > 10:
+            if weather_data.rain_1h > 10:
                 alerts.append("Heavy rain expected!")
             
             # Strong winds
-            wind_speed = weather_data.get('wind', {}).get('speed', 0)
+            wind_speed = weather_data.wind_speed
             if wind_speed > 15:  # m/s (about 33 mph)
                 alerts.append(f"Strong winds: {wind_speed:.1f} m/s!")
             
             # Extreme temperatures
-            temp = weather_data.get('main', {}).get('temp', 0)
+            temp = weather_data.temp
             if temp > 35:  # Celsius
                 alerts.append(f"Extreme heat: {temp:.0f}°C!")
             elif temp < -10:
                 alerts.append(f"Extreme cold: {temp:.0f}°C!")
             
             # Storm conditions
-            weather_main = weather_data.get('weather', [{}])[0].get('main', '')
+            weather_main = weather_data.condition
             if weather_main == 'Thunderstorm':
                 alerts.append("⚡ Thunderstorm Alert!")
             elif weather_main == 'Snow':
                 alerts.append("❄️ Snow Alert!")
             
             # Poor visibility
-            visibility = weather_data.get('visibility', 10000)
+            visibility = weather_data.visibility
             if visibility < 1000:  # Less than 1km
                 alerts.append("⚠️ Poor visibility!")
             
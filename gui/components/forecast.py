@@ -8,6 +8,8 @@ Forecast display component - now with REAL API data!
 import tkinter as tk
 from gui.styles.theme import COLORS, FONTS, DIMENSIONS
 from api.weather_api import WeatherAPI
+from api.models import condition_name
+from gui.utils.tasks import LatestOnly
 from datetime import datetime
 
 class ForecastPanel(tk.Frame):
@@ -16,9 +18,14 @@ class ForecastPanel(tk.Frame):
         
         self.city = city
         self.api = WeatherAPI()
+        self._fetches = LatestOnly(self)  # A newer city replaces an older fetch
         self.forecast_data = None
         self.current_tab = "Today"
         
+        # Rows on screen as (day, icon, high, low) and their labels
+        self._rows = []
+        self._row_labels = []
+        
         self._create_widgets()
         self.update_forecast()
     
@@ -96,81 +103,147 @@ class ForecastPanel(tk.Frame):
         # Redraw forecast
         self._display_forecast()
     
-    def update_forecast(self, city=None):
-        """Fetch and display real forecast data"""
+    def update_forecast(self, city=None, forecast_data=None):
+        """
+        Fetch and display real forecast data.
+        
+        Args:
+            city (str): City to show (defaults to the current one)
+            forecast_data (Forecast): Already fetched forecast, skips the fetch
+        """
         if city:
             self.city = city
         
-        # Clear existing
-        for widget in self.forecast_container.winfo_children():
-            widget.destroy()
+        if forecast_data is not None:
+            self._fetches.cancel()
+            self._show_forecast(forecast_data)
+            return
+        
+        # Fetch forecast data in the background
+        self.show_loading()
+        self._fetches.run(self.api.get_forecast, self.city, on_done=self._show_forecast)
+    
+    def show_loading(self, city=None):
+        """Show that a forecast is on its way"""
+        if city:
+            self.city = city
         
-        # Fetch forecast data
-        self.forecast_data = self.api.get_forecast(self.city)
+        self._clear()
+        
+        tk.Label(
+            self.forecast_container,
+            text="Loading forecast...",
+            bg='white',
+            fg=COLORS['text_muted'],
+            font=FONTS['body']
+        ).pack(pady=20)
+    
+    def _show_forecast(self, forecast_data):
+        """Display a fetched forecast (or the error if there is none)"""
+        self.forecast_data = forecast_data
         
         if self.forecast_data:
             self._display_forecast()
         else:
-            tk.Label(
-                self.forecast_container,
-                text="Error loading forecast",
-                bg='white',
-                fg=COLORS['text_muted'],
-                font=FONTS['body']
-            ).pack(pady=20)
+            self.show_error()
     
-    def _display_forecast(self):
-        """Display forecast based on current tab"""
-        # Clear container
+    def show_error(self, city=None):
+        """Show that the forecast could not be loaded"""
+        if city:
+            self.city = city
+        
+        self._fetches.cancel()
+        self.forecast_data = None
+        self._clear()
+        
+        tk.Label(
+            self.forecast_container,
+            text="Error loading forecast",
+            bg='white',
+            fg=COLORS['text_muted'],
+            font=FONTS['body']
+        ).pack(pady=20)
+    
+    def _clear(self):
+        """Remove everything from the forecast list"""
         for widget in self.forecast_container.winfo_children():
             widget.destroy()
-        
+        self._rows = []
+        self._row_labels = []
+    
+    def _display_forecast(self):
+        """Display forecast based on current tab"""
         if not self.forecast_data:
+            self._clear()
             return
         
         if self.current_tab == "Today":
-            self._show_today_forecast()
+            rows = self._today_rows()
+        else:
+            rows = self._next_days_rows()
+        
+        self._show_rows(rows)
+    
+    def _show_rows(self, rows):
+        """
+        Show (day, icon, high, low) rows.
+        
+        Nothing is redrawn when the rows are unchanged, and rows with the
+        same layout are updated in place instead of being rebuilt.
+        """
+        if rows == self._rows:
+            return
+        
+        same_layout = (self._row_labels and len(rows) == len(self._rows) and
+                       all(bool(new[3]) == bool(old[3]) for new, old in zip(rows, self._rows)))
+        
+        if same_layout:
+            for labels, new, old in zip(self._row_labels, rows, self._rows):
+                for label, text, old_text in zip(labels, new, old):
+                    if label is not None and text != old_text:
+                        label.config(text=text)
         else:
-            self._show_next_days_forecast()
+            self._clear()
+            self._row_labels = [self._create_forecast_item(*row) for row in rows]
+        
+        self._rows = rows
     
-    def _show_today_forecast(self):
-        """Show today's hourly forecast"""
+    def _today_rows(self):
+        """Rows for today's hourly forecast"""
+        forecast = self.forecast_data
         today = datetime.now().date()
         
-        hourly_items = []
-        for item in self.forecast_data['list']:
-            item_date = datetime.fromtimestamp(item['dt']).date()
-            if item_date == today:
-                hourly_items.append(item)
+        hourly_slots = [i for i, dt in enumerate(forecast.dt)
+                        if datetime.fromtimestamp(dt).date() == today]
         
-        if not hourly_items:
-            hourly_items = self.forecast_data['list'][:8]  # Next 24 hours
+        if not hourly_slots:
+            hourly_slots = range(min(len(forecast), 8))  # Next 24 hours
         
-        for item in hourly_items[:8]:  # Show 8 hours
-            time = datetime.fromtimestamp(item['dt']).strftime('%H:%M')
-            icon = self._get_weather_icon(item['weather'][0]['main'])
-            temp = f"{round(item['main']['temp'])}°"
+        rows = []
+        for i in hourly_slots[:8]:  # Show 8 hours
+            time = datetime.fromtimestamp(forecast.dt[i]).strftime('%H:%M')
+            icon = self._get_weather_icon(forecast.condition(i))
+            temp = f"{round(forecast.temp[i])}°"
             
-            self._create_forecast_item(time, icon, temp, "")
+            rows.append((time, icon, temp, ""))
+        return rows
     
-    def _show_next_days_forecast(self):
-        """Show next 5 days forecast"""
+    def _next_days_rows(self):
+        """Rows for the next 5 days"""
         daily_forecasts = self._process_forecast(self.forecast_data)
         
-        for day_data in daily_forecasts[:5]:
-            self._create_forecast_item(
-                day_data['day'],
-                day_data['icon'],
-                day_data['temp_max'],
-                day_data['temp_min']
-            )
+        return [(day_data['day'], day_data['icon'], day_data['temp_max'], day_data['temp_min'])
+                for day_data in daily_forecasts[:5]]
     
     def _process_forecast(self, forecast_data):
         """Process API forecast data into daily summaries"""
+        if forecast_data.has_daily():
+            return self._daily_summaries(forecast_data)
+        
         daily_data = {}
         
-        for item in forecast_data['list']:
-            date = datetime.fromtimestamp(item['dt'])
+        for dt, temp, code in zip(forecast_data.dt, forecast_data.temp, forecast_data.condition_codes):
+            date = datetime.fromtimestamp(dt)
             day_key = date.strftime('%Y-%m-%d')
             
             if day_key not in daily_data:
@@ -180,8 +253,8 @@ class ForecastPanel(tk.Frame):
                     'conditions': []
                 }
             
-            daily_data[day_key]['temps'].append(item['main']['temp'])
-            daily_data[day_key]['conditions'].append(item['weather'][0]['main'])
+            daily_data[day_key]['temps'].append(temp)
+            daily_data[day_key]['conditions'].append(code)
         
         result = []
         sorted_days = sorted(daily_data.keys())
@@ -199,21 +272,48 @@ class ForecastPanel(tk.Frame):
             
             result.append({
                 'day': day_str,
-                'icon': self._get_weather_icon(condition),
+                'icon': self._get_weather_icon(condition_name(condition)),
                 'temp_max': f"{round(max(data['temps']))}°",
                 'temp_min': f"{round(min(data['temps']))}°"
             })
         
         return result[:5]
     
+    def _daily_summaries(self, forecast_data):
+        """Daily summaries straight from One Call's daily forecast"""
+        result = []
+        
+        for dt, low, high, code in zip(forecast_data.day_dt, forecast_data.day_temp_min,
+                                       forecast_data.day_temp_max, forecast_data.day_condition_codes):
+            date = datetime.fromtimestamp(dt)
+            
+            if date.date() == datetime.now().date():
+                day_str = "Today"
+            else:
+                day_str = date.strftime('%a %d %b')
+            
+            result.append({
+                'day': day_str,
+                'icon': self._get_weather_icon(condition_name(code)),
+                'temp_max': f"{round(high)}°",
+                'temp_min': f"{round(low)}°"
+            })
+        
+        return result[:5]
+    
     def _create_forecast_item(self, day, icon, high, low):
-        """Create a single forecast item"""
+        """
+        Create a single forecast item.
+        
+        Returns:
+            tuple: The day, icon, high and low labels (low is None if not shown)
+        """
         
         item = tk.Frame(self.forecast_container, bg='white')
         item.pack(fill="x", padx=15, pady=3)
         
         # Day/Time
-        tk.Label(
+        day_label = tk.Label(
             item,
             text=day,
             bg='white',
@@ -221,33 +321,40 @@ class ForecastPanel(tk.Frame):
             font=FONTS['body'],
             width=12,
             anchor="w"
-        ).pack(side="left")
+        )
+        day_label.pack(side="left")
         
         # Icon
-        tk.Label(
+        icon_label = tk.Label(
             item,
             text=icon,
             bg='white',
             font=('Segoe UI', 18)
-        ).pack(side="left", padx=10)
+        )
+        icon_label.pack(side="left", padx=10)
         
         # Temperatures
-        tk.Label(
+        high_label = tk.Label(
             item,
             text=high,
             bg='white',
             fg=COLORS['text_dark'],
             font=FONTS['body_bold']
-        ).pack(side="right", padx=5)
+        )
+        high_label.pack(side="right", padx=5)
         
+        low_label = None
         if low:  # Only show if we have a low temp
-            tk.Label(
+            low_label = tk.Label(
                 item,
                 text=low,
                 bg='white',
                 fg=COLORS['text_muted'],
                 font=FONTS['body']
-            ).pack(side="right")
+            )
+            low_label.pack(side="right")
+        
+        return day_label, icon_label, high_label, low_label
     
     def _get_weather_icon(self, condition):
         """Return appropriate emoji for weather condition"""
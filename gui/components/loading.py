@@ -5,6 +5,7 @@ NOW WITH REAL ANIMATION! 🔄
 """
 import tkinter as tk
 from gui.styles.theme import COLORS
+from gui.utils.activity import ACTIVE, get_activity_monitor
 import math
 
 class LoadingSpinner(tk.Canvas):
@@ -26,6 +27,9 @@ class LoadingSpinner(tk.Canvas):
         self.is_spinning = False
         self.animation_id = None
         
+        # Pauses while nobody is looking and resumes when they are back
+        get_activity_monitor().subscribe(self, self._on_activity)
+        
         self.center_x = size // 2
         self.center_y = size // 2
         self.radius = (size - line_width) // 2
@@ -55,9 +59,14 @@ class LoadingSpinner(tk.Canvas):
     
     def _animate(self):
         """Animate the spinner rotation"""
+        self.animation_id = None
         if not self.is_spinning:
             return
         
+        delay = get_activity_monitor().frame_delay(self.speed)
+        if delay is None:
+            return  # Resumed by _on_activity
+        
         # Update rotation angle
         self.angle = (self.angle + 10) % 360
         
@@ -65,7 +74,12 @@ class LoadingSpinner(tk.Canvas):
         self.itemconfig(self.arc, start=self.angle)
         
         # Schedule next frame
-        self.animation_id = self.after(self.speed, self._animate)
+        self.animation_id = self.after(delay, self._animate)
+    
+    def _on_activity(self, state):
+        """Resume a paused spinner when the user is back"""
+        if state == ACTIVE and self.is_spinning and self.animation_id is None:
+            self._animate()
     
     def update_colors(self):
         """Update colors when theme changes"""
@@ -7,12 +7,15 @@ import tkinter as tk
 import random
 from gui.styles.theme import COLORS, FONTS, DIMENSIONS
 from api.weather_api import WeatherAPI
+from gui.utils.tasks import LatestOnly
+from api.priority import VISIBLE_REFRESH, request_priority
 
 class PopularCities(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg='white')
         
         self.api = WeatherAPI()
+        self._fetches = LatestOnly(self)  # Refresh clicks replace the previous set
 
         # Large pool of cities from around the world
         self.all_cities = [
@@ -100,27 +103,53 @@ class PopularCities(tk.Frame):
             font=FONTS['body']
         )
         self.loading_label.pack(pady=20)
-        self.update_idletasks()
 
         # Load new random cities
         self.update_cities()
 
     def update_cities(self):
-        """Fetch and display real weather for 4 random world cities"""
+        """Fetch (in the background) and display real weather for 4 random world cities"""
 
-        # Destroy loading label if it still exists
+        # Pick 4 random cities from the global pool
+        selected_cities = random.sample(self.all_cities, 4)
+        
+        # One batched request instead of one per city. Nobody searched for
+        # these, so a search in the meantime goes first.
+        with request_priority(VISIBLE_REFRESH):
+            self._fetches.run(self.api.get_current_weather_batch, selected_cities,
+                              on_done=lambda results: self._show_cities(selected_cities, results),
+                              on_error=self._show_error)
+
+    def _show_error(self, error):
+        """Replace the loading message when the batch failed"""
+        print(f"Error loading popular cities: {error}")
+        
         for widget in self.cities_container.winfo_children():
             widget.destroy()
+        
+        message = getattr(error, 'user_message', "Please check your connection")
+        tk.Label(
+            self.cities_container,
+            text=f"⚠️ Couldn't load cities\n{message}\nPress 🔄 to try again",
+            bg='white',
+            fg=COLORS['text_muted'],
+            font=FONTS['body'],
+            justify="center"
+        ).pack(pady=20)
 
-        # Pick 4 random cities from the global pool
-        selected_cities = random.sample(self.all_cities, 4)
+    def _show_cities(self, selected_cities, results):
+        """Display fetched weather for the selected cities"""
+
+        # Destroy loading label if it still exists
+        for widget in self.cities_container.winfo_children():
+            widget.destroy()
         
         for city in selected_cities:
-            weather_data = self.api.get_current_weather(city)
+            weather_data = results.get(city)
             
             if weather_data:
-                temp = round(weather_data['main']['temp'])
-                condition = weather_data['weather'][0]['main']
+                temp = round(weather_data.temp)
+                condition = weather_data.condition
                 icon = self._get_weather_icon(condition)
                 
                 self._create_city_item(city, icon, f"{temp}°C", condition)
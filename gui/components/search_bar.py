@@ -1,9 +1,20 @@
 # gui/components/search_bar.py
 """
 City search bar component.
+Suggests cities from the offline city index while typing (when it is installed).
 """
 import tkinter as tk
 from gui.styles.theme import COLORS, FONTS, DIMENSIONS
+from api.city_index import get_city_index
+
+# Suggestions shown at most
+MAX_SUGGESTIONS = 6
+
+# Characters typed before suggestions appear
+MIN_CHARS = 2
+
+# Keys that move through the suggestions rather than change the text
+NAVIGATION_KEYS = {'Up', 'Down', 'Return', 'KP_Enter', 'Escape', 'Tab'}
 
 class SearchBar(tk.Frame):
     """Search input for cities"""
@@ -13,13 +24,21 @@ class SearchBar(tk.Frame):
         
         self.on_search = on_search_callback
         
+        # The search currently being fetched (set_busy), if any
+        self.busy = False
+        self._last_query = None
+        
+        # Offline city index (None if not installed) and what it suggested
+        self.index = get_city_index()
+        self._suggested = []
+        
         self._create_widgets()
     
     def _create_widgets(self):
         """Create search input"""
         
         # Container
-        search_frame = tk.Frame(self, bg='white')
+        self.search_frame = search_frame = tk.Frame(self, bg='white')
         search_frame.pack(fill="x", padx=20, pady=20)
         
         # Search icon
@@ -46,9 +65,13 @@ class SearchBar(tk.Frame):
         self.entry.bind('<Return>', self._on_enter)
         self.entry.bind('<FocusIn>', self._on_focus_in)
         self.entry.bind('<FocusOut>', self._on_focus_out)
+        self.entry.bind('<KeyRelease>', self._on_type)
+        self.entry.bind('<Down>', lambda e: self._move_selection(1))
+        self.entry.bind('<Up>', lambda e: self._move_selection(-1))
+        self.entry.bind('<Escape>', lambda e: self._hide_suggestions())
         
         # Search button
-        search_btn = tk.Label(
+        self.search_btn = search_btn = tk.Label(
             search_frame,
             text="→",
             bg='white',
@@ -59,6 +82,24 @@ class SearchBar(tk.Frame):
         )
         search_btn.pack(side="right")
         search_btn.bind('<Button-1>', lambda e: self._on_enter())
+        
+        # Suggestions (only packed while there are some)
+        self.suggestion_list = tk.Listbox(
+            self,
+            bg='white',
+            fg=COLORS['text_dark'],
+            font=FONTS['body'],
+            bd=0,
+            highlightthickness=0,
+            activestyle='none',
+            selectbackground=COLORS['accent_blue'],
+            selectforeground='white',
+            cursor='hand2',
+            exportselection=False
+        )
+        self.suggestion_list.bind('<ButtonRelease-1>', self._on_suggestion_click)
+        self.suggestion_list.bind('<Return>', self._on_enter)
+        self.suggestion_list.bind('<FocusOut>', lambda e: self.after(100, self._hide_if_unfocused))
     
     def _on_focus_in(self, event):
         """Clear placeholder on focus"""
@@ -71,14 +112,128 @@ class SearchBar(tk.Frame):
         if not self.entry.get():
             self.entry.insert(0, "Search for a city...")
             self.entry.config(fg=COLORS['text_muted'])
+        
+        # Later - focus may be moving to the suggestion list
+        self.after(100, self._hide_if_unfocused)
+    
+    def _hide_if_unfocused(self):
+        """Hide the suggestions once neither the entry nor the list has focus"""
+        try:
+            focused = self.focus_get()
+        except KeyError:
+            focused = None  # Focus is in a Tk-internal popup
+        if focused not in (self.entry, self.suggestion_list):
+            self._hide_suggestions()
+    
+    def _on_type(self, event):
+        """Update the suggestions for what has been typed so far"""
+        if self.index is None or event.keysym in NAVIGATION_KEYS:
+            return
+        
+        text = self.entry.get().strip()
+        if len(text) < MIN_CHARS or text == "Search for a city...":
+            self._hide_suggestions()
+            return
+        
+        self._show_suggestions(self.index.suggest(text, MAX_SUGGESTIONS))
+    
+    def _show_suggestions(self, suggestions):
+        """Fill the suggestion list (hidden when there are none)"""
+        self._suggested = suggestions
+        self.suggestion_list.delete(0, tk.END)
+        if not suggestions:
+            self._hide_suggestions()
+            return
+        
+        for suggestion in suggestions:
+            self.suggestion_list.insert(tk.END, f"📍 {suggestion.label}")
+        self.suggestion_list.config(height=len(suggestions))
+        
+        if not self.suggestion_list.winfo_manager():
+            self.search_frame.pack_configure(pady=(20, 0))
+            self.suggestion_list.pack(fill="x", padx=20, pady=(0, 20))
+    
+    def _hide_suggestions(self):
+        """Remove the suggestion list"""
+        self._suggested = []
+        if self.suggestion_list.winfo_manager():
+            self.suggestion_list.pack_forget()
+            self.search_frame.pack_configure(pady=20)
+    
+    def _move_selection(self, step):
+        """Move the highlighted suggestion with the arrow keys"""
+        if not self._suggested:
+            return
+        
+        current = self.suggestion_list.curselection()
+        index = (current[0] + step) if current else (0 if step > 0 else len(self._suggested) - 1)
+        index = max(0, min(index, len(self._suggested) - 1))
+        
+        self.suggestion_list.selection_clear(0, tk.END)
+        self.suggestion_list.selection_set(index)
+        self.suggestion_list.see(index)
+        return "break"
+    
+    def _on_suggestion_click(self, event):
+        """Search the clicked suggestion"""
+        selected = self.suggestion_list.curselection()
+        if selected:
+            self._choose(self._suggested[selected[0]])
+    
+    def _choose(self, suggestion):
+        """Search a suggested city - its ID and coordinates are already known"""
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, suggestion.label)
+        self._hide_suggestions()
+        self._search(suggestion.label, suggestion.location)
     
     def _on_enter(self, event=None):
         """Handle search on Enter key"""
+        # A highlighted suggestion wins over the typed text
+        selected = self.suggestion_list.curselection() if self._suggested else ()
+        if selected:
+            self._choose(self._suggested[selected[0]])
+            return
+        
         city = self.entry.get().strip()
         
-        if city and city != "Search for a city...":
+        if not city or city == "Search for a city...":
+            return
+        
+        self._hide_suggestions()
+        
+        # A city the index knows unambiguously by this exact name needs no lookup upstream
+        location = self.index.find(city) if self.index is not None else None
+        self._search(city, location)
+    
+    def _search(self, city, location=None):
+        """
+        Start a search unless the same one is already running.
+        
+        Args:
+            city (str): City name or suggestion label
+            location (Location): Where it is, if known
+        """
+        # Enter pressed again for the search already running - nothing new to do
+        if self.busy and city.casefold() == self._last_query:
+            return
+        
+        self._last_query = city.casefold()
+        if location is not None:
+            self.on_search(city, location)
+        else:
             self.on_search(city)
     
+    def set_busy(self, busy):
+        """
+        Show whether the latest search is still loading.
+        
+        Args:
+            busy (bool): True while its results are on the way
+        """
+        self.busy = busy
+        self.search_btn.config(text="⏳" if busy else "→")
+    
     def update_colors(self):
         """Update colors when theme changes"""
         self.config(bg=COLORS['bg_primary'])
\ No newline at end of file
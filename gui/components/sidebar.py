@@ -3,7 +3,7 @@
 import tkinter as tk
 import os
 from gui.styles.theme import COLORS
-from gui.utils.icon_loader import load_icon
+from gui.utils.icon_loader import load_icon_async
 
 
 class Sidebar(tk.Frame):
@@ -26,19 +26,14 @@ class Sidebar(tk.Frame):
         logo_frame = tk.Frame(self, bg=COLORS['bg_primary'])
         logo_frame.pack(pady=25)
 
-        logo_icon = load_icon(
-            os.path.join("assets/icons", "cloud.png"),
-            size=50,
-            color="#ffffff"
-        )
-
-        self.icons["logo"] = logo_icon
-
-        tk.Label(
+        logo = tk.Label(
             logo_frame,
-            image=logo_icon,
+            image=self._placeholder("logo", 50),
             bg=COLORS['bg_primary']
-        ).pack()
+        )
+        logo.pack()
+
+        self._load_icon(logo, "logo", "cloud.png", 50)
 
         # ================= Navigation =================
         nav_container = tk.Frame(self, bg=COLORS['bg_primary'])
@@ -59,25 +54,30 @@ class Sidebar(tk.Frame):
         container.pack(fill="x")
         container.pack_propagate(False)
 
-        icon_path = os.path.join("assets/icons", icon_file)
-
-        icon = load_icon(
-            icon_path,
-            size=35,
-            color="#ffffff"
-        )
-
-        self.icons[view] = icon
-
         btn = tk.Label(
             container,
-            image=icon,
+            image=self._placeholder(view, 35),
             bg=COLORS['bg_primary'],
             cursor="hand2"
         )
+        self._load_icon(btn, view, icon_file, 35)
 
         btn.place(relx=0.5, rely=0.5, anchor="center")
 
         btn.bind("<Enter>", lambda e: btn.config(bg=COLORS['accent_blue']))
         btn.bind("<Leave>", lambda e: btn.config(bg=COLORS['bg_primary']))
-        btn.bind("<Button-1>", lambda e: self.on_navigate(view))
\ No newline at end of file
+        btn.bind("<Button-1>", lambda e: self.on_navigate(view))
+
+    def _placeholder(self, name, size):
+        """Blank image of the icon's size, so the layout doesn't jump when it arrives"""
+        self.icons[name] = tk.PhotoImage(width=size, height=size)
+        return self.icons[name]
+
+    def _load_icon(self, label, name, icon_file, size):
+        """Render an icon in the background and show it on the label"""
+        def show(icon):
+            label.config(image=icon)
+            self.icons[name] = icon  # Keep a reference, or Tk drops the image
+
+        load_icon_async(self, os.path.join("assets/icons", icon_file), size,
+                        color="#ffffff", on_done=show)
@@ -11,7 +11,7 @@ class SummaryChart(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg='white')
         
-        self.hourly_data = []
+        self.forecast = None
         self.current_tab = "Hourly"
         self._create_widgets()
     
@@ -87,9 +87,9 @@ class SummaryChart(tk.Frame):
         """Show hourly temperature view"""
         self.chart_canvas.delete('all')
         
-        if self.hourly_data:
-            temps = [item['main']['temp'] for item in self.hourly_data[:8]]
-            times = [datetime.fromtimestamp(item['dt']).strftime('%H:%M') for item in self.hourly_data[:8]]
+        if self.forecast:
+            temps = self.forecast.temp[:8]
+            times = [datetime.fromtimestamp(dt).strftime('%H:%M') for dt in self.forecast.dt[:8]]
             self._draw_temperature_chart(temps, times, "Hourly")
         else:
             self._show_placeholder("Hourly temperature data\nwill appear here")
@@ -98,17 +98,24 @@ class SummaryChart(tk.Frame):
         """Show daily temperature view"""
         self.chart_canvas.delete('all')
         
-        if self.hourly_data:
-            # Get daily averages (every 8th item = 1 day)
+        if self.forecast and self.forecast.has_daily():
+            # One Call: midpoint of each day's low and high
+            forecast = self.forecast
+            daily_temps = [(low + high) / 2 for low, high in
+                           zip(forecast.day_temp_min[:5], forecast.day_temp_max[:5])]
+            daily_labels = [datetime.fromtimestamp(dt).strftime('%a') for dt in forecast.day_dt[:5]]
+            
+            self._draw_temperature_chart(daily_temps, daily_labels, "Daily")
+        elif self.forecast:
+            # Get daily averages (every 8th slot = 1 day)
             daily_temps = []
             daily_labels = []
             
-            for i in range(0, min(len(self.hourly_data), 40), 8):
-                day_items = self.hourly_data[i:i+8]
-                avg_temp = sum(item['main']['temp'] for item in day_items) / len(day_items)
-                daily_temps.append(avg_temp)
+            for i in range(0, min(len(self.forecast), 40), 8):
+                day_temps = self.forecast.temp[i:i+8]
+                daily_temps.append(sum(day_temps) / len(day_temps))
                 
-                date = datetime.fromtimestamp(day_items[0]['dt'])
+                date = datetime.fromtimestamp(self.forecast.dt[i])
                 daily_labels.append(date.strftime('%a'))
             
             self._draw_temperature_chart(daily_temps, daily_labels, "Daily")
@@ -119,18 +126,18 @@ class SummaryChart(tk.Frame):
         """Show detailed weather info"""
         self.chart_canvas.delete('all')
         
-        if self.hourly_data and len(self.hourly_data) > 0:
-            item = self.hourly_data[0]
+        if self.forecast:
+            forecast = self.forecast
             
-            # Draw details
+            # Draw details of the first slot
             y = 30
             details = [
-                f"🌡️ Temperature: {item['main']['temp']:.1f}°C",
-                f"🌡️ Feels Like: {item['main']['feels_like']:.1f}°C",
-                f"💧 Humidity: {item['main']['humidity']}%",
-                f"💨 Wind: {item.get('wind', {}).get('speed', 0):.1f} m/s",
-                f"☁️ Clouds: {item.get('clouds', {}).get('all', 0)}%",
-                f"⏲️ Pressure: {item['main']['pressure']} hPa",
+                f"🌡️ Temperature: {forecast.temp[0]:.1f}°C",
+                f"🌡️ Feels Like: {forecast.feels_like[0]:.1f}°C",
+                f"💧 Humidity: {forecast.humidity[0]}%",
+                f"💨 Wind: {forecast.wind_speed[0]:.1f} m/s",
+                f"☁️ Clouds: {forecast.clouds[0]}%",
+                f"⏲️ Pressure: {forecast.pressure[0]} hPa",
             ]
             
             for detail in details:
@@ -156,12 +163,12 @@ class SummaryChart(tk.Frame):
         )
     
     def update_chart(self, forecast_data):
-        """Update chart with forecast data"""
-        if not forecast_data or 'list' not in forecast_data:
+        """Update chart with a Forecast"""
+        if not forecast_data:
             return
         
-        # Store hourly data
-        self.hourly_data = forecast_data['list']
+        # Keep the forecast (column arrays, not per-slot dicts)
+        self.forecast = forecast_data
         
         # Redraw current view
         if self.current_tab == "Hourly":
@@ -8,8 +8,10 @@ import tkinter as tk
 from gui.styles.theme import COLORS, FONTS, DIMENSIONS
 from api.weather_api import WeatherAPI
 from gui.components.loading import LoadingSpinner 
+from gui.utils.tasks import LatestOnly
 from utils.favorites import add_favorite, is_favorite, remove_favorite
 from utils.favorites import add_favorite, is_favorite
+from utils.formatting import format_age
 
 class CurrentWeatherCard(tk.Frame):
     """Large card displaying current weather conditions from API"""
@@ -22,6 +24,7 @@ class CurrentWeatherCard(tk.Frame):
         
         self.city = city
         self.api = WeatherAPI()
+        self._fetches = LatestOnly(self)  # A newer city replaces an older fetch
         
         self._create_widgets()
         self.update_weather()  # Fetch real data on startup
@@ -138,50 +141,110 @@ class CurrentWeatherCard(tk.Frame):
             value_label.pack(anchor="w")
             self.detail_labels[key] = value_label
     
-    def update_weather(self, city=None):
-        """Fetch and display real weather data from API"""
+    def update_weather(self, city=None, weather_data=None):
+        """
+        Fetch and display real weather data from API.
+        
+        The fetch runs in the background; the card shows a loading state
+        until the data arrives.
+        
+        Args:
+            city (str): City to show (defaults to the current one)
+            weather_data (Observation): Already fetched weather, skips the fetch
+        """
+        if city:
+            self.city = city
+        
+        if weather_data is not None:
+            self._fetches.cancel()
+            self._show_weather(weather_data)
+            return
+        
+        self.show_loading()
+        
+        def fetch(city):
+            return self.api.get_current_weather(city), self.api.last_error
+        
+        self._fetches.run(fetch, self.city, on_done=lambda result: self._show_weather(*result))
+    
+    def show_loading(self, city=None):
+        """Show that weather for a city is on its way"""
         if city:
             self.city = city
         
-        # Fetch weather data
-        weather_data = self.api.get_current_weather(self.city)
+        self.desc_label.config(text="Loading weather...")
+        self.date_label.config(text="⏳ Updating...")
+    
+    def _show_weather(self, weather_data, error=None):
+        """
+        Display fetched weather (or the error if there is none).
         
+        Only labels whose text changed are touched, so an automatic
+        refresh with the same values does not redraw the card.
+        """
         if weather_data:
             # Update city name
-            self.city_label.config(text=weather_data['name'])
+            self._set_text(self.city_label, weather_data.name)
             
             # Update temperature
-            temp = round(weather_data['main']['temp'])
-            self.temp_label.config(text=f"{temp}°C")
+            temp = round(weather_data.temp)
+            self._set_text(self.temp_label, f"{temp}°C")
             
             # Update description
-            description = weather_data['weather'][0]['description'].title()
-            self.desc_label.config(text=description)
+            description = weather_data.description.title()
+            self._set_text(self.desc_label, description)
             
             # Update weather icon based on condition
-            icon = self._get_weather_icon(weather_data['weather'][0]['main'])
-            self.icon_label.config(text=icon)
+            icon = self._get_weather_icon(weather_data.condition)
+            self._set_text(self.icon_label, icon)
             
             # Update details
-            self.detail_labels['humidity'].config(text=f"{weather_data['main']['humidity']}%")
-            self.detail_labels['wind'].config(text=f"{weather_data['wind']['speed']} m/s")
+            self._set_text(self.detail_labels['humidity'], f"{weather_data.humidity}%")
+            self._set_text(self.detail_labels['wind'], f"{weather_data.wind_speed} m/s")
             
             # 🐛 BUG #5 FIXED: Ensure feels_like is properly displayed
-            feels_like_temp = round(weather_data['main']['feels_like'])
-            self.detail_labels['feels_like'].config(text=f"{feels_like_temp}°C")
+            feels_like_temp = round(weather_data.feels_like)
+            self._set_text(self.detail_labels['feels_like'], f"{feels_like_temp}°C")
             
-            self.detail_labels['pressure'].config(text=f"{weather_data['main']['pressure']} hPa")
+            self._set_text(self.detail_labels['pressure'], f"{weather_data.pressure} hPa")
             
             # 🐛 BUGS #2 & #3 FIXED: Full date with year, month, day AND 12-hour time with AM/PM
             # OLD: now = datetime.now().strftime("%A, %H:%M")  # Only "Wednesday, 14:30"
             # NEW: Full date with AM/PM
             from datetime import datetime
             now = datetime.now().strftime("%A, %B %d, %Y • %I:%M %p")  # "Wednesday, February 13, 2026 • 02:30 PM"
-            self.date_label.config(text=now)
+            
+            # Mark cached data when we are offline or it is getting old
+            age = self.api.get_data_age(self.city)
+            if self.api.is_offline() and age is not None:
+                now = f"📴 Offline • data from {format_age(age)}"
+            elif age is not None and age > 15 * 60:
+                now = f"{now} • updated {format_age(age)}"
+            
+            self._set_text(self.date_label, now)
         else:
-            # Show error if API fails
-            self.city_label.config(text="Error loading weather")
-            self.desc_label.config(text="Please check your connection")
+            self.show_error(error)
+    
+    def _set_text(self, label, text):
+        """Update a label only if its text differs"""
+        if label.cget('text') != text:
+            label.config(text=text)
+    
+    def show_error(self, error=None, city=None):
+        """
+        Show that the weather could not be loaded.
+        
+        Args:
+            error (APIError): Why, if known
+            city (str): City that failed (defaults to the current one)
+        """
+        if city:
+            self.city = city
+        
+        self._fetches.cancel()
+        self.city_label.config(text="Error loading weather")
+        self.desc_label.config(text=error.user_message if error else "Please check your connection")
+        self.date_label.config(text="")
     
     def _get_weather_icon(self, condition):
         """Return appropriate emoji for weather condition"""
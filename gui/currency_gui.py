@@ -10,8 +10,16 @@ from datetime import datetime
 from tkinter import filedialog
 import tkinter as tk
 from tkinter import ttk
+import config
 from gui.styles.theme import COLORS, FONTS
 from api.currency_api import CurrencyAPI
+from utils.formatting import format_age
+from gui.utils.tasks import LatestOnly
+from gui.utils.auto_refresh import AutoRefresher
+
+# Seconds between checks of the shown conversion when the rates do not say
+# when they are next updated (a local rate file)
+RATES_REFRESH_INTERVAL = getattr(config, 'RATES_REFRESH_INTERVAL', 3600)
 
 class CurrencyConverter(tk.Frame):
     """Currency converter view - SINGLE WIDE BOX!"""
@@ -20,8 +28,15 @@ class CurrencyConverter(tk.Frame):
         super().__init__(parent, bg=COLORS['bg_primary'])
         
         self.api = CurrencyAPI()
+        self._conversions = LatestOnly(self)  # Only the newest conversion is shown
         self.conversion_history = []
         
+        # The conversion on screen, re-checked when new rates are due
+        self._shown_conversion = None
+        self._refresher = AutoRefresher(self, self._fetch_refresh, self._apply_refresh,
+                                        interval=RATES_REFRESH_INTERVAL,
+                                        next_due=self._seconds_until_new_rates)
+        
         self._create_widgets()
     
     def _create_widgets(self):
@@ -233,6 +248,12 @@ class CurrencyConverter(tk.Frame):
     
     def _convert(self):
         """Perform conversion"""
+        # Whatever happens, an older conversion still running is now stale,
+        # and the one on screen is no longer kept up to date
+        self._conversions.cancel()
+        self._refresher.stop()
+        self._shown_conversion = None
+        
         try:
             amount_str = self.amount_entry.get().strip()
             
@@ -252,33 +273,97 @@ class CurrencyConverter(tk.Frame):
             
             self.result_label.config(text="⏳ Converting...", fg='#4A5568')
             self.rate_label.config(text="")
-            self.update_idletasks()
             
-            result = self.api.convert_currency(amount, from_curr, to_curr)
+            # Rates may need fetching - keep the window responsive meanwhile
+            def convert():
+                return self.api.convert_currency(amount, from_curr, to_curr), self.api.last_error
             
+            self._conversions.run(convert,
+                                  on_done=lambda outcome: self._show_conversion(*outcome),
+                                  on_error=self._show_conversion_error)
+                
+        except ValueError:
+            self.result_label.config(text="❌ Invalid amount", fg='#E53E3E')
+            self.rate_label.config(text="Enter a valid number", fg='#E53E3E')
+        except Exception as e:
+            self._show_conversion_error(e)
+    
+    def _show_conversion(self, result, error=None):
+        """Display a finished conversion (or why it failed)"""
+        try:
             if result:
-                self.result_label.config(
-                    text=f"✅ {result['converted']:,.2f} {result['to_currency']}",
-                    fg='#48BB78'
-                )
-                self.rate_label.config(
-                    text=f"Exchange Rate: 1 {from_curr} = {result['rate']:.4f} {to_curr}",
-                    fg='#4A5568'
-                )
+                self._render_conversion(result)
                 
                 # Add to history
                 self._add_to_history(result)
                 self.conversion_history.append(result)
+                
+                # Keep it current as new rates come in
+                self._shown_conversion = result
+                self._refresher.restart()
             else:
                 self.result_label.config(text="❌ Conversion failed", fg='#E53E3E')
-                self.rate_label.config(text="Check internet connection", fg='#E53E3E')
+                self.rate_label.config(text=error.user_message if error else "Check internet connection",
+                                       fg='#E53E3E')
                 
-        except ValueError:
-            self.result_label.config(text="❌ Invalid amount", fg='#E53E3E')
-            self.rate_label.config(text="Enter a valid number", fg='#E53E3E')
         except Exception as e:
-            self.result_label.config(text="❌ Error occurred", fg='#E53E3E')
-            self.rate_label.config(text=str(e), fg='#E53E3E')
+            self._show_conversion_error(e)
+    
+    def _render_conversion(self, result):
+        """Show a conversion result, touching only the labels that change"""
+        from_curr, to_curr = result['from_currency'], result['to_currency']
+        result_text = f"✅ {result['converted']:,.2f} {to_curr}"
+        rate_text = f"Exchange Rate: 1 {from_curr} = {result['rate']:.4f} {to_curr}"
+        
+        # When the provider published these rates
+        as_of = self.api.get_rates_as_of()
+        if as_of:
+            rate_text += f"\n🕒 Rates as of {datetime.fromtimestamp(as_of).strftime('%d %b %Y, %H:%M')}"
+        
+        # Mark stored rates when we are offline
+        age = self.api.get_rates_age()
+        if self.api.is_offline() and age is not None:
+            rate_text += f"\n📴 Offline • rates from {format_age(age)}"
+        
+        for label, text, color in ((self.result_label, result_text, '#48BB78'),
+                                   (self.rate_label, rate_text, '#4A5568')):
+            if label.cget('text') != text or label.cget('fg') != color:
+                label.config(text=text, fg=color)
+    
+    def _fetch_refresh(self):
+        """Redo the conversion on screen with the current rates (worker thread)"""
+        shown = self._shown_conversion
+        return shown, self.api.convert_currency(shown['amount'], shown['from_currency'],
+                                                shown['to_currency'])
+    
+    def _apply_refresh(self, outcome):
+        """
+        Update the shown conversion if the rate moved.
+        
+        Returns:
+            bool: True if the result changed
+        """
+        shown, result = outcome
+        if shown is not self._shown_conversion or result is None:
+            return False
+        
+        # The as-of line may change even when the rate does not
+        self._render_conversion(result)
+        if result['rate'] == shown['rate']:
+            return False
+        
+        self._shown_conversion = result
+        return True
+    
+    def _seconds_until_new_rates(self):
+        """When the next rates are due, with a little slack for the refresh itself"""
+        due = self.api.get_seconds_until_update()
+        return None if due is None else due + 30
+    
+    def _show_conversion_error(self, error):
+        """Display an unexpected conversion error"""
+        self.result_label.config(text="❌ Error occurred", fg='#E53E3E')
+        self.rate_label.config(text=str(error), fg='#E53E3E')
     
     def _add_to_history(self, conversion_data):
         """Add to history - VISIBLE!"""
@@ -11,6 +11,16 @@ from gui.components.sidebar import Sidebar
 from gui.components.theme_toggle import ThemeToggle
 from gui.currency_gui import CurrencyConverter
 from gui.components.favorites import FavoritesPanel
+from gui.utils.tasks import run_in_background
+from gui.utils.activity import ACTIVE, get_activity_monitor
+from api.prefetch import get_prefetcher, INTERVAL as PREFETCH_INTERVAL
+
+# Seconds before the first prefetch (let the initial load finish) and
+# between checks while the upstream is busy
+PREFETCH_DELAY = 30
+
+# Stop prefetching once nobody has used the window for this long (seconds)
+PREFETCH_AWAY_LIMIT = 30 * 60
 
 class WeatherApp:
     def __init__(self, root):
@@ -25,8 +35,16 @@ class WeatherApp:
         # Set background color
         self.root.configure(bg=COLORS['bg_primary'])
         
+        # Follow focus, minimizing and input so idle windows do less work
+        self.activity = get_activity_monitor()
+        self.activity.install(self.root)
+        
         self.current_view_name = "weather"
         self._create_layout()
+        
+        # Warm the cache for the cities likely to be opened next
+        self._prefetch_id = self.root.after(PREFETCH_DELAY * 1000, self._prefetch)
+        self.activity.subscribe(self.root, self._resume_prefetch)
     
     def _create_layout(self):
         """Create the main layout"""
@@ -166,7 +184,8 @@ class WeatherApp:
         # Load new view with CURRENT colors
         if view_name == "weather":
             from gui.weather_dashboard import WeatherDashboard
-            self.current_view = WeatherDashboard(self.content_frame)
+            self.current_view = WeatherDashboard(self.content_frame,
+                                                 on_alerts=self.alert_banner.check_weather_alerts)
         
         elif view_name == "currency":
             self.current_view = CurrencyConverter(self.content_frame)
@@ -196,6 +215,27 @@ class WeatherApp:
         self.switch_view("weather")
         self.root.after(100, lambda: self._update_weather_city(city_name))
     
+    def _prefetch(self):
+        """Prefetch likely cities when nothing else is going on, then check again later"""
+        self._prefetch_id = None
+        
+        # Nobody around to open anything - wait for them (see _resume_prefetch)
+        if self.activity.idle_for() > PREFETCH_AWAY_LIMIT:
+            return
+        
+        prefetcher = get_prefetcher()
+        if not prefetcher.should_run():
+            self._prefetch_id = self.root.after(PREFETCH_DELAY * 1000, self._prefetch)
+            return
+        
+        run_in_background(self.root, prefetcher.run)
+        self._prefetch_id = self.root.after(PREFETCH_INTERVAL * 1000, self._prefetch)
+    
+    def _resume_prefetch(self, state):
+        """Restart prefetching stopped while the user was away"""
+        if state == ACTIVE and self._prefetch_id is None:
+            self._prefetch_id = self.root.after(PREFETCH_DELAY * 1000, self._prefetch)
+    
     def _update_weather_city(self, city_name):
         """Update weather view with city"""
         if hasattr(self.current_view, 'update_city'):
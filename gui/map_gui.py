@@ -7,8 +7,15 @@ Map display component with PROFESSIONAL, SUBTLE animation!
 import tkinter as tk
 from tkinter import ttk
 from gui.styles.theme import COLORS, FONTS, DIMENSIONS
+from gui.utils.activity import ACTIVE, get_activity_monitor, is_on_screen
 import math
 
+# Milliseconds between animation frames while the user is active (~33 FPS)
+FRAME_INTERVAL = 30
+
+# Milliseconds between checks whether the map was scrolled back into view
+OFFSCREEN_CHECK = 500
+
 class WeatherMap(tk.Frame):
     """Professional weather map visualization"""
     
@@ -21,6 +28,7 @@ class WeatherMap(tk.Frame):
         self.animation_step = 0
         self.is_animating = False
         self.pulse_size = 0
+        self._frame_id = None
         
         self.pack_propagate(False)
         
@@ -193,13 +201,25 @@ class WeatherMap(tk.Frame):
         """Start subtle animation"""
         if not self.is_animating:
             self.is_animating = True
+            get_activity_monitor().subscribe(self, self._on_activity)
             self._animate()
     
     def _animate(self):
         """Gentle pulse animation - NO childish movements!"""
+        self._frame_id = None
         if not self.is_animating:
             return
         
+        # Slower while nobody is using the window, paused once they have been away a while
+        delay = get_activity_monitor().frame_delay(FRAME_INTERVAL)
+        if delay is None:
+            return  # Resumed by _on_activity
+        
+        # Scrolled out of view - don't draw, just check again later
+        if not is_on_screen(self.map_canvas):
+            self._frame_id = self.after(OFFSCREEN_CHECK, self._animate)
+            return
+        
         self.animation_step += 1
         
         # Only redraw marker (not entire canvas) for performance
@@ -213,8 +233,20 @@ class WeatherMap(tk.Frame):
             center_y = height // 2
             self._draw_fixed_marker(center_x, center_y)
         
-        # Slower animation (30ms = ~33 FPS, smoother)
-        self.after(30, self._animate)
+        self._frame_id = self.after(delay, self._animate)
+    
+    def _on_activity(self, state):
+        """Resume a paused animation when the user is back"""
+        if state == ACTIVE and self._frame_id is None:
+            self._animate()
+    
+    def destroy(self):
+        """Stop the animation before the widget goes away"""
+        self.is_animating = False
+        if self._frame_id is not None:
+            self.after_cancel(self._frame_id)
+            self._frame_id = None
+        super().destroy()
     
     def _on_resize(self, event=None):
         """Handle canvas resize"""
@@ -234,6 +266,17 @@ class WeatherMap(tk.Frame):
         # Redraw map
         self._draw_map()
     
+    def set_status(self, text, color='#48BB78'):
+        """
+        Show the data status in the header (e.g., "● Live").
+        
+        Args:
+            text (str): Status text
+            color (str): Text color
+        """
+        if self.status_label.cget('text') != text or self.status_label.cget('fg') != color:
+            self.status_label.config(text=text, fg=color)
+    
     def update_colors(self):
         """Update colors when theme changes"""
         self.config(bg=COLORS['bg_card'])
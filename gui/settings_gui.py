@@ -8,8 +8,19 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from gui.styles.theme import COLORS, FONTS, DIMENSIONS, is_dark_mode
 from utils.favorites import load_favorites, clear_favorites
+from utils.city_history import clear_history
+from utils.formatting import format_age, format_bytes
+from api.persistent_cache import get_persistent_cache
+from api.http_session import get_revalidation_stats
+from api.geocoding import get_geocode_index
+from api.rate_limiter import get_usage
+from api.weather_providers import get_hedge_stats
+from api.scheduler import get_scheduler_stats
+from api.prefetch import get_prefetch_stats
+from gui.utils.process_pool import get_job_stats
 import json
 import os
+import time
 
 # File to persist the temperature unit preference
 SETTINGS_FILE = 'settings.json'
@@ -199,7 +210,54 @@ class SettingsPage(tk.Frame):
         )
         clear_btn.pack(anchor="w", pady=(0, 20))
         
-        # SECTION 4: About
+        # SECTION 4: API Usage
+        self._create_section(content, "📊 API Usage")
+        
+        for usage in get_usage():
+            used = usage['calls_this_month'] / usage['monthly_quota']
+            tk.Label(
+                content,
+                text=(f"{usage['name']}: {usage['calls_this_month']:,} / {usage['monthly_quota']:,} "
+                      f"calls this month ({used:.0%})"),
+                bg='white',
+                fg='#E53E3E' if used >= 0.8 else COLORS['text_dark'],
+                font=FONTS['body']
+            ).pack(anchor="w")
+            
+            tk.Label(
+                content,
+                text=f"{usage['available_now']} of {usage['per_minute']} calls per minute available",
+                bg='white',
+                fg=COLORS['text_muted'],
+                font=FONTS['small']
+            ).pack(anchor="w", pady=(0, 10))
+        
+        hedging = get_hedge_stats()
+        if hedging:
+            losers = hedging['cancelled'] + hedging['wasted']
+            tk.Label(
+                content,
+                text=(f"Hedged weather requests: {hedging['hedged']} of {hedging['requests']} "
+                      f"(secondary won {hedging['secondary_wins']}, {hedging['failovers']} failovers, "
+                      f"{losers} losing requests)"),
+                bg='white',
+                fg=COLORS['text_muted'],
+                font=FONTS['small']
+            ).pack(anchor="w", pady=(0, 10))
+        
+        # How long requests queued for a connection, per priority
+        queueing = [f"{priority.replace('_', ' ')} {stats['granted']} (avg wait {stats['avg_wait'] * 1000:.0f} ms)"
+                    for priority, stats in get_scheduler_stats().items() if stats['granted']]
+        if queueing:
+            tk.Label(
+                content,
+                text="Requests: " + ", ".join(queueing),
+                bg='white',
+                fg=COLORS['text_muted'],
+                font=FONTS['small']
+            ).pack(anchor="w", pady=(0, 10))
+        
+        # SECTION 5: About
         self._create_section(content, "ℹ️ About")
         
         about_text = """
@@ -232,9 +290,35 @@ Powered by:
             justify='left'
         ).pack(anchor="w", pady=(0, 20))
         
-        # SECTION 5: Data & Cache
+        # SECTION 6: Data & Cache
         self._create_section(content, "💾 Data & Cache")
         
+        self.cache_info = tk.Label(
+            content,
+            text="",
+            bg='white',
+            fg=COLORS['text_dark'],
+            font=FONTS['body'],
+            justify='left'
+        )
+        self.cache_info.pack(anchor="w", pady=(0, 10))
+        self._update_cache_info()
+        
+        clear_cache_btn = tk.Button(
+            content,
+            text="🧹 Clear Cache",
+            bg=COLORS['accent_light'],
+            fg=COLORS['text_dark'],
+            font=FONTS['body_bold'],
+            bd=0,
+            padx=20,
+            pady=10,
+            cursor='hand2',
+            command=self._clear_cache,
+            activebackground='#CBD5E0'
+        )
+        clear_cache_btn.pack(anchor="w", pady=(0, 10))
+        
         tk.Label(
             content,
             text="Clear cached data and reset app to defaults",
@@ -303,6 +387,44 @@ Powered by:
             self.__init__(self.master)
             self.pack(fill="both", expand=True)
     
+    def _update_cache_info(self):
+        """Show what the offline cache currently holds"""
+        stats = get_persistent_cache().stats()
+        
+        text = f"Cached items: {stats['entries']} ({format_bytes(stats['file_bytes'])} on disk)"
+        if stats['oldest']:
+            text += f"\nOldest item: {format_age(time.time() - stats['oldest'])}"
+        text += f"\nKnown city locations: {len(get_geocode_index())}"
+        
+        revalidation = get_revalidation_stats()
+        if revalidation['revalidations']:
+            text += (f"\nUnchanged on refresh: {revalidation['not_modified']} of "
+                     f"{revalidation['revalidations']} ({format_bytes(revalidation['bytes_saved'])} saved)")
+        
+        prefetch = get_prefetch_stats()
+        if prefetch['warmed'] or prefetch['opens']:
+            text += (f"\nPrefetched cities: {prefetch['warmed']} ({prefetch['requests']} requests), "
+                     f"{prefetch['hits']} opened in time ({prefetch['hit_rate']:.0%}), "
+                     f"{prefetch['unused']} unused, {prefetch['misses']} opens had to wait")
+        
+        for name, job in get_job_stats().items():
+            text += (f"\nBackground job {name.rsplit('.', 1)[-1]}: {job['count']} runs, "
+                     f"avg {job['avg_total'] * 1000:.0f} ms ({job['avg_run'] * 1000:.0f} ms computing)")
+        
+        self.cache_info.config(text=text)
+    
+    def _clear_cache(self):
+        """Clear cached weather and exchange rate data"""
+        from api.weather_api import WeatherAPI
+        from api.currency_api import CurrencyAPI
+        
+        get_persistent_cache().clear()
+        WeatherAPI().clear_cache()
+        CurrencyAPI().clear_cache()
+        
+        self._update_cache_info()
+        messagebox.showinfo("Success", "Cached data has been cleared!")
+    
     def _reset_app(self):
         """Reset app to defaults"""
         if messagebox.askyesno(
@@ -316,7 +438,15 @@ Powered by:
                 # Clear favorites.json
                 with open('favorites.json', 'w') as f:
                     json.dump([], f)
+                
+                # Forget which cities were opened
+                clear_history()
 
+                # Clear cached API data
+                get_persistent_cache().clear()
+                get_geocode_index().clear()
+                self._update_cache_info()
+                
                 # Reset settings
                 save_settings({"temp_unit": "Celsius"})
                 self.temp_unit.set("Celsius")
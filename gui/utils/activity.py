@@ -0,0 +1,249 @@
+# gui/utils/activity.py
+"""
+Track whether anyone is looking at the window, so work only they would
+see can slow down or stop.
+
+The monitor follows the main window's <Map>/<Unmap> and focus events
+and the time since the last key press or mouse input:
+
+    ACTIVE  the window has focus and was used in the last IDLE_AFTER seconds
+    IDLE    the window is shown but unfocused, or nobody touched it for a while
+    HIDDEN  the window is minimized or withdrawn
+
+Animations ask frame_delay() for their next frame (full rate when
+active, a few frames a second for a while after the user leaves, then
+paused), pollers scale their interval by poll_factor(), and anything
+that paused can subscribe() to be told when the user is back.
+
+    delay = get_activity_monitor().frame_delay(30)
+    if delay is not None:
+        self.after(delay, self._animate)
+"""
+import time
+import tkinter as tk
+import config
+
+ACTIVE = "active"
+IDLE = "idle"
+HIDDEN = "hidden"
+
+# Seconds without key or mouse input before a focused window counts as idle
+IDLE_AFTER = getattr(config, 'IDLE_AFTER', 60)
+
+# Milliseconds between animation frames while idle...
+IDLE_FRAME_INTERVAL = 250
+
+# ...until the window has been idle this long (seconds); then animations pause
+PAUSE_ANIMATIONS_AFTER = 120
+
+# Multiplier for background polling intervals per state
+POLL_SLOWDOWN = {ACTIVE: 1, IDLE: 2, HIDDEN: 10}
+
+# Milliseconds to wait after a <FocusOut> before deciding the window lost focus
+# (moving focus between two widgets of the window sends one too)
+FOCUS_SETTLE = 50
+
+# Input events that count as the user being there
+INPUT_EVENTS = ("<KeyPress>", "<ButtonPress>", "<Motion>", "<MouseWheel>")
+
+
+class ActivityMonitor:
+    """Window and user activity state for the whole app"""
+
+    def __init__(self):
+        # Until install() is called (e.g. a component used on its own) everything runs at full rate
+        self._root = None
+        self.state = ACTIVE
+
+        self._mapped = True
+        self._focused = True
+        self._last_input = time.monotonic()
+        self._idle_since = None
+        self._idle_check = None
+
+        # (widget, callback) pairs told about every state change
+        self._listeners = []
+
+    def install(self, root):
+        """
+        Start following a main window. Call once, from the main thread.
+
+        Args:
+            root (tk.Tk): Main window
+        """
+        self._root = root
+        root.bind("<Map>", self._on_map, add="+")
+        root.bind("<Unmap>", self._on_unmap, add="+")
+        root.bind("<FocusIn>", self._on_focus_in, add="+")
+        root.bind("<FocusOut>", self._on_focus_out, add="+")
+
+        # Bound on the window rather than with bind_all(), which components
+        # overwrite (e.g. the dashboard's mouse wheel scrolling)
+        for sequence in INPUT_EVENTS:
+            root.bind(sequence, self._on_input, add="+")
+
+        self._update()
+
+    def subscribe(self, widget, callback):
+        """
+        Call callback(state) on the main thread whenever the state changes.
+
+        Args:
+            widget (tk.Widget): Owner; the callback is dropped once it is destroyed
+            callback (callable): Called with ACTIVE, IDLE or HIDDEN
+        """
+        self._prune()
+        self._listeners.append((widget, callback))
+
+    def idle_for(self):
+        """Seconds since the window stopped being active (0 while active)"""
+        if self._idle_since is None:
+            return 0
+        return time.monotonic() - self._idle_since
+
+    def frame_delay(self, interval):
+        """
+        Milliseconds until an animation's next frame.
+
+        Args:
+            interval (int): Frame interval while active (ms)
+
+        Returns:
+            int: Delay to use, or None if the animation should pause
+                 (subscribe() to resume it when the state becomes ACTIVE)
+        """
+        if self.state == ACTIVE:
+            return interval
+        if self.state == IDLE and self.idle_for() < PAUSE_ANIMATIONS_AFTER:
+            return max(interval, IDLE_FRAME_INTERVAL)
+        return None
+
+    def poll_factor(self):
+        """Multiplier for background polling intervals in the current state"""
+        return POLL_SLOWDOWN[self.state]
+
+    def _on_map(self, event):
+        if event.widget is self._root:
+            self._mapped = True
+            self._update()
+
+    def _on_unmap(self, event):
+        if event.widget is self._root:
+            self._mapped = False
+            self._update()
+
+    def _on_focus_in(self, event):
+        self._focused = True
+        self._last_input = time.monotonic()
+        self._update()
+
+    def _on_focus_out(self, event):
+        self._root.after(FOCUS_SETTLE, self._check_focus)
+
+    def _check_focus(self):
+        try:
+            self._focused = self._root.focus_get() is not None
+        except (KeyError, tk.TclError):
+            self._focused = False  # Focus is in a Tk-internal popup or the window is gone
+        self._update()
+
+    def _on_input(self, event):
+        # Runs on every mouse move, so only do work when something changes
+        self._last_input = time.monotonic()
+        if self.state != ACTIVE and self._focused:
+            self._update()
+
+    def _check_idle(self):
+        self._idle_check = None
+        self._update()
+
+    def _update(self):
+        """Work out the state, notify listeners and schedule the next idle check"""
+        now = time.monotonic()
+        quiet = now - self._last_input
+
+        if not self._mapped:
+            state = HIDDEN
+        elif self._focused and quiet < IDLE_AFTER:
+            state = ACTIVE
+        else:
+            state = IDLE
+
+        if state == ACTIVE:
+            self._idle_since = None
+            if self._idle_check is None and self._root is not None:
+                # One timer per IDLE_AFTER at most, however much input arrives
+                self._idle_check = self._root.after(int((IDLE_AFTER - quiet) * 1000) + 1,
+                                                    self._check_idle)
+        elif self._idle_since is None:
+            # Idle since the last input if nobody touched it, else since now
+            self._idle_since = self._last_input + IDLE_AFTER if quiet >= IDLE_AFTER else now
+
+        if state != self.state:
+            self.state = state
+            self._notify()
+
+    def _notify(self):
+        self._prune()
+        for widget, callback in list(self._listeners):
+            try:
+                callback(self.state)
+            except Exception as e:
+                print(f"Error handling activity change: {e}")
+
+    def _prune(self):
+        """Forget listeners whose widget was destroyed"""
+        self._listeners = [(widget, callback) for widget, callback in self._listeners
+                           if _exists(widget)]
+
+
+def _exists(widget):
+    try:
+        return bool(widget.winfo_exists())
+    except tk.TclError:
+        return False
+
+
+def is_on_screen(widget):
+    """
+    Check if any part of a widget can be seen: it is mapped and not
+    clipped away by an ancestor (e.g. scrolled out of a canvas).
+
+    Args:
+        widget (tk.Widget): Widget to check
+
+    Returns:
+        bool: True if some of it is inside the visible part of the window
+    """
+    try:
+        if not widget.winfo_viewable():
+            return False
+
+        left, top = widget.winfo_rootx(), widget.winfo_rooty()
+        right, bottom = left + widget.winfo_width(), top + widget.winfo_height()
+
+        parent = widget.master
+        while parent is not None:
+            x, y = parent.winfo_rootx(), parent.winfo_rooty()
+            left, top = max(left, x), max(top, y)
+            right = min(right, x + parent.winfo_width())
+            bottom = min(bottom, y + parent.winfo_height())
+            if right <= left or bottom <= top:
+                return False
+            parent = parent.master
+        return True
+    except tk.TclError:
+        return False
+
+
+_monitor = ActivityMonitor()
+
+
+def get_activity_monitor():
+    """
+    Get the app-wide activity monitor.
+
+    Returns:
+        ActivityMonitor: Shared monitor
+    """
+    return _monitor
@@ -0,0 +1,155 @@
+# gui/utils/auto_refresh.py
+"""
+Keep the data on screen fresh without the user searching again.
+
+An AutoRefresher re-fetches one piece of displayed data on a timer, in
+the background at VISIBLE_REFRESH priority. The interval starts at the
+upstream's update cadence (or at the time the upstream says new data
+is due) and backs off while refreshes keep finding nothing new, and
+further while the window is idle. While it is minimized nothing is
+fetched; one refresh runs as soon as it is shown again. The apply
+callback decides what changed and updates the widgets in place.
+
+    refresher = AutoRefresher(self, fetch=lambda: api.refresh_weather_report(city),
+                              apply=self._apply_if_changed, interval=600)
+    refresher.start()
+"""
+import tkinter as tk
+from api.priority import VISIBLE_REFRESH, request_priority
+from gui.utils.tasks import LatestOnly
+from gui.utils.activity import HIDDEN, IDLE, get_activity_monitor
+
+# Each refresh that finds nothing new stretches the interval by this factor...
+BACKOFF_FACTOR = 1.5
+
+# ...up to this multiple of the base interval
+MAX_BACKOFF = 4
+
+# Shortest time between refreshes (seconds), whatever the upstream says
+MIN_INTERVAL = 30
+
+# The interval is stretched this much while the window is idle
+IDLE_FACTOR = 2
+
+
+class AutoRefresher:
+    """Periodically re-fetches one piece of displayed data"""
+
+    def __init__(self, widget, fetch, apply, interval, next_due=None, on_checked=None):
+        """
+        Args:
+            widget (tk.Widget): Component showing the data (refreshes stop when it is destroyed
+                                and are skipped while it is not on screen)
+            fetch (callable): Gets the current data (runs on a worker thread)
+            apply (callable): Called with fetch's result on the main thread;
+                              returns True if anything on screen changed
+            interval (float): Base seconds between refreshes (the upstream's update cadence)
+            next_due (callable): Optional; seconds until the upstream publishes new data,
+                                 or None if unknown. Used instead of the backed-off interval.
+            on_checked (callable): Optional; called on the main thread after every refresh
+        """
+        self.widget = widget
+        self.fetch = fetch
+        self.apply = apply
+        self.interval = interval
+        self.next_due = next_due
+        self.on_checked = on_checked
+
+        self.current_interval = interval
+        self._timer = None
+        self._fetches = LatestOnly(widget)
+
+        # A refresh came due while the window was hidden
+        self._overdue = False
+        get_activity_monitor().subscribe(widget, self._on_activity)
+
+    def start(self):
+        """Schedule the first refresh one interval from now"""
+        self._schedule(self._delay())
+
+    def stop(self):
+        """Cancel the scheduled refresh and drop one in flight"""
+        self._overdue = False
+        self._fetches.cancel()
+        if self._timer is not None:
+            try:
+                self.widget.after_cancel(self._timer)
+            except tk.TclError:
+                pass
+            self._timer = None
+
+    def restart(self):
+        """
+        Start over from the base interval (the data was just replaced,
+        e.g. by a new search). A refresh still in flight for the old data
+        is discarded.
+        """
+        self.stop()
+        self.current_interval = self.interval
+        self.start()
+
+    def refresh_now(self):
+        """Refresh immediately instead of waiting for the timer"""
+        self.stop()
+        self._tick()
+
+    def _tick(self):
+        self._timer = None
+        if get_activity_monitor().state == HIDDEN:
+            # Minimized - wait for the window to come back instead of polling
+            self._overdue = True
+            return
+
+        try:
+            if not self.widget.winfo_exists():
+                return
+            visible = self.widget.winfo_viewable()
+        except tk.TclError:
+            return  # Window closed
+
+        if not visible:
+            # Nobody would see it - check again later
+            self._schedule(self.current_interval)
+            return
+
+        with request_priority(VISIBLE_REFRESH):
+            self._fetches.run(self.fetch, on_done=self._done, on_error=self._failed)
+
+    def _on_activity(self, state):
+        """Catch up on a refresh skipped while the window was hidden"""
+        if state != HIDDEN and self._overdue:
+            self.refresh_now()
+
+    def _done(self, value):
+        changed = value is not None and self.apply(value)
+
+        if changed:
+            self.current_interval = self.interval
+        else:
+            self.current_interval = min(self.current_interval * BACKOFF_FACTOR,
+                                        self.interval * MAX_BACKOFF)
+
+        if self.on_checked is not None:
+            self.on_checked()
+        self._schedule(self._delay())
+
+    def _failed(self, error):
+        print(f"Automatic refresh failed: {error}")
+        if self.on_checked is not None:
+            self.on_checked()
+        self._schedule(self.current_interval)
+
+    def _delay(self):
+        """Seconds until the next refresh"""
+        due = self.next_due() if self.next_due is not None else None
+        if due is not None and due > 0:
+            return due
+        if get_activity_monitor().state == IDLE:
+            return self.current_interval * IDLE_FACTOR
+        return self.current_interval
+
+    def _schedule(self, seconds):
+        try:
+            self._timer = self.widget.after(int(max(seconds, MIN_INTERVAL) * 1000), self._tick)
+        except tk.TclError:
+            self._timer = None  # Window closed
@@ -1,6 +1,11 @@
 # gui/utils/icon_loader.py
 
 from PIL import Image, ImageTk
+from utils.imaging import render_icon
+from gui.utils.process_pool import run_in_process
+
+# (path, size, color) -> rendered RGBA data; the sidebar is rebuilt on every theme switch
+_rendered = {}
 
 
 def load_icon(path, size, color=None):
@@ -16,22 +21,52 @@ def load_icon(path, size, color=None):
     Returns:
         ImageTk.PhotoImage
     """
+    key = (path, size, color)
+    if key not in _rendered:
+        _rendered[key] = render_icon(path, size, color)
+
+    width, height, data = _rendered[key]
+    return photo_from_rgba(width, height, data)
 
-    # Load image with alpha
-    image = Image.open(path).convert("RGBA")
 
-    # Resize using high-quality resampling
-    image = image.resize((size, size), Image.LANCZOS)
+def load_icon_async(widget, path, size, color=None, on_done=None):
+    """
+    Like load_icon(), but the resizing and recoloring run in a worker
+    process so building the window doesn't wait for them. Icons rendered
+    before (e.g. when the sidebar is rebuilt for a theme switch) are
+    handed over right away.
 
-    # Optional recoloring (for white template icons)
-    if color:
-        r, g, b = tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+    Must be called from the Tk main thread; on_done runs there too.
+
+    Args:
+        widget (tk.Widget): Component the icon is for
+        path (str): Path to PNG file
+        size (int): Target width/height (square)
+        color (str|None): Optional hex color like "#ffffff"
+        on_done (callable): Called with the ImageTk.PhotoImage
+    """
+    key = (path, size, color)
+    if key in _rendered:
+        on_done(photo_from_rgba(*_rendered[key]))
+        return
 
-        pixels = image.load()
-        for y in range(image.height):
-            for x in range(image.width):
-                pr, pg, pb, pa = pixels[x, y]
-                if pa > 0:  # preserve transparency
-                    pixels[x, y] = (r, g, b, pa)
+    def finished(rendered):
+        _rendered[key] = rendered
+        on_done(photo_from_rgba(*rendered))
 
-    return ImageTk.PhotoImage(image)
\ No newline at end of file
+    def failed(error):
+        # A broken worker pool shouldn't cost us the icons
+        print(f"Rendering {path} in a worker failed ({error}) - rendering it here")
+        on_done(load_icon(path, size, color))
+
+    run_in_process(widget, render_icon, path, size, color, on_done=finished, on_error=failed)
+
+
+def photo_from_rgba(width, height, data):
+    """
+    Turn rendered RGBA data (see utils.imaging.render_icon) into a PhotoImage.
+
+    Returns:
+        ImageTk.PhotoImage
+    """
+    return ImageTk.PhotoImage(Image.frombytes("RGBA", (width, height), data))
@@ -0,0 +1,160 @@
+# gui/utils/process_pool.py
+"""
+Run CPU-heavy, pure-data jobs in worker processes.
+
+Threads do not help with CPU-bound Python code: it holds the GIL, and
+the Tk loop stalls just as if the work ran on it. Jobs submitted here
+run in a small process pool instead, and their results come back on the
+Tk main thread through the same queue as gui.utils.tasks.
+
+A job is a module-level function whose arguments and result can be
+pickled (plain data, no widgets or PhotoImages), e.g. the sidebar's
+icons (see gui.utils.icon_loader.load_icon_async):
+
+    run_in_process(self, render_icon, path, 64, "#ffffff",
+                   on_done=self._show_icon)
+
+main.py calls warm_up() on a background thread at startup: spawning a
+process and importing its modules takes a noticeable moment on Windows
+and macOS, and submitting a job would otherwise do that on the Tk thread.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+import config
+from gui.utils.tasks import get_dispatcher
+
+# Worker processes (leave a core for the Tk loop)
+MAX_PROCESSES = getattr(config, 'CPU_WORKER_PROCESSES', max(1, min(4, (os.cpu_count() or 2) - 1)))
+
+
+def _timed(fn, args, kwargs):
+    """Run a job in the worker and measure it there"""
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def _ready():
+    """Warm-up job: proves the worker is up and its imports are done"""
+    return os.getpid()
+
+
+class ProcessPool:
+    """Process pool with Tk-loop result delivery and per-job timing"""
+
+    def __init__(self, max_workers=MAX_PROCESSES):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+        # Job name -> {'count', 'failed', 'run_seconds', 'total_seconds', 'max_seconds'}
+        self._stats = {}
+
+    def run(self, widget, fn, *args, on_done=None, on_error=None, **kwargs):
+        """
+        Run fn(*args, **kwargs) in a worker process.
+
+        Must be called from the Tk main thread; on_done/on_error run there
+        too (see gui.utils.tasks.TaskDispatcher.submit).
+
+        Args:
+            widget (tk.Widget): Component the result is for
+            fn (callable): Module-level function (must be picklable)
+
+        Returns:
+            concurrent.futures.Future: The pending job
+        """
+        name = f"{fn.__module__}.{fn.__qualname__}"
+        submitted = time.perf_counter()
+        future = self._get_executor().submit(_timed, fn, args, kwargs)
+
+        def finished(outcome):
+            result, run_seconds = outcome
+            self._record(name, run_seconds, time.perf_counter() - submitted)
+            if on_done is not None:
+                on_done(result)
+
+        def failed(error):
+            self._record(name, None, time.perf_counter() - submitted)
+            if on_error is not None:
+                on_error(error)
+            else:
+                print(f"Background job {name} failed: {error}")
+
+        return get_dispatcher().watch(widget, future, on_done=finished, on_error=failed)
+
+    def warm_up(self):
+        """Start every worker process now instead of on the first jobs (blocks while they spawn)"""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_ready)
+
+    def stats(self):
+        """
+        Get timing per job.
+
+        Returns:
+            dict: Job name -> count, failed, average run time in the worker
+                  and average total time including queueing and transfer (seconds)
+        """
+        with self._lock:
+            return {
+                name: {
+                    'count': entry['count'],
+                    'failed': entry['failed'],
+                    'avg_run': entry['run_seconds'] / max(entry['count'] - entry['failed'], 1),
+                    'avg_total': entry['total_seconds'] / max(entry['count'], 1),
+                    'max_total': entry['max_seconds'],
+                }
+                for name, entry in self._stats.items()
+            }
+
+    def shutdown(self):
+        """Stop the worker processes once their current jobs finish"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def _record(self, name, run_seconds, total_seconds):
+        with self._lock:
+            entry = self._stats.setdefault(name, {'count': 0, 'failed': 0, 'run_seconds': 0.0,
+                                                  'total_seconds': 0.0, 'max_seconds': 0.0})
+            entry['count'] += 1
+            if run_seconds is None:
+                entry['failed'] += 1
+            else:
+                entry['run_seconds'] += run_seconds
+            entry['total_seconds'] += total_seconds
+            entry['max_seconds'] = max(entry['max_seconds'], total_seconds)
+
+
+_pool = ProcessPool()
+
+
+def run_in_process(widget, fn, *args, on_done=None, on_error=None, **kwargs):
+    """Run a pure-data job in a worker process. See ProcessPool.run()."""
+    return _pool.run(widget, fn, *args, on_done=on_done, on_error=on_error, **kwargs)
+
+
+def warm_up():
+    """Start the worker processes (call it from a background thread)"""
+    _pool.warm_up()
+
+
+def get_job_stats():
+    """Get timing per job. See ProcessPool.stats()."""
+    return _pool.stats()
+
+
+def shutdown():
+    """Stop the worker processes"""
+    _pool.shutdown()
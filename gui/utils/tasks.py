@@ -0,0 +1,210 @@
+# gui/utils/tasks.py
+"""
+Run slow work (API calls) off the Tk main thread.
+
+Tk widgets may only be touched from the thread running mainloop(), so
+a blocking call there freezes the whole window. run_in_background()
+hands the call to a shared thread pool; when it finishes, its result is
+put on a queue that the Tk loop drains with after(), and the callbacks
+run back on the main thread where they can update widgets.
+
+    run_in_background(self, self.api.get_forecast, city,
+                      on_done=self._show_forecast)
+
+Where a newer request makes older ones pointless (a search replacing
+the previous search), use a LatestOnly per component: starting a request
+cancels older ones that have not started yet and discards the results
+of those already running, so a slow old answer never paints over a
+newer one.
+"""
+import contextvars
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+import config
+from gui.utils.activity import get_activity_monitor
+
+# Worker threads shared by every component
+MAX_WORKERS = getattr(config, 'UI_WORKER_THREADS', 6)
+
+# Milliseconds between checks for finished work (only while work is pending;
+# longer while the window is idle or hidden, see gui.utils.activity)
+POLL_INTERVAL = 30
+
+
+class TaskDispatcher:
+    """Thread pool whose results are delivered on the Tk main thread"""
+
+    def __init__(self, max_workers=MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ui-worker")
+        self._results = queue.SimpleQueue()
+
+        # Only touched on the main thread
+        self._pending = 0
+        self._poll_id = None
+        self._root = None
+
+    def submit(self, widget, fn, *args, on_done=None, on_error=None, **kwargs):
+        """
+        Run fn(*args, **kwargs) on a worker thread.
+
+        Must be called from the Tk main thread. Callbacks are dropped if
+        the widget has been destroyed by the time the result arrives.
+
+        Args:
+            widget (tk.Widget): Component the result is for
+            fn (callable): Work to run
+            on_done (callable): Called with fn's return value
+            on_error (callable): Called with the exception fn raised (logged if None)
+
+        Returns:
+            concurrent.futures.Future: The pending work
+        """
+        # Run in a copy of the caller's context so request priority applies
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, fn, *args, **kwargs)
+        return self.watch(widget, future, on_done=on_done, on_error=on_error)
+
+    def watch(self, widget, future, on_done=None, on_error=None):
+        """
+        Deliver the outcome of a future started elsewhere (e.g., a process pool).
+
+        Must be called from the Tk main thread; callbacks work as in submit().
+
+        Returns:
+            concurrent.futures.Future: The same future
+        """
+        if self._root is None:
+            self._root = widget.winfo_toplevel()
+
+        future.add_done_callback(lambda done: self._results.put((done, widget, on_done, on_error)))
+
+        self._pending += 1
+        if self._poll_id is None:
+            self._poll_id = self._root.after(self._poll_interval(), self._drain)
+        return future
+
+    def _drain(self):
+        """Deliver finished work to its callbacks (main thread)"""
+        self._poll_id = None
+
+        while True:
+            try:
+                future, widget, on_done, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            self._pending -= 1
+            if future.cancelled() or not self._exists(widget):
+                continue
+
+            error = future.exception()
+            try:
+                if error is None:
+                    if on_done is not None:
+                        on_done(future.result())
+                elif on_error is not None:
+                    on_error(error)
+                else:
+                    print(f"Background task failed: {error}")
+            except Exception as e:
+                print(f"Error handling background result: {e}")
+
+        if self._pending > 0:
+            try:
+                self._poll_id = self._root.after(self._poll_interval(), self._drain)
+            except tk.TclError:
+                pass  # Window closed
+
+    @staticmethod
+    def _poll_interval():
+        return POLL_INTERVAL * get_activity_monitor().poll_factor()
+
+    @staticmethod
+    def _exists(widget):
+        try:
+            return bool(widget.winfo_exists())
+        except tk.TclError:
+            return False
+
+
+class LatestOnly:
+    """Background requests for one component where only the newest one counts"""
+
+    def __init__(self, widget):
+        """
+        Args:
+            widget (tk.Widget): Component the results are for
+        """
+        self.widget = widget
+        self.generation = 0
+        self._future = None
+
+    def run(self, fn, *args, on_done=None, on_error=None, **kwargs):
+        """
+        Run fn in the background, superseding every earlier request.
+
+        Returns:
+            concurrent.futures.Future: The pending work
+        """
+        self.cancel()
+        generation = self.generation
+
+        def current_only(callback):
+            def deliver(value):
+                if generation == self.generation and callback is not None:
+                    callback(value)
+            return deliver
+
+        def run_if_current():
+            # Skip the work if it was superseded while queued
+            if generation != self.generation:
+                return None
+            return fn(*args, **kwargs)
+
+        self._future = run_in_background(self.widget, run_if_current,
+                                         on_done=current_only(on_done),
+                                         on_error=current_only(on_error or _log_error))
+        return self._future
+
+    def cancel(self):
+        """
+        Supersede the pending request, if any.
+
+        Work already running finishes (its data still lands in the API
+        caches) but its result is not delivered.
+        """
+        self.generation += 1
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+
+def _log_error(error):
+    print(f"Background task failed: {error}")
+
+
+_dispatcher = None
+
+
+def get_dispatcher():
+    """
+    Get the shared dispatcher (created on first use, from the main thread).
+
+    Returns:
+        TaskDispatcher: Shared dispatcher
+    """
+    global _dispatcher
+
+    if _dispatcher is None:
+        _dispatcher = TaskDispatcher()
+    return _dispatcher
+
+
+def run_in_background(widget, fn, *args, on_done=None, on_error=None, **kwargs):
+    """
+    Run fn off the main thread and hand its result to on_done on the main thread.
+
+    See TaskDispatcher.submit().
+    """
+    return get_dispatcher().submit(widget, fn, *args, on_done=on_done, on_error=on_error, **kwargs)
@@ -5,6 +5,7 @@ Weather dashboard view with all weather components.
 """
 import tkinter as tk
 from tkinter import ttk
+import config
 from gui.styles.theme import COLORS, DIMENSIONS, FONTS
 from gui.components.search_bar import SearchBar
 from gui.components.weather_card import CurrentWeatherCard
@@ -13,13 +14,46 @@ from gui.components.popular_cities import PopularCities
 from gui.components.forecast import ForecastPanel
 from gui.components.summary_chart import SummaryChart
 from api.weather_api import WeatherAPI
+from api.models import WeatherReport
+from api.prefetch import get_prefetcher
+from gui.utils.tasks import LatestOnly
+from gui.utils.auto_refresh import AutoRefresher
+from utils.formatting import format_age
+
+# OpenWeatherMap updates its data about every 10 minutes (seconds)
+WEATHER_REFRESH_INTERVAL = getattr(config, 'WEATHER_REFRESH_INTERVAL', 600)
+
+# The map's status turns from "Live" to "Updated ... ago" after this (seconds)
+STALE_AFTER = 15 * 60
+
+
+def _changed(old, new):
+    """Check if refreshed data differs from what is on screen"""
+    if new is None:
+        return False
+    return old is None or (new is not old and new.to_dict() != old.to_dict())
+
 
 class WeatherDashboard(tk.Frame):
-    def __init__(self, parent):
+    def __init__(self, parent, on_alerts=None):
+        """
+        Args:
+            parent (tk.Widget): Container
+            on_alerts (callable): Called with (Observation, official alerts) for the
+                                  city on screen, e.g. AlertBanner.check_weather_alerts
+        """
         super().__init__(parent, bg=COLORS['bg_primary'])
         
+        self.on_alerts = on_alerts
         self.api = WeatherAPI()
         self.current_city = "London"
+        self._searches = LatestOnly(self)  # A new search supersedes the previous one
+        
+        # What is on screen, kept up to date by the refresher
+        self._shown = None
+        self._refresher = AutoRefresher(self, self._fetch_refresh, self._apply_refresh,
+                                        interval=WEATHER_REFRESH_INTERVAL,
+                                        on_checked=self._update_status)
         
         self._create_layout()
         
@@ -27,27 +61,94 @@ class WeatherDashboard(tk.Frame):
         self.after(50, self._initial_load)
     
     def _initial_load(self):
-        """Load initial weather data"""
-        try:
-            weather_data = self.api.get_current_weather(self.current_city)
+        """Load initial weather data (the card and forecast load their own)"""
+        self._searches.run(self._fetch_city, self.current_city,
+                           on_done=self._show_initial,
+                           on_error=lambda e: print(f"Initial load error: {e}"))
+    
+    def _fetch_city(self, city):
+        """
+        Fetch everything the dashboard shows for a city (worker thread).
+        
+        Returns:
+            tuple: (WeatherReport or None, Location or None, last error)
+        """
+        report = self.api.get_weather_report(city)
+        error = self.api.last_error
+        
+        # The weather lookup already located the city
+        location = self.api.get_location(city) if report and report.current else None
+        return report, location, error
+    
+    def _show_initial(self, result):
+        """Apply the initial load to the alert banner, map and chart"""
+        report, location, error = result
+        
+        if report and report.current:
+            # Update alert banner
+            self._show_alerts(report.current, report.active_alerts())
             
-            if weather_data:
-                # Update alert banner
-                if hasattr(self.master.master, 'alert_banner'):
-                    self.master.master.alert_banner.check_weather_alerts(weather_data)
-                
-                # Update map
-                if weather_data.get('coord') and hasattr(self, 'map'):
-                    lat = weather_data['coord']['lat']
-                    lon = weather_data['coord']['lon']
-                    self.map.update_location(self.current_city, lat, lon)
-                
-                # Update chart
-                forecast_data = self.api.get_forecast(self.current_city)
-                if forecast_data and hasattr(self, 'chart'):
-                    self.chart.update_chart(forecast_data)
-        except Exception as e:
-            print(f"Initial load error: {e}")
+            # Update map
+            if location and hasattr(self, 'map'):
+                self.map.update_location(self.current_city, location.lat, location.lon)
+        
+        # Update chart
+        if report and report.forecast and hasattr(self, 'chart'):
+            self.chart.update_chart(report.forecast)
+        
+        self._shown = report
+        self._refresher.restart()
+        self._update_status()
+    
+    def _fetch_refresh(self):
+        """Revalidate the city on screen (worker thread)"""
+        city = self.current_city
+        return city, self.api.refresh_weather_report(city)
+    
+    def _apply_refresh(self, result):
+        """
+        Update the components whose data changed.
+        
+        Returns:
+            bool: True if anything on screen changed
+        """
+        city, report = result
+        if city != self.current_city or report is None:
+            return False
+        
+        shown = self._shown
+        current = report.current if report.current is not None else (shown and shown.current)
+        forecast = report.forecast if report.forecast is not None else (shown and shown.forecast)
+        changed = False
+        
+        if _changed(shown and shown.current, report.current) or \
+                (shown is not None and report.alerts != shown.alerts):
+            self.weather_card.update_weather(city, report.current or current)
+            self._show_alerts(current, report.active_alerts())
+            changed = True
+        
+        if _changed(shown and shown.forecast, report.forecast):
+            self.forecast.update_forecast(city, report.forecast)
+            self.chart.update_chart(report.forecast)
+            changed = True
+        
+        self._shown = WeatherReport(current, forecast, report.alerts)
+        return changed
+    
+    def _show_alerts(self, weather_data, official_alerts):
+        """Hand the city's conditions and official alerts to the alert banner"""
+        if self.on_alerts is not None:
+            self.on_alerts(weather_data, official_alerts)
+    
+    def _update_status(self):
+        """Show in the map header how fresh the data on screen is"""
+        age = self.api.get_data_age(self.current_city)
+        if self.api.is_offline():
+            self.map.set_status("● Offline", '#E53E3E')
+        elif age is not None and age > STALE_AFTER:
+            self.map.set_status(f"● Updated {format_age(age)}", '#DD6B20')
+        else:
+            self.map.set_status("● Live")
     
     def _create_layout(self):
         """Create the weather dashboard layout WITH MOUSEWHEEL SCROLLING!"""
@@ -121,38 +222,70 @@ class WeatherDashboard(tk.Frame):
         self.forecast = ForecastPanel(right_col, city="London")
         self.forecast.pack(fill="both", expand=True)
     
-    def on_search(self, city):
-        """Called when user searches for a city"""
+    def on_search(self, city, location=None):
+        """
+        Called when user searches for a city.
+        
+        Args:
+            city (str): City name as searched
+            location (Location): Where it is, when picked from the suggestions
+                                 (weather is then fetched by ID, with no name lookup)
+        """
         print(f"Updating weather for: {city}")
         
         self.current_city = city
+        if location is not None:
+            self.api.locations.put(city, location)
+        get_prefetcher().record_open(city)  # Learn what gets opened (and score the prefetch)
+        
+        # Show loading states right away, fetch in the background
+        self.weather_card.show_loading(city)
+        self.forecast.show_loading(city)
+        self.search_bar.set_busy(True)
         
-        # Update components
+        # Fetch everything once (a single request in One Call mode).
+        # Results of an older search still in flight are dropped.
+        self._searches.run(self._fetch_city, city,
+                           on_done=lambda result: self._show_search(city, *result),
+                           on_error=self._search_failed)
+    
+    def _search_failed(self, error):
+        """The newest search raised instead of returning data"""
+        print(f"Search error: {error}")
+        self.search_bar.set_busy(False)
+        self.weather_card.show_error(None, self.current_city)
+        self.forecast.show_error(self.current_city)
+    
+    def _show_search(self, city, report, location, error):
+        """Apply a finished search to every component"""
+        self.search_bar.set_busy(False)
+        self._shown = report
+        self._refresher.restart()
+        self._update_status()
         try:
+            weather_data = report.current if report else None
+            forecast_data = report.forecast if report else None
+            
             # Update the weather card
-            self.weather_card.update_weather(city)
+            if weather_data:
+                self.weather_card.update_weather(city, weather_data)
+            else:
+                self.weather_card.show_error(error, city)
             
             # Update the forecast
-            self.forecast.update_forecast(city)
-            
-            # Get weather data for alerts and map
-            weather_data = self.api.get_current_weather(city)
+            if forecast_data:
+                self.forecast.update_forecast(city, forecast_data)
+                self.chart.update_chart(forecast_data)
+            else:
+                self.forecast.show_error(city)
             
             if weather_data:
                 # Update alert banner
-                if hasattr(self.master.master, 'alert_banner'):
-                    self.master.master.alert_banner.check_weather_alerts(weather_data)
+                self._show_alerts(weather_data, report.active_alerts())
                 
                 # Update map
-                if weather_data.get('coord'):
-                    lat = weather_data['coord']['lat']
-                    lon = weather_data['coord']['lon']
-                    self.map.update_location(city, lat, lon)
-                
-                # Update chart
-                forecast_data = self.api.get_forecast(city)
-                if forecast_data:
-                    self.chart.update_chart(forecast_data)
+                if location:
+                    self.map.update_location(city, location.lat, location.lon)
         except Exception as e:
             print(f"Search error: {e}")
     
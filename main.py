@@ -2,13 +2,32 @@
 """
 Entry point for the Weather Dashboard application.
 """
+import multiprocessing
+import threading
 import tkinter as tk
 from gui.main_gui import WeatherApp
+from api.http_session import warm_connections
+from api.persistent_cache import get_persistent_cache
+from gui.utils import process_pool
 
 def main():
+    # Open API connections while the window is being built
+    warm_connections()
+    
+    # Trim the offline cache without delaying startup
+    threading.Thread(target=get_persistent_cache().compact, daemon=True).start()
+    
+    # Start the CPU worker processes (the sidebar icons are rendered there) while the window is built
+    threading.Thread(target=process_pool.warm_up, daemon=True).start()
+    
     root = tk.Tk()
     app = WeatherApp(root)
-    root.mainloop()
+    
+    try:
+        root.mainloop()
+    finally:
+        process_pool.shutdown()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Worker processes in the packaged app
     main()
\ No newline at end of file
@@ -0,0 +1,84 @@
+# scripts/build_city_index.py
+"""
+Build the offline city index used for search suggestions.
+
+Input is OpenWeatherMap's city list (city.list.json.gz from
+https://bulk.openweathermap.org/sample/). OWM city IDs are GeoNames IDs,
+so a GeoNames dump with populations (e.g. cities500.txt or
+allCountries.txt from https://download.geonames.org/export/dump/) can be
+given to rank big cities first; without it suggestions are alphabetical.
+
+Run from the project root:
+    python scripts/build_city_index.py city.list.json.gz --population cities500.txt
+"""
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import gzip
+import json
+import time
+from api.city_index import CITY_INDEX_FILE, CityIndex, build_index
+
+# Columns of a GeoNames dump line
+GEONAMES_ID = 0
+GEONAMES_POPULATION = 14
+
+
+def open_text(path):
+    """Open a plain or gzipped text file"""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def load_populations(path):
+    """GeoNames ID -> population"""
+    populations = {}
+    with open_text(path) as f:
+        for line in f:
+            columns = line.rstrip('\n').split('\t')
+            if len(columns) > GEONAMES_POPULATION and columns[GEONAMES_POPULATION].isdigit():
+                populations[int(columns[GEONAMES_ID])] = int(columns[GEONAMES_POPULATION])
+    return populations
+
+
+def load_cities(path, populations):
+    """Cities from an OWM city list, as build_index() expects them"""
+    with open_text(path) as f:
+        for city in json.load(f):
+            yield {
+                'id': city['id'],
+                'name': city['name'],
+                'state': city.get('state', ''),
+                'country': city.get('country', ''),
+                'lat': city['coord']['lat'],
+                'lon': city['coord']['lon'],
+                'population': populations.get(city['id'], 0),
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('city_list', help="OWM city.list.json (optionally .gz)")
+    parser.add_argument('--population', help="GeoNames dump with populations (optionally .gz)")
+    parser.add_argument('--output', default=CITY_INDEX_FILE, help=f"Index file (default {CITY_INDEX_FILE})")
+    args = parser.parse_args()
+
+    populations = load_populations(args.population) if args.population else {}
+    count = build_index(load_cities(args.city_list, populations), args.output)
+    print(f"{count} cities -> {args.output} ({os.path.getsize(args.output) / 1024 / 1024:.1f} MB)")
+
+    # Quick check that the file works and is fast
+    index = CityIndex(args.output)
+    for query in ("lon", "new y", "sao pau", "londn", "frankfrut"):
+        started = time.perf_counter()
+        suggestions = index.suggest(query)
+        elapsed = (time.perf_counter() - started) * 1000
+        labels = ", ".join(suggestion.label for suggestion in suggestions[:3])
+        print(f"  {query!r:12} {elapsed:6.2f} ms  {labels}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,8 @@ def test_weather_api():
     weather = api.get_current_weather("London")
     
     if weather:
-        print(f"✅ Success! Temperature in London: {weather['main']['temp']}°C")
-        print(f"   Condition: {weather['weather'][0]['description']}")
+        print(f"✅ Success! Temperature in London: {weather.temp}°C")
+        print(f"   Condition: {weather.description}")
     else:
         print("❌ Failed to fetch weather")
     
@@ -20,7 +20,7 @@ def test_weather_api():
     forecast = api.get_forecast("New York")
     
     if forecast:
-        print(f"✅ Success! Got {len(forecast['list'])} forecast entries")
+        print(f"✅ Success! Got {len(forecast)} forecast entries")
     else:
         print("❌ Failed to fetch forecast")
 
@@ -0,0 +1,55 @@
+# test_cache.py
+"""Test the in-memory response cache"""
+import time
+from api.cache import ResponseCache, normalize_city
+
+def test_normalize_city():
+    assert normalize_city("  new  york") == normalize_city("New York")
+    assert normalize_city("London, GB") == normalize_city("london,gb")
+    print("✅ City names normalize to one key")
+
+def test_ttl_and_stale():
+    cache = ResponseCache(ttl=60, stale_ttl=60)
+
+    cache.put(("weather", "london"), "fresh", 10)
+    assert cache.get(("weather", "london")).is_fresh()
+
+    # Expired but within the stale window - served, marked stale
+    cache.put(("weather", "paris"), "stale", 10, fetched_at=time.time() - 90)
+    entry = cache.get(("weather", "paris"))
+    assert entry.value == "stale" and not entry.is_fresh()
+
+    # Past the stale window - gone
+    cache.put(("weather", "rome"), "old", 10, fetched_at=time.time() - 150)
+    assert cache.get(("weather", "rome")) is None
+    assert cache.stats()['entries'] == 2
+    print("✅ Entries are fresh, then stale, then dropped")
+
+def test_negative_entries():
+    cache = ResponseCache(negative_ttl=60)
+    cache.put_negative(("weather", "atlantis"))
+    entry = cache.get(("weather", "atlantis"))
+    assert entry.negative and entry.value is None
+    print("✅ Unknown cities are remembered")
+
+def test_lru_budget():
+    cache = ResponseCache(max_bytes=100)
+    cache.put("a", 1, 40)
+    cache.put("b", 2, 40)
+    cache.get("a")          # "b" is now the least recently used
+    cache.put("c", 3, 40)
+
+    assert cache.peek("b") is None
+    assert cache.peek("a") is not None and cache.peek("c") is not None
+    assert cache.stats()['bytes'] == 80
+
+    # Replacing an entry doesn't count its old size twice
+    cache.put("a", 1, 10)
+    assert cache.stats()['bytes'] == 50
+    print("✅ Least recently used entries are evicted over budget")
+
+if __name__ == "__main__":
+    test_normalize_city()
+    test_ttl_and_stale()
+    test_negative_entries()
+    test_lru_budget()
@@ -0,0 +1,92 @@
+# test_city_index.py
+"""Test the offline city index"""
+import os
+import tempfile
+from api.city_index import CityIndex, build_index, fold
+
+CITIES = [
+    {'id': 1, 'name': "London", 'country': "GB", 'lat': 51.5085, 'lon': -0.1257, 'population': 8961989},
+    {'id': 2, 'name': "London", 'state': "OH", 'country': "US", 'lat': 39.8865, 'lon': -83.4483, 'population': 10060},
+    {'id': 3, 'name': "Londonderry", 'country': "GB", 'lat': 54.9977, 'lon': -7.3087, 'population': 83652},
+    {'id': 4, 'name': "São Paulo", 'country': "BR", 'lat': -23.5475, 'lon': -46.6361, 'population': 10021295},
+    {'id': 5, 'name': "Springfield", 'state': "IL", 'country': "US", 'lat': 39.8017, 'lon': -89.6437},
+    {'id': 6, 'name': "Springfield", 'state': "MO", 'country': "US", 'lat': 37.2153, 'lon': -93.2982},
+    {'id': 7, 'name': "Frankfurt am Main", 'country': "DE", 'lat': 50.1155, 'lon': 8.6842, 'population': 650000},
+]
+
+def _with_index(test):
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "cities.idx")
+        assert build_index(CITIES, path) == len(CITIES)
+        index = CityIndex(path)
+        try:
+            test(index)
+        finally:
+            index.close()
+
+def test_fold():
+    assert fold("  São  Paulo") == fold("sao paulo") == "sao paulo"
+    print("✅ Names fold to one key")
+
+def test_suggest():
+    def check(index):
+        # Largest first...
+        labels = [suggestion.label for suggestion in index.suggest("lon")]
+        assert labels == ["London, GB", "Londonderry, GB", "London, OH, US"]
+
+        # ...but exact names before longer ones
+        labels = [suggestion.label for suggestion in index.suggest("london")]
+        assert labels == ["London, GB", "London, OH, US", "Londonderry, GB"]
+
+        # Accents don't matter either way
+        assert index.suggest("sao pau")[0].label == "São Paulo, BR"
+        assert index.suggest("SÃO")[0].location.id == 4
+
+        # ", cc" keeps only that country
+        assert [s.location.id for s in index.suggest("london, us")] == [2]
+        assert index.suggest("london, fr") == []
+
+        # Typos fall back to similar names
+        assert index.suggest("frankfrut am main")[0].location.id == 7
+        assert index.suggest("") == []
+    _with_index(check)
+    print("✅ Suggestions by prefix, accent folding, country and typo")
+
+def test_find():
+    def check(index):
+        # Population tells the two Londons apart
+        assert index.find("london").id == 1
+        assert index.find("London, US").id == 2
+        assert index.find("Sao Paulo").id == 4
+
+        # Not an exact name
+        assert index.find("Londo") is None
+        assert index.find("Atlantis") is None
+
+        # Same name and no population - left to the upstream lookup
+        assert index.find("Springfield") is None
+    _with_index(check)
+    print("✅ Exact lookups only when the city is unambiguous")
+
+def test_long_names():
+    # 130 two-byte characters - more than a record can hold
+    name = "Ж" * 130
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "cities.idx")
+        build_index(CITIES + [{'id': 8, 'name': name, 'country': "RU", 'lat': 55.75, 'lon': 37.62}], path)
+        index = CityIndex(path)
+        try:
+            # Cut on a character boundary, so the record still decodes
+            suggestion = index.suggest("жжж")[0]
+            assert suggestion.location.id == 8
+            assert suggestion.location.name == "Ж" * 127
+            assert index.suggest("жжжж, ru")[0].location.id == 8
+        finally:
+            index.close()
+    print("✅ Long non-ASCII names are truncated cleanly")
+
+if __name__ == "__main__":
+    test_fold()
+    test_suggest()
+    test_find()
+    test_long_names()
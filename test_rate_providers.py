@@ -0,0 +1,55 @@
+# test_rate_providers.py
+"""Test reading reference rates from a file"""
+import os
+import tempfile
+from api.rate_providers import FileRateProvider
+
+ENVELOPE = """<?xml version="1.0" encoding="UTF-8"?>
+<gesmes:Envelope xmlns:gesmes="http://www.gesmes.org/xml/2002-08-01"
+                 xmlns="http://www.ecb.int/vocabulary/2002-08-01/eurofxref">
+    <Cube>{days}</Cube>
+</gesmes:Envelope>"""
+
+def _load(text, name):
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return FileRateProvider(path).get_table()
+
+def test_xml_bad_rates():
+    table = _load(ENVELOPE.format(days="""
+        <Cube time="2026-10-16">
+            <Cube currency="USD" rate="1.0850"/>
+            <Cube currency="JPY"/>
+            <Cube currency="GBP" rate="n/a"/>
+            <Cube currency="CHF" rate="0"/>
+        </Cube>"""), "eurofxref-daily.xml")
+
+    # Entries without a usable rate are skipped, the rest still load
+    assert table.rate("EUR", "USD") == 1.085
+    assert table.codes == ["EUR", "USD"]
+    print("✅ Missing and malformed XML rates are skipped")
+
+def test_xml_history():
+    table = _load(ENVELOPE.format(days="""
+        <Cube time="2026-10-16"><Cube currency="USD" rate="1.0850"/></Cube>
+        <Cube time="2026-10-15"><Cube currency="USD" rate="1.0700"/><Cube currency="SEK" rate="11.2"/></Cube>
+        """), "eurofxref-hist.xml")
+
+    # Only the latest day counts
+    assert table.rate("EUR", "USD") == 1.085
+    assert "SEK" not in table
+    print("✅ Multi-day XML files use the latest day")
+
+def test_csv():
+    table = _load("Date, USD, JPY, \n16 October 2026, 1.0850, N/A, \n15 October 2026, 1.0700, 161.2, \n",
+                  "eurofxref-hist.csv")
+    assert table.rate("EUR", "USD") == 1.085
+    assert "JPY" not in table
+    print("✅ Wide CSV files use the latest day")
+
+if __name__ == "__main__":
+    test_xml_bad_rates()
+    test_xml_history()
+    test_csv()
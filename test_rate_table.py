@@ -0,0 +1,40 @@
+# test_rate_table.py
+"""Test the cross-rate table"""
+import time
+from api.rate_table import RateTable
+
+RATES = {"USD": 1.0, "EUR": 0.8, "GBP": 0.5, "XXX": 0}
+
+def test_cross_rates():
+    table = RateTable("USD", RATES)
+
+    assert table.rate("USD", "EUR") == 0.8
+    assert table.rate("EUR", "USD") == 1.25
+    assert table.rate("EUR", "GBP") == 0.625
+    assert table.rate("GBP", "GBP") == 1.0
+
+    # Zero rates are left out, unknown codes give None
+    assert "XXX" not in table and "EUR" in table
+    assert table.rate("USD", "XXX") is None
+    assert table.rate("ABC", "USD") is None
+    print("✅ Any pair converts through the base")
+
+def test_expiry():
+    now = time.time()
+
+    # Without a publish time the TTL decides
+    table = RateTable("USD", RATES, ttl=60, fetched_at=now - 120)
+    assert not table.is_fresh()
+    table.renew()
+    assert table.is_fresh()
+
+    # The provider's next update wins over the TTL while it is ahead
+    table = RateTable("USD", RATES, ttl=60, fetched_at=now, next_update=now + 3600)
+    assert table.expires_at == now + 3600
+    table = RateTable("USD", RATES, ttl=60, fetched_at=now, next_update=now - 10)
+    assert table.expires_at == now + 60
+    print("✅ Tables expire at the provider's next update or after the TTL")
+
+if __name__ == "__main__":
+    test_cross_rates()
+    test_expiry()
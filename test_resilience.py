@@ -0,0 +1,94 @@
+# test_resilience.py
+"""Test the circuit breaker and retry helpers"""
+import time
+from api import resilience
+from api.resilience import CircuitBreaker, call_with_retry, CLOSED, OPEN, HALF_OPEN
+from api.errors import CircuitOpenError, NetworkError, NotFoundError
+
+def test_circuit_breaker():
+    breaker = CircuitBreaker("Test", failure_threshold=2, reset_timeout=30)
+
+    # Failures below the threshold leave it closed
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    # Reaching the threshold opens it and calls are refused
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.is_open()
+    try:
+        breaker.before_call()
+        assert False, "open circuit let a call through"
+    except CircuitOpenError:
+        pass
+
+    # After the cool-down exactly one probe goes through
+    breaker.opened_at = time.monotonic() - 31
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    try:
+        breaker.before_call()
+        assert False, "second probe let through"
+    except CircuitOpenError:
+        pass
+
+    # A cancelled probe frees the slot for another one
+    breaker.cancel_call()
+    breaker.before_call()
+
+    # A successful probe closes the circuit
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.failures == 0
+    print("✅ Circuit breaker opens, probes and closes")
+
+def test_call_with_retry():
+    original_delay = resilience.backoff_delay
+    resilience.backoff_delay = lambda *args: 0
+    try:
+        # Transient errors are retried until the call succeeds
+        calls = []
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise NetworkError("down")
+            return "ok"
+        assert call_with_retry(flaky, attempts=3) == "ok"
+        assert len(calls) == 3
+
+        # The last error comes through once attempts run out
+        calls.clear()
+        def failing():
+            calls.append(1)
+            raise NetworkError("down")
+        try:
+            call_with_retry(failing, attempts=2)
+            assert False, "error swallowed"
+        except NetworkError:
+            pass
+        assert len(calls) == 2
+
+        # Non-retryable errors are raised straight away
+        calls.clear()
+        def missing():
+            calls.append(1)
+            raise NotFoundError("nope")
+        try:
+            call_with_retry(missing, attempts=3)
+            assert False, "error swallowed"
+        except NotFoundError:
+            pass
+        assert len(calls) == 1
+    finally:
+        resilience.backoff_delay = original_delay
+    print("✅ Retries stop on success, exhaustion or a permanent error")
+
+def test_backoff_delay():
+    for attempt in range(1, 8):
+        assert 0 <= resilience.backoff_delay(attempt, base=0.5, cap=4.0) <= 4.0
+    print("✅ Backoff stays within the cap")
+
+if __name__ == "__main__":
+    test_circuit_breaker()
+    test_call_with_retry()
+    test_backoff_delay()
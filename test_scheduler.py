@@ -0,0 +1,63 @@
+# test_scheduler.py
+"""Test the request scheduler"""
+import threading
+import time
+from api.scheduler import RequestScheduler
+from api.priority import INTERACTIVE, VISIBLE_REFRESH, PREFETCH
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+def test_class_limits():
+    scheduler = RequestScheduler(slots=3, limits={INTERACTIVE: 3, VISIBLE_REFRESH: 2, PREFETCH: 1})
+
+    # Background work can never take every slot...
+    scheduler.acquire(PREFETCH)
+    scheduler.acquire(VISIBLE_REFRESH)
+
+    blocked = threading.Thread(target=scheduler.acquire, args=(PREFETCH,), daemon=True)
+    blocked.start()
+    _wait_for(lambda: scheduler.stats()[PREFETCH]['waiting'] == 1)
+
+    # ...so an interactive request still starts straight away
+    scheduler.acquire(INTERACTIVE)
+    assert scheduler.stats()[INTERACTIVE]['running'] == 1
+
+    # The waiting prefetch gets in once the first one is done
+    scheduler.release(PREFETCH)
+    blocked.join(2.0)
+    assert not blocked.is_alive()
+    print("✅ Background classes leave room for interactive requests")
+
+def test_priority_order():
+    scheduler = RequestScheduler(slots=1)
+    scheduler.acquire(INTERACTIVE)
+
+    order = []
+    def wait(priority):
+        scheduler.acquire(priority)
+        order.append(priority)
+        scheduler.release(priority)
+
+    # Queued lowest priority first, served highest priority first
+    threads = []
+    for priority in (PREFETCH, VISIBLE_REFRESH, INTERACTIVE):
+        thread = threading.Thread(target=wait, args=(priority,), daemon=True)
+        thread.start()
+        threads.append(thread)
+        _wait_for(lambda: scheduler.stats()[priority]['waiting'] == 1)
+
+    scheduler.release(INTERACTIVE)
+    for thread in threads:
+        thread.join(2.0)
+
+    assert order == [INTERACTIVE, VISIBLE_REFRESH, PREFETCH]
+    assert scheduler.is_idle()
+    print("✅ Free slots go to the highest priority first")
+
+if __name__ == "__main__":
+    test_class_limits()
+    test_priority_order()
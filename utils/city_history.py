@@ -0,0 +1,96 @@
+# utils/city_history.py
+"""
+City history utility.
+Remembers which cities the user opens, how often and at what time of day.
+"""
+import json
+import os
+import time
+
+HISTORY_FILE = "city_history.json"
+
+# An open counts half as much after this many days
+HALF_LIFE_DAYS = 14
+
+# Cities kept in the history (the least used are dropped first)
+MAX_CITIES = 100
+
+def history_key(city):
+    """History key for a city name ("  new  york" and "New York" match)"""
+    return " ".join(city.split()).casefold()
+
+def load_history():
+    """
+    Load the city history from file.
+    
+    Returns:
+        dict: City key -> {'name', 'weight', 'updated', 'last_opened', 'hours'}
+    """
+    if os.path.exists(HISTORY_FILE):
+        try:
+            with open(HISTORY_FILE, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+    return {}
+
+def save_history(history):
+    """
+    Save the city history to file.
+    
+    Args:
+        history (dict): History as returned by load_history()
+    """
+    try:
+        with open(HISTORY_FILE, 'w') as f:
+            json.dump(history, f, indent=2)
+    except Exception as e:
+        print(f"Error saving city history: {e}")
+
+def decayed_weight(entry, now=None):
+    """
+    How much a city has been used, with older opens counting less.
+    
+    Args:
+        entry (dict): One city's history entry
+        now (float): Timestamp to decay to (defaults to now)
+        
+    Returns:
+        float: Number of opens, each halved every HALF_LIFE_DAYS
+    """
+    now = now or time.time()
+    age_days = max(now - entry['updated'], 0) / 86400
+    return entry['weight'] * 0.5 ** (age_days / HALF_LIFE_DAYS)
+
+def record_city_open(city, now=None):
+    """
+    Count one open of a city (a search or a favorite click).
+    
+    Args:
+        city (str): City name as shown to the user
+        now (float): Timestamp of the open (defaults to now)
+    """
+    now = now or time.time()
+    history = load_history()
+    
+    entry = history.get(history_key(city))
+    if entry is None:
+        entry = {'name': " ".join(city.split()), 'weight': 0.0, 'updated': now,
+                 'last_opened': now, 'hours': [0] * 24}
+    
+    entry['weight'] = decayed_weight(entry, now) + 1
+    entry['updated'] = now
+    entry['last_opened'] = now
+    entry['hours'][time.localtime(now).tm_hour] += 1
+    history[history_key(city)] = entry
+    
+    if len(history) > MAX_CITIES:
+        least_used = sorted(history, key=lambda key: decayed_weight(history[key], now))
+        for key in least_used[:len(history) - MAX_CITIES]:
+            del history[key]
+    
+    save_history(history)
+
+def clear_history():
+    """Forget every city opened so far."""
+    save_history({})
@@ -0,0 +1,38 @@
+# utils/formatting.py
+"""
+Small text formatting helpers shared by the GUI.
+"""
+
+def format_age(seconds):
+    """
+    Describe how old a piece of data is.
+    
+    Args:
+        seconds (float): Age in seconds
+        
+    Returns:
+        str: Human readable age (e.g., "5 min ago", "3 h ago")
+    """
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)} h ago"
+    return f"{int(seconds // 86400)} d ago"
+
+def format_bytes(size):
+    """
+    Format a byte count.
+    
+    Args:
+        size (int): Size in bytes
+        
+    Returns:
+        str: Human readable size (e.g., "12.3 KB")
+    """
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
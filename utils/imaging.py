@@ -0,0 +1,37 @@
+# utils/imaging.py
+"""
+Image work that needs no Tk - safe to run in a worker process.
+"""
+from PIL import Image
+
+
+def render_icon(path, size, color=None):
+    """
+    Load a PNG icon, resize it and optionally recolor it.
+
+    Recoloring keeps the icon's alpha channel and fills every visible
+    pixel with the color, done by PIL in C rather than pixel by pixel.
+
+    Args:
+        path (str): Path to PNG file
+        size (int): Target width/height (square)
+        color (str): Optional hex color like "#ffffff"
+
+    Returns:
+        tuple: (width, height, RGBA bytes) - plain data, so it can be
+               returned from another process
+    """
+    # Load image with alpha
+    image = Image.open(path).convert("RGBA")
+
+    # Resize using high-quality resampling
+    image = image.resize((size, size), Image.LANCZOS)
+
+    # Optional recoloring (for white template icons)
+    if color:
+        rgb = tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+        alpha = image.getchannel("A")
+        image = Image.new("RGBA", image.size, rgb + (0,))
+        image.putalpha(alpha)
+
+    return image.width, image.height, image.tobytes()
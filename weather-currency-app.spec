@@ -10,6 +10,7 @@ a = Analysis(
     datas=[
         ('gui', 'gui'),
         ('api', 'api'),
+        ('assets', 'assets'),  # Icons and the offline city index (assets/cities.idx)
     ],
     hiddenimports=[
         'tkinter',
@@ -29,6 +30,31 @@ a = Analysis(
         'gui.map_gui',
         'api.weather_api',
         'api.currency_api',
+        'api.http_session',
+        'api.cache',
+        'api.singleflight',
+        'api.rate_table',
+        'api.persistent_cache',
+        'api.async_api',
+        'api.priority',
+        'api.rate_limiter',
+        'api.errors',
+        'api.resilience',
+        'api.transport',
+        'api.geocoding',
+        'api.models',
+        'api.json_codec',
+        'api.weather_providers',
+        'api.rate_providers',
+        'api.scheduler',
+        'api.city_index',
+        'api.prefetch',
+        'gui.utils.tasks',
+        'gui.utils.activity',
+        'gui.utils.auto_refresh',
+        'gui.utils.process_pool',
+        'utils.imaging',
+        'utils.city_history',
     ],
     hookspath=[],
     hooksconfig={},